@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the simulation hot paths"""
+
+import sys
+import time
+import random
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils.config import MISSILE_TYPES  # noqa: E402
+from src.game_logic.missile import (  # noqa: E402
+    Missile, MissileManager, MissilePool, TRAJECTORY_CACHE, create_missile_types_from_config
+)
+from src.game_logic.target import Target, TargetManager, create_targets_from_config  # noqa: E402
+from src.game_engine import Player, GameEngine, GameMode, GameState  # noqa: E402
+from src.utils.world_generator import generate_world  # noqa: E402
+
+
+def timed(func, *args, repeat: int = 3) -> float:
+    """Best wall-clock time of several runs, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_salvo(manager: MissileManager, count: int, seed: int = 42):
+    """Launch a large salvo of long-range missiles"""
+    rng = random.Random(seed)
+    missile_types = create_missile_types_from_config(MISSILE_TYPES)
+    icbm = missile_types['ICBM']
+    for _ in range(count):
+        origin = (rng.randint(0, 2000), rng.randint(0, 1000))
+        target = (rng.randint(0, 2000), rng.randint(0, 1000))
+        missile = manager.create_missile(icbm, origin, target, "USA")
+        if missile:
+            manager.launch_missile(missile)
+
+
+def bench_update_missiles(count: int = 20000, ticks: int = 20):
+    """Per-tick cost of MissileManager.update_missiles, idle and while missiles land"""
+    print(f"update_missiles ({count:,} missiles in flight: {ticks} idle ticks / flown to impact)")
+    for label, vectorized in (("objects", False), ("fleet", True)):
+        manager = MissileManager(vectorized=vectorized)
+        build_salvo(manager, count)
+        idle = timed(lambda: [manager.update_missiles(0.1) for _ in range(ticks)], repeat=1)
+
+        flown = 0
+        start = time.perf_counter()
+        while manager.get_statistics()['in_flight']:
+            manager.update_missiles(1.0)
+            flown += 1
+        elapsed = time.perf_counter() - start
+        assert manager.get_statistics()['detonated'] == count
+        print(f"   {label:8s} {idle / ticks * 1000:8.2f} ms/tick   "
+              f"{elapsed / flown * 1000:8.2f} ms/tick over {flown} ticks")
+
+
+def bench_create_missile(count: int = 5000):
+    """Construction cost of long-range missiles"""
+    print(f"create_missile ({count:,} long-range ICBMs)")
+    for label, analytic in (("eager", False), ("analytic", True)):
+        elapsed = timed(lambda: build_salvo(MissileManager(analytic_trajectories=analytic), count),
+                        repeat=1)
+        print(f"   {label:8s} {elapsed / count * 1e6:8.2f} us/missile")
+
+
+def bench_repeated_salvo(count: int = 5000):
+    """Repeated launches from one silo at the same assets"""
+    print(f"create_missile ({count:,} launches, same silo, 5 targets)")
+    icbm = create_missile_types_from_config(MISSILE_TYPES)['ICBM']
+    targets = [(1500 + i * 10, 400) for i in range(5)]
+
+    def salvo():
+        manager = MissileManager()
+        for i in range(count):
+            manager.create_missile(icbm, (10, 10), targets[i % 5], "USSR")
+
+    for label, maxsize in (("uncached", 0), ("cached", 4096)):
+        TRAJECTORY_CACHE.clear()
+        TRAJECTORY_CACHE.maxsize = maxsize
+        elapsed = timed(salvo, repeat=1)
+        print(f"   {label:8s} {elapsed / count * 1e6:8.2f} us/missile")
+
+
+def bench_near_position(count: int = 20000, sites: int = 200):
+    """Proximity queries from many defense sites in one tick"""
+    print(f"get_missiles_near_position ({count:,} in flight, {sites} sites)")
+    rng = random.Random(7)
+    queries = [(rng.randint(0, 2000), rng.randint(0, 1000)) for _ in range(sites)]
+    for label, vectorized in (("objects", False), ("fleet", True)):
+        manager = MissileManager(vectorized=vectorized)
+        build_salvo(manager, count)
+        manager.update_missiles(1.0)
+        manager.get_active_missiles()  # Position sync happens once per tick
+        elapsed = timed(lambda: [manager.get_missiles_near_position(pos, 25) for pos in queries])
+        print(f"   {label:8s} {elapsed / sites * 1e6:8.2f} us/query")
+
+
+def bench_launch_salvo(count: int = 5000):
+    """One salvo call versus one create/launch call per missile"""
+    print(f"launch_salvo ({count:,} missiles from one silo)")
+    rng = random.Random(11)
+    icbm = create_missile_types_from_config(MISSILE_TYPES)['ICBM']
+    targets = [(rng.randint(0, 2000), rng.randint(0, 1000)) for _ in range(count)]
+
+    def one_by_one(manager):
+        for target in targets:
+            missile = manager.create_missile(icbm, (10, 10), target, "USSR")
+            if missile:
+                manager.launch_missile(missile)
+
+    for label, vectorized in (("objects", False), ("fleet", True)):
+        def manager():
+            return MissileManager(vectorized=vectorized, analytic_trajectories=True)
+
+        TRAJECTORY_CACHE.clear()
+        looped = timed(lambda: one_by_one(manager()))
+        TRAJECTORY_CACHE.clear()
+        salvo = timed(lambda: manager().launch_salvo(icbm, [(10, 10)], targets, "USSR"))
+        print(f"   {label:8s} loop {looped * 1000:8.2f} ms   salvo {salvo * 1000:8.2f} ms")
+
+
+def bench_missile_pool(ticks: int = 2000, per_tick: int = 25):
+    """High-rate launch/retire churn with and without a MissilePool"""
+    print(f"missile churn ({ticks * per_tick:,} missiles, history_limit=100)")
+    icbm = create_missile_types_from_config(MISSILE_TYPES)['ICBM']
+
+    def churn(pool):
+        rng = random.Random(3)
+        manager = MissileManager(analytic_trajectories=True, history_limit=100, pool=pool,
+                                 track_impacts=True)
+        for _ in range(ticks):
+            for _ in range(per_tick):
+                origin = (rng.randint(0, 80), rng.randint(0, 30))
+                target = (rng.randint(0, 80), rng.randint(0, 30))
+                manager.launch_missile(manager.create_missile(icbm, origin, target, "USA"))
+            manager.update_missiles(1.0)
+            manager.pop_impacts()
+
+    for label, make_pool in (("new", lambda: None), ("pooled", MissilePool)):
+        elapsed = timed(lambda: churn(make_pool()), repeat=1)
+        print(f"   {label:8s} {elapsed * 1000:8.2f} ms")
+
+
+def build_world(count: int, seed: int = 5, columnar: bool = False) -> TargetManager:
+    """Large random two-country map"""
+    rng = random.Random(seed)
+    manager = TargetManager(columnar=columnar)
+    for i in range(count):
+        manager.add_target(rng.choice(("USA", "USSR")),
+                           Target(f"T{i}", "CITY", rng.randint(0, 2000), rng.randint(0, 1000),
+                                  1000000, 50, 0.3))
+    return manager
+
+
+def bench_nearest_target(count: int = 50000, queries: int = 1000):
+    """Impact resolution lookups on a large world map"""
+    print(f"get_nearest_target ({count:,} targets, {queries:,} impacts)")
+    rng = random.Random(5)
+    manager = build_world(count)
+    points = [(rng.randint(0, 2000), rng.randint(0, 1000)) for _ in range(queries)]
+
+    def brute_force(x, y):
+        return min(manager.all_targets, key=lambda t: ((t.x - x) ** 2 + (t.y - y) ** 2) ** 0.5)
+
+    scan = timed(lambda: [brute_force(x, y) for x, y in points[:50]], repeat=1) / 50
+    grid = timed(lambda: [manager.get_nearest_target(x, y, intact_only=False)
+                          for x, y in points]) / queries
+    print(f"   scan     {scan * 1e6:8.2f} us/query")
+    print(f"   grid     {grid * 1e6:8.2f} us/query")
+
+
+def bench_target_statistics(count: int = 50000, ticks: int = 100):
+    """Per-tick statistics and game-over queries on a large world map"""
+    print(f"target statistics ({count:,} targets, {ticks} ticks)")
+    manager = build_world(count)
+
+    def tick():
+        manager.get_total_casualties()
+        for country in ("USA", "USSR"):
+            manager.count_intact_targets(country)
+            manager.get_destruction_percentage(country)
+
+    elapsed = timed(lambda: [tick() for _ in range(ticks)])
+    print(f"   {'counters':8s} {elapsed / ticks * 1e6:8.2f} us/tick")
+
+    names = [target.name for target in manager.all_targets[::100]]
+    elapsed = timed(lambda: [manager.get_target_by_name(name) for name in names])
+    print(f"   {'by name':8s} {elapsed / len(names) * 1e6:8.2f} us/lookup")
+
+
+def bench_target_table(count: int = 100000):
+    """AI target scoring and damage snapshots, objects versus columnar table"""
+    print(f"target backends ({count:,} targets)")
+    from src.ai.wopr_ai import WOPRArtificialIntelligence
+    ai = WOPRArtificialIntelligence('normal')
+    for label, columnar in (("objects", False), ("table", True)):
+        manager = build_world(count, columnar=columnar)
+        scoring = timed(lambda: ai.select_targets(manager, 5), repeat=1)
+        snapshot = timed(manager.snapshot)
+        print(f"   {label:8s} select_targets {scoring * 1000:8.2f} ms   "
+              f"snapshot {snapshot * 1000:8.2f} ms")
+
+
+def bench_resolve_impacts(count: int = 20000, targets: int = 50000):
+    """One tick of MIRV impacts (10 warheads each), per-impact versus batch"""
+    print(f"damage resolution ({count:,} MIRV impacts on {targets:,} targets)")
+    rng = random.Random(13)
+    indexes = [rng.randrange(targets) for _ in range(count)]
+
+    def per_impact(manager):
+        for index in indexes:
+            manager.all_targets[index].take_damage(10, 0.85)
+
+    def batch(manager):
+        manager.resolve_impacts(indexes, [10] * count, [0.85] * count)
+
+    for label, columnar, resolve in (("loop", False, per_impact), ("objects", False, batch),
+                                     ("table", True, batch)):
+        manager = build_world(targets, columnar=columnar)
+        start = time.perf_counter()
+        resolve(manager)
+        print(f"   {label:8s} {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+
+def bench_world_scaling(sizes=(1000, 10000, 100000)):
+    """Generated worlds of growing size: load, AI targeting and a salvo's flight"""
+    print("generated worlds (load / AI target selection / 50-missile salvo to impact)")
+    for size in sizes:
+        world = generate_world(size, seed=1)
+        engine = GameEngine()
+        load = timed(lambda: engine.initialize_game(GameMode.SIMULATION, 'normal', world=world),
+                     repeat=1)
+        random.seed(1)
+        turn = timed(lambda: engine.ai_opponent.select_targets(engine.target_manager, 5), repeat=1)
+        engine.player_launch_salvo('ICBM', engine.target_manager.get_intact_targets('USSR')[:50])
+        missiles = engine.missile_manager
+        ticks = 0
+        start = time.perf_counter()
+        while missiles.get_statistics()['in_flight'] and engine.state == GameState.PLAYING:
+            engine.update(1.0)
+            ticks += 1
+        flight = time.perf_counter() - start
+        assert missiles.get_statistics()['detonated'] > 0
+        print(f"   {size:>8,} {load * 1000:9.2f} ms {turn * 1000:9.2f} ms {flight * 1000:9.2f} ms "
+              f"({ticks} ticks)")
+
+
+def bench_scenario_load(count: int = 1000000):
+    """Loading a large world from config dicts versus a binary scenario file"""
+    print(f"world loading ({count:,} targets: load / first name and nearest lookups)")
+    import os
+    import tempfile
+    from src.utils.scenario import write_scenario, load_scenario
+
+    world = generate_world(count, seed=2)
+    path = os.path.join(tempfile.mkdtemp(), 'world.scn')
+    write_scenario(path, world)
+    for label, load in (("config", lambda: create_targets_from_config(world, columnar=True)),
+                        ("scenario", lambda: load_scenario(path))):
+        elapsed = timed(load, repeat=1)
+        manager = load()
+        start = time.perf_counter()  # Builds the lookup indexes and the whole-map grid
+        manager.get_target_by_name("")
+        manager.get_nearest_target(0, 0)
+        lookups = time.perf_counter() - start
+        del manager
+        tracemalloc.start()  # Separate run: tracing slows allocation down
+        load()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"   {label:8s} {elapsed * 1000:9.2f} ms {lookups * 1000:9.2f} ms   "
+              f"peak {peak / 2 ** 20:8.1f} MiB")
+    os.remove(path)
+
+
+def bench_lazy_regions(count: int = 400000):
+    """Game start on a four-region map: every region loaded versus on demand"""
+    print(f"region loading ({count:,} targets, 4 regions, game touches USA/USSR)")
+    world = generate_world(count, countries=('USA', 'USSR', 'EUROPE', 'ASIA'), seed=6)
+    for label, lazy in (("eager", False), ("lazy", True)):
+        def start():
+            manager = create_targets_from_config(world, columnar=True, lazy=lazy)
+            manager.count_intact_targets('USA')
+            manager.count_intact_targets('USSR')
+        print(f"   {label:8s} {timed(start, repeat=1) * 1000:9.2f} ms")
+
+
+def bench_distance_matrix(count: int = 20000):
+    """AI planning range checks: a throwaway Missile per pair versus the cached matrix"""
+    print(f"range checks ({count:,} targets x {len(MISSILE_TYPES)} missile types)")
+    missile_types = list(create_missile_types_from_config(MISSILE_TYPES).values())
+    TRAJECTORY_CACHE.maxsize = 0  # Every pair is new, as in a fresh plan
+    for label, columnar in (("objects", False), ("table", True)):
+        manager = build_world(count, columnar=columnar)
+        site = manager.get_launch_site('USSR')
+        targets = manager.get_targets_by_country('USA')
+        pairs = len(targets) * len(missile_types)
+        per_missile = timed(lambda: [Missile(t, (site.x, site.y), (target.x, target.y), "USSR",
+                                             analytic=True).is_in_range()
+                                     for target in targets for t in missile_types], repeat=1)
+        manager.distances_from(site)
+        matrix = timed(lambda: [manager.in_range(site, target, t)
+                                for target in targets for t in missile_types])
+        print(f"   {label:8s} missile {per_missile / pairs * 1e6:6.2f} us/pair   "
+              f"matrix {matrix / pairs * 1e6:6.2f} us/pair")
+    TRAJECTORY_CACHE.maxsize = 4096
+
+
+def bench_headless_games(count: int = 2000):
+    """Complete headless games against WOPR (balance testing throughput)"""
+    print(f"headless games ({count:,} games)")
+    from src.simulation.headless import run_games, random_player, greedy_player
+    for label, player in (("greedy", greedy_player), ("random", random_player)):
+        elapsed = timed(lambda: run_games(count, player=player), repeat=1)
+        print(f"   {label:8s} {count / elapsed * 60:9,.0f} games/min")
+
+
+def bench_batch(count: int = 4000):
+    """Monte Carlo batch throughput, one process versus one per core"""
+    import os
+    from src.simulation.batch import run_batch
+    cores = os.cpu_count() or 1
+    print(f"batch simulation ({count:,} games, {cores} cores)")
+    for workers in sorted({1, cores}):
+        elapsed = timed(lambda: run_batch(count, workers=workers), repeat=1)
+        print(f"   {workers:3d} workers {count / elapsed * 60:9,.0f} games/min")
+
+
+def bench_batched_engine(count: int = 10000):
+    """Games per minute: headless games one at a time versus BatchedGameEngine"""
+    from src.simulation.batched_engine import BatchedGameEngine
+    from src.simulation.headless import run_games
+    print(f"batched engine ({count:,} games)")
+    sample = count // 10
+    elapsed = timed(lambda: run_games(sample), repeat=1)
+    print(f"   headless {sample / elapsed * 60:12,.0f} games/min")
+    elapsed = timed(lambda: BatchedGameEngine(count, seed=0).run(), repeat=1)
+    print(f"   batched  {count / elapsed * 60:12,.0f} games/min")
+
+
+def bench_game_loop(counts=(1000, 10000, 100000), tick_rate: float = 60.0, ticks: int = 120):
+    """Real-time loop at a fixed tick rate with many missiles in flight"""
+    from src.game_loop import FixedTimestepLoop
+    print(f"real-time loop ({tick_rate:g} ticks/s, {ticks} ticks)")
+    rng = random.Random(5)
+    for count in counts:
+        engine = GameEngine()
+        engine.initialize_game(GameMode.CAMPAIGN)
+        site = engine.target_manager.get_launch_site('USA')
+        # Slow cruise missiles: nothing lands while the loop runs
+        engine.missile_manager.launch_salvo(
+            engine.missile_types['CRUISE'], [(site.x, site.y)],
+            [(rng.randint(50, 80), rng.randint(5, 25)) for _ in range(count)], "PLAYER")
+        loop = FixedTimestepLoop(engine.update, tick_rate=tick_rate)
+        stats = loop.run(max_ticks=ticks)
+        print(f"   {count:7,d} missiles {stats['tick_rate']:6.1f} ticks/s "
+              f"update {stats['mean_update_ms']:7.3f} ms, {stats['dropped_ticks']} dropped")
+
+
+def bench_rng_streams(count: int = 100000):
+    """Columnar AI target scoring with per-target jitter: random module versus BlockRandom"""
+    print(f"AI scoring jitter ({count:,} targets)")
+    from src.ai.wopr_ai import WOPRArtificialIntelligence
+    from src.utils.rng import BlockRandom
+    manager = build_world(count, columnar=True)
+    for label, rng in (("random", random), ("blocks", BlockRandom(1))):
+        ai = WOPRArtificialIntelligence('normal', rng=rng)
+        elapsed = timed(lambda: ai.select_targets(manager, 5))
+        print(f"   {label:8s} {elapsed * 1000:8.2f} ms")
+
+
+def bench_object_memory(count: int = 100000):
+    """Resident bytes per Target, Missile and Player instance"""
+    print(f"memory per object ({count:,} instances each)")
+    icbm = create_missile_types_from_config(MISSILE_TYPES)['ICBM']
+    factories = (
+        ("Target", lambda i: Target("TARGET", "CITY", i % 80, i % 30, 1000000, 50, 0.3)),
+        ("Missile", lambda i: Missile(icbm, (10, 10), (50, 20), "USA", analytic=True)),
+        ("Player", lambda i: Player("PLAYER", "USA")),
+    )
+    for label, factory in factories:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory(i) for i in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        used -= sys.getsizeof(objects)  # The holding list itself
+        print(f"   {label:8s} {used / count:8.0f} bytes/object")
+        del objects
+
+
+if __name__ == "__main__":
+    bench_update_missiles()
+    bench_create_missile()
+    bench_repeated_salvo()
+    bench_near_position()
+    bench_launch_salvo()
+    bench_missile_pool()
+    bench_nearest_target()
+    bench_target_statistics()
+    bench_target_table()
+    bench_resolve_impacts()
+    bench_world_scaling()
+    bench_scenario_load()
+    bench_lazy_regions()
+    bench_distance_matrix()
+    bench_headless_games()
+    bench_batch()
+    bench_batched_engine()
+    bench_game_loop()
+    bench_rng_streams()
+    bench_object_memory()
+
+# Made with Bob
@@ -14,8 +14,16 @@ class WOPRArtificialIntelligence:
     Strategic AI opponent that learns and adapts
     """
     
-    def __init__(self, difficulty: str = 'normal'):
+    # Extra score for high-priority target types
+    TARGET_TYPE_PRIORITY = {
+        'COMMAND_CENTER': 100,
+        'MISSILE_SILO': 80,
+        'MILITARY_BASE': 60,
+    }
+    
+    def __init__(self, difficulty: str = 'normal', rng=None):
         self.difficulty = difficulty
+        self.rng = rng or random  # Source of every random decision (see src/utils/rng.py)
         self.name = "WOPR"
         self.missiles_remaining = 50
         self.defenses_remaining = 20
@@ -45,11 +53,8 @@ class WOPRArtificialIntelligence:
         Returns strategic assessment
         """
         # Get target statistics
-        player_targets = target_manager.get_targets_by_country('USA')
-        ai_targets = target_manager.get_targets_by_country('USSR')
-        
-        player_intact = len([t for t in player_targets if not t.destroyed])
-        ai_intact = len([t for t in ai_targets if not t.destroyed])
+        player_intact = target_manager.count_intact_targets('USA')
+        ai_intact = target_manager.count_intact_targets('USSR')
         
         # Calculate threat level
         active_missiles = missile_manager.get_active_missiles()
@@ -80,6 +85,10 @@ class WOPRArtificialIntelligence:
         Select targets to attack based on strategy
         Returns list of Target objects
         """
+        if getattr(target_manager, 'table', None) is not None:
+            # Columnar targets: score the table rows with array operations
+            return self._select_targets_columnar(target_manager, num_targets)
+        
         # Get available player targets
         player_targets = target_manager.get_intact_targets('USA')
         
@@ -99,10 +108,10 @@ class WOPRArtificialIntelligence:
         selected = [t[1] for t in scored_targets[:num_targets]]
         
         # Add some randomness based on difficulty
-        if self.difficulty != 'wopr' and random.random() > self.base_accuracy:
+        if self.difficulty != 'wopr' and self.rng.random() > self.base_accuracy:
             # Sometimes pick a random target instead
             if player_targets:
-                selected[0] = random.choice(player_targets)
+                selected[0] = self.rng.choice(player_targets)
         
         return selected
     
@@ -117,12 +126,7 @@ class WOPRArtificialIntelligence:
         score += (1.0 - target.damage_level) * 50
         
         # Command centers and missile silos are high priority
-        if target.target_type == 'COMMAND_CENTER':
-            score += 100
-        elif target.target_type == 'MISSILE_SILO':
-            score += 80
-        elif target.target_type == 'MILITARY_BASE':
-            score += 60
+        score += self.TARGET_TYPE_PRIORITY.get(target.target_type, 0)
         
         # Consider defense level (prefer easier targets when aggression is low)
         if self.aggression_level < 0.5:
@@ -133,10 +137,51 @@ class WOPRArtificialIntelligence:
             score -= 20  # Avoid targets we've missed before
         
         # Add some randomness
-        score += random.uniform(-10, 10)
+        score += self.rng.uniform(-10, 10)
         
         return score
     
+    def _select_targets_columnar(self, target_manager, num_targets: int) -> List:
+        """
+        select_targets for a columnar TargetManager
+        Vectorized _calculate_target_score over table rows; draws the random
+        jitter in the same order (one block read with a BlockRandom), so picks
+        match the scalar path
+        """
+        import numpy as np
+        from src.utils.rng import draw_uniform
+        
+        table = target_manager.table
+        indexes = target_manager.get_intact_indexes('USA')
+        if not indexes:
+            return []
+        
+        rows = np.array(indexes, dtype=np.int64)
+        priority = np.array([self.TARGET_TYPE_PRIORITY.get(name, 0) for name in table.type_names],
+                            dtype=np.float64)
+        
+        score = np.zeros(len(rows))
+        score += table.strategic_value[rows] * 2.0
+        score += (1.0 - table.damage_level[rows]) * 50
+        score += priority[table.type_id[rows]]
+        if self.aggression_level < 0.5:
+            score -= table.defense_level[rows] * 30
+        if self.targets_missed:
+            missed = set(self.targets_missed)
+            score -= np.fromiter((table.names[row] in missed for row in indexes), dtype=np.bool_,
+                                 count=len(rows)) * 20.0
+        score += draw_uniform(self.rng, -10, 10, len(indexes))
+        
+        # Highest first; a stable sort keeps ties in list order like list.sort
+        order = np.argsort(-score, kind='stable')[:num_targets]
+        selected = [indexes[i] for i in order.tolist()]
+        
+        # Add some randomness based on difficulty
+        if self.difficulty != 'wopr' and self.rng.random() > self.base_accuracy:
+            selected[0] = self.rng.choice(indexes)
+        
+        return [target_manager.all_targets[index] for index in selected]
+    
     def decide_action(self, situation: Dict) -> str:
         """
         Decide what action to take
@@ -154,7 +199,7 @@ class WOPRArtificialIntelligence:
             ) / 2
             
             if total_destruction < 3:  # Both sides nearly destroyed
-                if random.random() < 0.3:  # 30% chance to suggest peace
+                if self.rng.random() < 0.3:  # 30% chance to suggest peace
                     return 'peace'
         
         # High threat - defend
@@ -175,7 +220,7 @@ class WOPRArtificialIntelligence:
             return 'attack'
         
         # Default - wait and observe
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             return 'wait'
         
         # Otherwise attack if we have missiles
@@ -184,16 +229,18 @@ class WOPRArtificialIntelligence:
         
         return 'wait'
     
-    def select_missile_type(self, target, available_types: Dict) -> Optional[str]:
+    def select_missile_type(self, target, available_types: Dict,
+                            distance: Optional[float] = None) -> Optional[str]:
         """
         Select appropriate missile type for target
+        distance is the launch site to target distance (TargetManager.distance)
         Returns missile type name or None
         """
         if not available_types:
             return None
         
-        # Calculate distance to target (simplified)
-        distance = target.strategic_value * 10  # Rough estimate
+        if distance is None:
+            distance = target.strategic_value * 10  # Rough estimate
         
         # Filter by range and cost
         suitable = []
@@ -295,7 +342,7 @@ class WOPRArtificialIntelligence:
         else:
             messages.extend(WOPR_QUOTES)
         
-        return random.choice(messages)
+        return self.rng.choice(messages)
     
     def take_turn(self, target_manager, missile_manager, available_missile_types: Dict,
                   player_stats: Dict) -> Dict:
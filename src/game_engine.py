@@ -3,8 +3,11 @@ Global Thermal Nuclear War - Game Engine
 Core game loop and state management
 """
 
+import math
+import random
 import time
 import sys
+from collections import deque
 from typing import Optional, Dict, List
 from enum import Enum
 
@@ -34,19 +37,26 @@ class GameMode(Enum):
 class Player:
     """Represents a player in the game"""
     
-    def __init__(self, name: str, country: str, is_ai: bool = False):
+    __slots__ = ('name', 'country', 'is_ai', 'missiles_remaining', 'defenses_remaining',
+                 'missiles_launched', 'missiles_launched_count', 'targets_destroyed', 'score')
+    
+    def __init__(self, name: str, country: str, is_ai: bool = False,
+                 history_limit: Optional[int] = None):
         self.name = name
         self.country = country
         self.is_ai = is_ai
         self.missiles_remaining = 50
         self.defenses_remaining = 20
-        self.missiles_launched = []
+        # Most recent launches only when history_limit is set; the count stays exact
+        self.missiles_launched = [] if history_limit is None else deque(maxlen=history_limit)
+        self.missiles_launched_count = 0
         self.targets_destroyed = []
         self.score = 0
         
     def launch_missile(self, missile: Missile):
         """Record missile launch"""
         self.missiles_launched.append(missile)
+        self.missiles_launched_count += 1
         self.missiles_remaining -= 1
         
     def target_destroyed(self, target: Target):
@@ -60,7 +70,7 @@ class Player:
             'name': self.name,
             'country': self.country,
             'missiles_remaining': self.missiles_remaining,
-            'missiles_launched': len(self.missiles_launched),
+            'missiles_launched': self.missiles_launched_count,
             'targets_destroyed': len(self.targets_destroyed),
             'score': self.score,
         }
@@ -69,7 +79,8 @@ class Player:
 class GameEngine:
     """Main game engine"""
     
-    def __init__(self):
+    def __init__(self, history_limit: Optional[int] = None, batch_damage: bool = False,
+                 rng=None):
         self.state = GameState.MENU
         self.mode = None
         self.running = False
@@ -80,6 +91,16 @@ class GameEngine:
         self.missile_manager = None
         self.missile_types = {}
         
+        # Retired missiles kept per manager/player (None keeps everything)
+        self.history_limit = history_limit
+        
+        # Resolve each tick's impacts with TargetManager.resolve_impacts (numpy)
+        self.batch_damage = batch_damage
+        
+        # Random stream shared by targets and AI (src/utils/rng.py); the
+        # random module unless given
+        self.rng = rng or random
+        
         # Players
         self.player = None
         self.ai_opponent = None
@@ -94,8 +115,15 @@ class GameEngine:
         self.total_missiles_launched = 0
         self.game_result = None
         
-    def initialize_game(self, mode: GameMode, difficulty: str = 'normal'):
-        """Initialize a new game"""
+    def initialize_game(self, mode: GameMode, difficulty: str = 'normal',
+                        world: Optional[Dict] = None, scenario: Optional[str] = None,
+                        lazy: bool = False):
+        """
+        Initialize a new game
+        world replaces WORLD_TARGETS (e.g. a generate_world() map); scenario
+        loads the map from a scenario file instead. With lazy=True countries
+        are loaded the first time the game touches them
+        """
         self.mode = mode
         self.turn_count = 0
         self.game_time = 0.0
@@ -103,20 +131,29 @@ class GameEngine:
         self.total_missiles_launched = 0
         
         # Create target manager
-        self.target_manager = create_targets_from_config(WORLD_TARGETS)
+        if self.target_manager is not None:
+            self.target_manager.close()
+        if scenario:
+            from src.utils.scenario import load_scenario
+            self.target_manager = load_scenario(scenario, lazy=lazy)
+            self.target_manager.rng = self.rng
+        else:
+            self.target_manager = create_targets_from_config(world or WORLD_TARGETS, lazy=lazy,
+                                                             rng=self.rng)
         
         # Create missile manager
-        self.missile_manager = MissileManager()
+        self.missile_manager = MissileManager(history_limit=self.history_limit,
+                                              track_impacts=True)
         
         # Create missile types
         self.missile_types = create_missile_types_from_config(MISSILE_TYPES)
         
         # Create player
-        self.player = Player("PLAYER", "USA", is_ai=False)
+        self.player = Player("PLAYER", "USA", is_ai=False, history_limit=self.history_limit)
         
         # Create AI opponent
         if mode != GameMode.TUTORIAL:
-            self.ai_opponent = WOPRArtificialIntelligence(difficulty)
+            self.ai_opponent = WOPRArtificialIntelligence(difficulty, rng=self.rng)
         
         self.state = GameState.PLAYING
         self.running = True
@@ -139,45 +176,95 @@ class GameEngine:
         
         # Check win/loss conditions
         self._check_game_over()
+    
+    def skip_to_next_event(self, tick: Optional[float] = None) -> float:
+        """
+        Fast-forward straight to the next scheduled missile impact
+        With tick, stop on the first whole tick at or after the impact, so the
+        game plays out exactly as update(tick) calls would, minus the idle ones
+        Returns the game time skipped (0.0 if nothing is in flight)
+        """
+        if self.state != GameState.PLAYING or self.paused:
+            return 0.0
+        
+        delay = self.missile_manager.time_to_next_impact()
+        if delay is None:
+            return 0.0
+        if tick is not None:
+            # update_missiles lands missiles up to CLOCK_EPSILON early
+            ticks = math.ceil((delay - self.missile_manager.CLOCK_EPSILON) / tick)
+            delay = max(1, ticks) * tick
+        
+        self.update(delay)
+        return delay
         
     def _check_missile_impacts(self):
         """Check for missile impacts and apply damage"""
-        for missile in self.missile_manager.detonated_missiles[:]:
-            if missile in self.missile_manager.detonated_missiles:
-                # Find target at impact location
-                target = self.target_manager.get_nearest_target(
-                    missile.target[0], 
-                    missile.target[1],
-                    intact_only=False
+        if self.batch_damage:
+            self._resolve_impacts_batch()
+            return
+        
+        for missile in self.missile_manager.pop_impacts():
+            # Find target at impact location
+            target = self.target_manager.get_nearest_target(
+                missile.target[0], 
+                missile.target[1],
+                intact_only=False
+            )
+            
+            if target and not target.destroyed:
+                # Apply damage
+                result = target.take_damage(
+                    missile.missile_type.warheads,
+                    missile.missile_type.accuracy
                 )
                 
-                if target and not target.destroyed:
-                    # Apply damage
-                    result = target.take_damage(
-                        missile.missile_type.warheads,
-                        missile.missile_type.accuracy
-                    )
-                    
-                    # Update player stats
-                    if result['destroyed']:
-                        if missile.owner == self.player.name:
-                            self.player.target_destroyed(target)
-                        elif self.ai_opponent:
-                            self.ai_opponent.targets_hit.append(target.name)
-                
-                # Remove from detonated list
-                self.missile_manager.detonated_missiles.remove(missile)
+                # Update player stats
+                if result['destroyed']:
+                    if missile.owner == self.player.name:
+                        self.player.target_destroyed(target)
+                    elif self.ai_opponent:
+                        self.ai_opponent.targets_hit.append(target.name)
+    
+    def _resolve_impacts_batch(self):
+        """Apply every impact of this tick in one vectorized pass"""
+        impacts = []
+        for missile in self.missile_manager.pop_impacts():
+            target = self.target_manager.get_nearest_target(
+                missile.target[0],
+                missile.target[1],
+                intact_only=False
+            )
+            if target and not target.destroyed:
+                impacts.append((missile, target))
+        
+        if not impacts:
+            return
+        
+        result = self.target_manager.resolve_impacts(
+            [self.target_manager.index_of(target) for _, target in impacts],
+            [missile.missile_type.warheads for missile, _ in impacts],
+            [missile.missile_type.accuracy for missile, _ in impacts]
+        )
+        
+        # Update player stats
+        for (missile, target), destroyed in zip(impacts, result['destroyed'].tolist()):
+            if destroyed:
+                if missile.owner == self.player.name:
+                    self.player.target_destroyed(target)
+                elif self.ai_opponent:
+                    self.ai_opponent.targets_hit.append(target.name)
     
     def _update_statistics(self):
         """Update game statistics"""
         self.total_casualties = self.target_manager.get_total_casualties()
-        self.total_missiles_launched = len(self.missile_manager.missiles)
+        self.total_missiles_launched = self.missile_manager.total_created
     
     def _check_game_over(self):
         """Check if game is over"""
         # Check for mutual assured destruction
-        usa_targets = self.target_manager.get_intact_targets('USA')
-        ussr_targets = self.target_manager.get_intact_targets('USSR')
+        usa_intact = self.target_manager.count_intact_targets('USA')
+        ussr_intact = self.target_manager.count_intact_targets('USSR')
         
         usa_destruction = self.target_manager.get_destruction_percentage('USA')
         ussr_destruction = self.target_manager.get_destruction_percentage('USSR')
@@ -190,14 +277,14 @@ class GameEngine:
             return
         
         # Player loses: all USA targets destroyed
-        if len(usa_targets) == 0:
+        if usa_intact == 0:
             self.state = GameState.GAME_OVER
             self.game_result = 'DEFEAT'
             self.running = False
             return
         
         # Player wins: all USSR targets destroyed (unlikely)
-        if len(ussr_targets) == 0:
+        if ussr_intact == 0:
             self.state = GameState.GAME_OVER
             self.game_result = 'VICTORY'
             self.running = False
@@ -233,12 +320,12 @@ class GameEngine:
         
         missile_type = self.missile_types[missile_type_name]
         
-        # Get player's launch position (simplified - use first USA target)
-        usa_targets = self.target_manager.get_targets_by_country('USA')
-        if not usa_targets:
+        # Get player's launch position
+        site = self.target_manager.get_launch_site('USA')
+        if not site or not self.target_manager.in_range(site, target, missile_type):
             return False
         
-        origin = (usa_targets[0].x, usa_targets[0].y)
+        origin = (site.x, site.y)
         target_pos = (target.x, target.y)
         
         # Create missile
@@ -258,6 +345,32 @@ class GameEngine:
         
         return True
     
+    def player_launch_salvo(self, missile_type_name: str, targets: List[Target]) -> int:
+        """
+        Player launches one missile per target in a single salvo
+        Returns number of missiles launched
+        """
+        if self.player.missiles_remaining <= 0 or missile_type_name not in self.missile_types:
+            return 0
+        
+        site = self.target_manager.get_launch_site('USA')
+        if not site:
+            return 0
+        
+        salvo = self.missile_manager.launch_salvo(
+            self.missile_types[missile_type_name],
+            [(site.x, site.y)],
+            [(target.x, target.y) for target in targets],
+            self.player.name,
+            limit=self.player.missiles_remaining,
+            distances=[self.target_manager.distance(site, target) for target in targets]
+        )
+        
+        for missile in salvo['missiles']:
+            self.player.launch_missile(missile)
+        
+        return len(salvo['missiles'])
+    
     def ai_take_turn(self):
         """AI takes its turn"""
         if not self.ai_opponent or self.state != GameState.PLAYING:
@@ -274,35 +387,40 @@ class GameEngine:
         # Execute AI actions
         if result['action'] == 'attack' and result.get('targets'):
             # Get AI launch position
-            ussr_targets = self.target_manager.get_targets_by_country('USSR')
-            if ussr_targets:
-                origin = (ussr_targets[0].x, ussr_targets[0].y)
+            site = self.target_manager.get_launch_site('USSR')
+            if site:
+                origin = (site.x, site.y)
                 
+                # Consecutive targets sharing a missile type go out as one
+                # salvo, so missiles still fly in select_targets order
+                salvos = []
                 for target in result['targets']:
-                    if self.ai_opponent.missiles_remaining <= 0:
-                        break
-                    
-                    # Select missile type
                     missile_type_name = self.ai_opponent.select_missile_type(
                         target,
-                        self.missile_types
+                        self.missile_types,
+                        self.target_manager.distance(site, target)
                     )
+                    if not missile_type_name:
+                        continue
+                    if salvos and salvos[-1][0] == missile_type_name:
+                        salvos[-1][1].append(target)
+                    else:
+                        salvos.append((missile_type_name, [target]))
+                
+                for missile_type_name, targets in salvos:
+                    if self.ai_opponent.missiles_remaining <= 0:
+                        break
                     
-                    if missile_type_name:
-                        missile_type = self.missile_types[missile_type_name]
-                        target_pos = (target.x, target.y)
-                        
-                        # Create and launch missile
-                        missile = self.missile_manager.create_missile(
-                            missile_type,
-                            origin,
-                            target_pos,
-                            self.ai_opponent.name
-                        )
-                        
-                        if missile:
-                            self.missile_manager.launch_missile(missile)
-                            self.ai_opponent.missiles_remaining -= 1
+                    # Create and launch the salvo
+                    salvo = self.missile_manager.launch_salvo(
+                        self.missile_types[missile_type_name],
+                        [origin],
+                        [(target.x, target.y) for target in targets],
+                        self.ai_opponent.name,
+                        limit=self.ai_opponent.missiles_remaining,
+                        distances=[self.target_manager.distance(site, target) for target in targets]
+                    )
+                    self.ai_opponent.missiles_remaining -= len(salvo['accepted'])
         
         return result
     
@@ -362,7 +480,7 @@ if __name__ == "__main__":
     engine = GameEngine()
     engine.initialize_game(GameMode.CAMPAIGN, 'normal')
     print(f"Game initialized: {engine.state}")
-    print(f"Targets: {len(engine.target_manager.all_targets)}")
+    print(f"Targets: {engine.target_manager.get_statistics()['total_targets']}")
     print(f"Missile types: {list(engine.missile_types.keys())}")
 
 # Made with Bob
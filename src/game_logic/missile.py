@@ -5,26 +5,177 @@ Handles missile launches, trajectories, and combat
 
 import time
 import math
-from typing import Tuple, Optional, Dict
+import heapq
+import weakref
+from collections import OrderedDict, deque
+from typing import Tuple, Optional, Dict, Sequence
 from dataclasses import dataclass
 
+from src.game_logic.spatial import SpatialHashGrid
 
-@dataclass
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@dataclass(frozen=True)
 class MissileType:
-    """Missile type configuration"""
+    """Missile type configuration (immutable, shared by every missile of the type)"""
+    __slots__ = ('name', 'range', 'speed', 'warheads', 'accuracy', 'cost')
+    
     name: str
     range: int
     speed: float
     warheads: int
     accuracy: float
     cost: int
+    
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored through setattr
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+
+def trajectory_point(origin: Tuple[int, int], target: Tuple[int, int],
+                     progress: float) -> Tuple[int, int]:
+    """
+    Evaluate the ballistic arc closed-form at a flight progress (0.0 to 1.0)
+    Returns the same point the precomputed trajectory list holds for that progress
+    """
+    x1, y1 = origin
+    x2, y2 = target
+    dx = x2 - x1
+    dy = y2 - y1
+    distance = math.sqrt(dx * dx + dy * dy)
+    num_points = max(10, int(distance))
+    
+    # Snap to the trajectory sample the missile has reached
+    index = min(int(progress * (num_points + 1)), num_points)
+    t = index / num_points
+    
+    x = x1 + (x2 - x1) * t
+    arc_height = distance * 0.2
+    y = y1 + (y2 - y1) * t - 4 * arc_height * t * (1 - t)
+    return (int(x), int(y))
+
+
+def trajectory_points(origin_x, origin_y, target_x, target_y, progress):
+    """
+    Vectorized trajectory_point for many missiles (requires numpy)
+    Returns (xs, ys) integer arrays
+    """
+    if np is None:
+        raise ImportError("trajectory_points requires numpy (pip install numpy)")
+    
+    x1 = np.asarray(origin_x, dtype=np.float64)
+    y1 = np.asarray(origin_y, dtype=np.float64)
+    x2 = np.asarray(target_x, dtype=np.float64)
+    y2 = np.asarray(target_y, dtype=np.float64)
+    progress = np.asarray(progress, dtype=np.float64)
+    
+    dx = x2 - x1
+    dy = y2 - y1
+    distance = np.sqrt(dx * dx + dy * dy)
+    num_points = np.maximum(10, distance.astype(np.int64))
+    
+    index = np.minimum((progress * (num_points + 1)).astype(np.int64), num_points)
+    t = index / num_points
+    
+    xs = x1 + (x2 - x1) * t
+    arc_height = distance * 0.2
+    ys = y1 + (y2 - y1) * t - 4 * arc_height * t * (1 - t)
+    return xs.astype(np.int64), ys.astype(np.int64)
+
+
+class TrajectoryEntry:
+    """Cached launch geometry shared (read-only) by every missile flying it"""
+    
+    __slots__ = ('distance', 'flight_time', 'points')
+    
+    def __init__(self, distance: float, flight_time: float):
+        self.distance = distance
+        self.flight_time = flight_time
+        self.points = None  # Interned trajectory tuple, built on first demand
+
+
+class TrajectoryCache:
+    """
+    Bounded LRU cache of trajectories and flight times
+    Keyed by origin, target and missile type; a maxsize of 0 disables caching
+    """
+    
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    def lookup(self, missile_type: MissileType, origin: Tuple[int, int],
+               target: Tuple[int, int]) -> TrajectoryEntry:
+        """Get (or compute and store) the entry for a launch geometry"""
+        key = (tuple(origin), tuple(target), missile_type.name, missile_type.speed)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        
+        self.misses += 1
+        dx = target[0] - origin[0]
+        dy = target[1] - origin[1]
+        distance = math.sqrt(dx * dx + dy * dy)
+        entry = TrajectoryEntry(distance, distance / missile_type.speed)
+        
+        if self.maxsize > 0:
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+    
+    def get_statistics(self) -> Dict:
+        """Get cache statistics"""
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+    
+    def clear(self):
+        """Drop every cached entry and reset counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared by every Missile instance
+TRAJECTORY_CACHE = TrajectoryCache()
 
 
 class Missile:
     """Represents a missile in flight"""
     
+    __slots__ = ('missile_type', 'origin', 'target', 'owner', 'current_pos',
+                 'launched', 'detonated', 'intercepted', 'flight_time', 'launch_time',
+                 'missile_id', '_geometry', 'distance', 'total_flight_time',
+                 '_trajectory', 'trajectory_index')
+    
     def __init__(self, missile_type: MissileType, origin: Tuple[int, int], 
-                 target: Tuple[int, int], owner: str):
+                 target: Tuple[int, int], owner: str, analytic: bool = False,
+                 geometry: Optional[TrajectoryEntry] = None):
+        self.reinit(missile_type, origin, target, owner, analytic, geometry)
+    
+    def reinit(self, missile_type: MissileType, origin: Tuple[int, int],
+               target: Tuple[int, int], owner: str, analytic: bool = False,
+               geometry: Optional[TrajectoryEntry] = None):
+        """
+        Reset every field, as if freshly constructed (used by MissilePool)
+        geometry is the TRAJECTORY_CACHE entry for the launch, when the caller
+        already looked it up
+        """
         self.missile_type = missile_type
         self.origin = origin
         self.target = target
@@ -34,15 +185,32 @@ class Missile:
         self.detonated = False
         self.intercepted = False
         self.flight_time = 0.0
-        self.total_flight_time = self._calculate_flight_time()
-        self.trajectory = self._calculate_trajectory()
+        self.launch_time = 0.0  # Manager clock at launch
+        self.missile_id = None  # Assigned by MissileManager
+        self._geometry = geometry or TRAJECTORY_CACHE.lookup(missile_type, origin, target)
+        self.distance = self._geometry.distance
+        self.total_flight_time = self._geometry.flight_time
+        # Analytic missiles evaluate their arc on demand instead of storing it
+        self._trajectory = None if analytic else self._shared_trajectory()
         self.trajectory_index = 0
+    
+    @property
+    def trajectory(self) -> tuple:
+        """Trajectory points (materialized on first access for analytic missiles)"""
+        if self._trajectory is None:
+            self._trajectory = self._shared_trajectory()
+        return self._trajectory
+    
+    def _shared_trajectory(self) -> tuple:
+        """Trajectory interned in the shared cache entry"""
+        if self._geometry.points is None:
+            self._geometry.points = tuple(self._calculate_trajectory())
+        return self._geometry.points
         
     def _calculate_flight_time(self) -> float:
         """Calculate total flight time based on distance and speed"""
-        distance = self._calculate_distance(self.origin, self.target)
         # Flight time in seconds (simplified)
-        return distance / self.missile_type.speed
+        return self.distance / self.missile_type.speed
     
     def _calculate_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
         """Calculate distance between two points"""
@@ -56,7 +224,7 @@ class Missile:
         x2, y2 = self.target
         
         # Number of points in trajectory
-        distance = self._calculate_distance(self.origin, self.target)
+        distance = self.distance
         num_points = max(10, int(distance))
         
         trajectory = []
@@ -88,7 +256,14 @@ class Missile:
         if not self.launched or self.detonated or self.intercepted:
             return False
         
-        self.flight_time += delta_time
+        return self.advance_to(self.flight_time + delta_time)
+    
+    def advance_to(self, flight_time: float) -> bool:
+        """
+        Move the missile to an absolute flight time
+        Returns True if missile is still in flight
+        """
+        self.flight_time = flight_time
         
         # Check if reached target
         if self.flight_time >= self.total_flight_time:
@@ -97,10 +272,17 @@ class Missile:
         
         # Update position along trajectory
         progress = self.flight_time / self.total_flight_time
-        self.trajectory_index = int(progress * len(self.trajectory))
         
-        if self.trajectory_index < len(self.trajectory):
-            self.current_pos = list(self.trajectory[self.trajectory_index])
+        if self._trajectory is None:
+            num_points = max(10, int(self.distance))
+            self.trajectory_index = int(progress * (num_points + 1))
+            self.current_pos = list(trajectory_point(self.origin, self.target, progress))
+            return True
+        
+        self.trajectory_index = int(progress * len(self._trajectory))
+        
+        if self.trajectory_index < len(self._trajectory):
+            self.current_pos = list(self._trajectory[self.trajectory_index])
         
         return True
     
@@ -125,8 +307,7 @@ class Missile:
     
     def is_in_range(self) -> bool:
         """Check if target is in range"""
-        distance = self._calculate_distance(self.origin, self.target)
-        return distance <= self.missile_type.range
+        return self.distance <= self.missile_type.range
     
     def get_status(self) -> str:
         """Get missile status"""
@@ -161,94 +342,613 @@ class Missile:
         return f"Missile({self.missile_type.name}, {self.owner}, {self.get_status()})"
 
 
+class MissilePool:
+    """
+    Free list recycling Missile objects retired from a MissileManager
+    
+    Opt-in for headless simulations: a recycled missile is reinitialized in
+    place, so references kept elsewhere (e.g. Player.missiles_launched) will
+    see it change.
+    """
+    
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._free = []
+        self.created = 0
+        self.reused = 0
+    
+    def acquire(self, missile_type: MissileType, origin: Tuple[int, int],
+                target: Tuple[int, int], owner: str, analytic: bool = False,
+                geometry: Optional[TrajectoryEntry] = None) -> Missile:
+        """Get a missile, reusing a released one when available"""
+        if self._free:
+            missile = self._free.pop()
+            missile.reinit(missile_type, origin, target, owner, analytic, geometry)
+            self.reused += 1
+            return missile
+        
+        self.created += 1
+        return Missile(missile_type, origin, target, owner, analytic, geometry)
+    
+    def release(self, missile: Missile):
+        """Return a retired missile to the free list"""
+        if len(self._free) < self.max_size:
+            self._free.append(missile)
+    
+    def get_statistics(self) -> Dict:
+        """Get pool statistics"""
+        return {
+            'free': len(self._free),
+            'created': self.created,
+            'reused': self.reused,
+        }
+    
+    def __len__(self):
+        return len(self._free)
+    
+    def __repr__(self):
+        return f"MissilePool(free={len(self._free)}, created={self.created}, reused={self.reused})"
+
+
 class MissileManager:
-    """Manages all missiles in the game"""
+    """
+    Manages all missiles in the game
+    
+    Missiles are kept in an id-keyed registry with per-status and per-owner
+    indexes, so launch, intercept and owner lookups are constant time no
+    matter how many missiles a long game has accumulated.
+    
+    Detonations are scheduled in a min-heap of impact times: each update only
+    touches missiles whose impact falls inside the step, and in-flight
+    positions are brought up to date lazily when someone asks for them.
+    
+    With a history_limit, only the most recent retired missiles (resolved
+    detonations and interceptions) are kept; older ones are dropped and only
+    counted, so memory stays flat over arbitrarily long simulations. Dropped
+    missiles go back to the optional MissilePool for reuse.
+    
+    With track_impacts=True detonations are also queued until the owner
+    drains them with pop_impacts() (GameEngine does so every update), and
+    only retire then. Otherwise they retire as soon as they detonate.
+    """
+    
+    STATUSES = ('READY', 'IN_FLIGHT', 'DETONATED', 'INTERCEPTED')
+    
+    # Tolerance when comparing scheduled impact times against the clock
+    CLOCK_EPSILON = 1e-9
+    
+    # Minimum number of released fleet rows before compacting
+    FLEET_COMPACT_THRESHOLD = 64
     
-    def __init__(self):
-        self.missiles = []
-        self.active_missiles = []
-        self.detonated_missiles = []
-        self.intercepted_missiles = []
+    def __init__(self, vectorized: bool = False, analytic_trajectories: bool = False,
+                 history_limit: Optional[int] = None, grid_cell_size: float = 10.0,
+                 pool: Optional[MissilePool] = None, track_impacts: bool = False):
+        self.analytic_trajectories = analytic_trajectories
+        self.track_impacts = track_impacts
+        self.history_limit = history_limit
+        self.pool = pool
+        self._next_id = 0
+        self._registry = {}  # missile_id -> Missile
+        self._by_status = {status: {} for status in self.STATUSES}
+        self._by_owner = {}  # owner -> {missile_id: Missile}
+        self._pending_impacts = []  # Detonations not yet resolved by the engine
+        
+        # Retention: retired missiles still held, and exact running totals
+        self._history = deque()
+        self._totals = {'DETONATED': 0, 'INTERCEPTED': 0}
+        
+        # Detonation scheduler
+        self.clock = 0.0
+        self._impact_queue = []  # Heap of (impact_time, missile_id)
+        self._synced_at = 0.0
+        
+        # Spatial index over in-flight positions (refreshed with them)
+        self._grid = SpatialHashGrid(grid_cell_size)
+        
+        # Optional columnar backend (requires numpy)
+        self.fleet = None
+        if vectorized:
+            from src.game_logic.missile_fleet import MissileFleet
+            self.fleet = MissileFleet()
+            # Evicted views whose rows are released but not compacted away yet
+            self._evicted = weakref.WeakSet()
+    
+    @property
+    def missiles(self) -> list:
+        """All missiles held by this manager"""
+        return list(self._registry.values())
+    
+    @property
+    def total_created(self) -> int:
+        """Number of missiles ever created, including dropped history"""
+        return self._next_id
+    
+    @property
+    def active_missiles(self) -> list:
+        """Missiles currently in flight"""
+        return self.get_active_missiles()
+    
+    @property
+    def detonated_missiles(self) -> list:
+        """Missiles that reached their target"""
+        return list(self._by_status['DETONATED'].values())
+    
+    @property
+    def intercepted_missiles(self) -> list:
+        """Missiles destroyed in flight"""
+        return list(self._by_status['INTERCEPTED'].values())
+    
+    def _register(self, missile: Missile, missile_id: int) -> Missile:
+        """Add a freshly created missile to the registry and indexes"""
+        missile.missile_id = missile_id
+        self._next_id = missile_id + 1
+        self._registry[missile_id] = missile
+        self._by_status['READY'][missile_id] = missile
+        self._by_owner.setdefault(missile.owner, {})[missile_id] = missile
+        return missile
+    
+    def _move(self, missile: Missile, old_status: str, new_status: str):
+        """Move a missile between status indexes"""
+        del self._by_status[old_status][missile.missile_id]
+        self._by_status[new_status][missile.missile_id] = missile
+        if old_status == 'IN_FLIGHT':
+            self._grid.remove(missile.missile_id)
+        if new_status in self._totals:
+            self._totals[new_status] += 1
+        if new_status == 'DETONATED' and self.track_impacts:
+            self._pending_impacts.append(missile)
+        elif new_status in self._totals:
+            self._retire(missile)
+    
+    def _retire(self, missile: Missile):
+        """Add a finished missile to the history, dropping the oldest beyond the limit"""
+        if self.history_limit is None:
+            return
+        self._history.append(missile)
+        while len(self._history) > self.history_limit:
+            self._evict(self._history.popleft())
+    
+    def _evict(self, missile: Missile):
+        """Forget a retired missile (its totals are kept)"""
+        missile_id = missile.missile_id
+        del self._registry[missile_id]
+        self._by_status['DETONATED'].pop(missile_id, None)
+        self._by_status['INTERCEPTED'].pop(missile_id, None)
+        
+        owned = self._by_owner[missile.owner]
+        del owned[missile_id]
+        if not owned:
+            del self._by_owner[missile.owner]
+        
+        if self.fleet is not None:
+            self._release_fleet_row(missile)
+        elif self.pool is not None:
+            self.pool.release(missile)
+    
+    def _release_fleet_row(self, missile: Missile):
+        """
+        Release an evicted fleet missile's row and compact the fleet when worthwhile
+        Released rows keep their data until compaction; only views still held
+        outside the manager are copied out of the fleet then
+        """
+        fleet = self.fleet
+        fleet.release(missile.slot)
+        self._evicted.add(missile)
+        
+        if fleet.released_count >= max(self.FLEET_COMPACT_THRESHOLD, fleet.size // 2):
+            self._detach_evicted()
+            remap = fleet.compact()
+            for held in self._registry.values():
+                held.slot = int(remap[held.slot])
+    
+    def _detach_evicted(self):
+        """Copy evicted views someone still holds out of the fleet"""
+        for view in list(self._evicted):
+            view.detach()
+        self._evicted.clear()
+    
+    def _is(self, missile: Missile, status: str) -> bool:
+        """Check whether this manager holds missile with the given status"""
+        return self._by_status[status].get(getattr(missile, 'missile_id', None)) is missile
         
     def create_missile(self, missile_type: MissileType, origin: Tuple[int, int],
                       target: Tuple[int, int], owner: str) -> Optional[Missile]:
         """Create a new missile"""
-        missile = Missile(missile_type, origin, target, owner)
+        if self.fleet is not None:
+            return self._create_fleet_missile(missile_type, origin, target, owner)
+        
+        missile = self._new_missile(missile_type, origin, target, owner)
         
         if not missile.is_in_range():
+            if self.pool is not None:
+                self.pool.release(missile)
             return None
         
-        self.missiles.append(missile)
-        return missile
+        return self._register(missile, self._next_id)
+    
+    def _new_missile(self, missile_type: MissileType, origin: Tuple[int, int],
+                     target: Tuple[int, int], owner: str,
+                     geometry: Optional[TrajectoryEntry] = None) -> Missile:
+        """Construct a missile object, from the pool when one is configured"""
+        if self.pool is not None:
+            return self.pool.acquire(missile_type, origin, target, owner,
+                                     analytic=self.analytic_trajectories, geometry=geometry)
+        return Missile(missile_type, origin, target, owner, analytic=self.analytic_trajectories,
+                       geometry=geometry)
+    
+    def _create_fleet_missile(self, missile_type: MissileType, origin: Tuple[int, int],
+                              target: Tuple[int, int], owner: str) -> Optional[Missile]:
+        """
+        Create a missile stored as a row of the columnar fleet
+        The row holds the geometry itself, so TRAJECTORY_CACHE is not consulted
+        """
+        from src.game_logic.missile_fleet import FleetMissile
+        
+        dx = target[0] - origin[0]
+        dy = target[1] - origin[1]
+        if math.sqrt(dx * dx + dy * dy) > missile_type.range:
+            return None
+        
+        slot = self.fleet.add(missile_type, origin, target, owner, self._next_id)
+        return self._register(FleetMissile(self.fleet, slot), self._next_id)
     
     def launch_missile(self, missile: Missile):
         """Launch a missile"""
-        if missile in self.missiles and not missile.launched:
+        if self._is(missile, 'READY') and not missile.launched:
+            self._launch(missile)
+    
+    def _launch(self, missile: Missile, prelaunched: bool = False):
+        """Put a registered missile in flight and schedule its impact"""
+        if not prelaunched:
             missile.launch()
-            self.active_missiles.append(missile)
+            missile.launch_time = self.clock
+        self._move(missile, 'READY', 'IN_FLIGHT')
+        self._grid.insert(missile.missile_id, *missile.origin)
+        if self.fleet is None:  # The fleet finds its impacts in advance()
+            heapq.heappush(self._impact_queue,
+                           (self.clock + missile.total_flight_time, missile.missile_id))
     
-    def update_missiles(self, delta_time: float):
-        """Update all active missiles"""
-        still_active = []
+    def launch_salvo(self, missile_type: MissileType, origins: Sequence[Tuple[int, int]],
+                     targets: Sequence[Tuple[int, int]], owner: str,
+                     limit: Optional[int] = None,
+                     distances: Optional[Sequence[float]] = None) -> Dict:
+        """
+        Create and launch a whole salvo in one call
+        A single origin is shared by every missile; at most limit missiles fly
+        distances (one per target, e.g. TargetManager.distance) replace the
+        range computation. Missile objects share one TRAJECTORY_CACHE lookup
+        per distinct (origin, target) pair, and the salvo joins the registry,
+        grid and impact queue in bulk
+        Returns dict with accepted/rejected target indices and launched missiles
+        """
+        count = len(targets)
+        if len(origins) != 1 and len(origins) != count:
+            raise ValueError("origins must hold one position or one per target")
+        if distances is not None and len(distances) != count:
+            raise ValueError("distances must hold one distance per target")
         
-        for missile in self.active_missiles:
-            if missile.update(delta_time):
-                still_active.append(missile)
+        accepted = []
+        rejected = []
+        if distances is not None:
+            reachable = [distance <= missile_type.range for distance in distances]
+        else:
+            reachable = self._salvo_in_range(missile_type, origins, targets)
+        if len(origins) == 1:
+            origins = list(origins) * count
+        for index, in_range in enumerate(reachable):
+            if in_range and (limit is None or len(accepted) < limit):
+                accepted.append(index)
             else:
-                if missile.detonated:
-                    self.detonated_missiles.append(missile)
-                elif missile.intercepted:
-                    self.intercepted_missiles.append(missile)
+                rejected.append(index)
+        
+        salvo_origins = [origins[i] for i in accepted]
+        salvo_targets = [targets[i] for i in accepted]
+        if self.fleet is not None:
+            missiles = self._create_fleet_salvo(missile_type, salvo_origins, salvo_targets, owner)
+        else:
+            missiles = self._create_salvo(missile_type, salvo_origins, salvo_targets, owner)
+        self._register_salvo(missiles, salvo_origins, owner)
         
-        self.active_missiles = still_active
+        return {
+            'accepted': accepted,
+            'rejected': rejected,
+            'missiles': missiles,
+        }
+    
+    def _salvo_in_range(self, missile_type: MissileType, origins: Sequence[Tuple[int, int]],
+                        targets: Sequence[Tuple[int, int]]) -> list:
+        """Range check for every (origin, target) pair (one origin is shared by all)"""
+        if not targets:
+            return []
+        if np is None:
+            if len(origins) == 1:
+                origins = list(origins) * len(targets)
+            return [math.sqrt((t[0] - o[0]) ** 2 + (t[1] - o[1]) ** 2) <= missile_type.range
+                    for o, t in zip(origins, targets)]
+        
+        # A single origin row broadcasts against every target
+        delta = np.asarray(targets, dtype=np.float64) - np.asarray(origins, dtype=np.float64)
+        distance = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+        return (distance <= missile_type.range).tolist()
+    
+    def _create_salvo(self, missile_type: MissileType, origins: list,
+                      targets: list, owner: str) -> list:
+        """Launched missile objects, one trajectory lookup per distinct launch geometry"""
+        geometries = {}
+        missiles = []
+        for origin, target in zip(origins, targets):
+            key = (tuple(origin), tuple(target))
+            geometry = geometries.get(key)
+            if geometry is None:
+                geometry = geometries[key] = TRAJECTORY_CACHE.lookup(missile_type, origin, target)
+            missile = self._new_missile(missile_type, origin, target, owner, geometry)
+            missile.launch()
+            missile.launch_time = self.clock
+            missiles.append(missile)
+        return missiles
+    
+    def _create_fleet_salvo(self, missile_type: MissileType, origins: list,
+                            targets: list, owner: str) -> list:
+        """Bulk-add a launched salvo to the fleet and return a view per row"""
+        from src.game_logic.missile_fleet import FleetMissile
+        
+        slots = self.fleet.add_many(missile_type, origins, targets, owner, self._next_id)
+        self.fleet.launch_many(slots, self.clock)
+        return [FleetMissile(self.fleet, slot) for slot in slots]
+    
+    def _register_salvo(self, missiles: list, origins: list, owner: str):
+        """
+        Register a launched salvo straight into IN_FLIGHT, one bulk update per
+        index; ids follow salvo order, as with one create/launch per missile
+        """
+        first_id = self._next_id
+        ids = range(first_id, first_id + len(missiles))
+        for missile_id, missile in zip(ids, missiles):
+            missile.missile_id = missile_id
+        self._next_id = first_id + len(missiles)
+        self._registry.update(zip(ids, missiles))
+        self._by_status['IN_FLIGHT'].update(zip(ids, missiles))
+        self._by_owner.setdefault(owner, {}).update(zip(ids, missiles))
+        
+        cells = {}
+        for origin in origins:
+            origin = tuple(origin)
+            if origin not in cells:
+                cells[origin] = self._grid.cell_of(*origin)
+        self._grid.insert_many(ids, [cells[tuple(origin)] for origin in origins])
+        
+        if self.fleet is not None:  # The fleet finds its impacts in advance()
+            return
+        clock = self.clock
+        entries = [(clock + missile.total_flight_time, missile.missile_id) for missile in missiles]
+        queue = self._impact_queue
+        if len(entries) > len(queue):
+            queue.extend(entries)
+            heapq.heapify(queue)
+        else:
+            for entry in entries:
+                heapq.heappush(queue, entry)
+    
+    def update_missiles(self, delta_time: float):
+        """
+        Advance the clock and detonate missiles whose impact time has come
+        The object backend pops them from the impact-time heap; the fleet
+        advances every in-flight row in one vectorized step instead
+        """
+        self.clock += delta_time
+        in_flight = self._by_status['IN_FLIGHT']
+        
+        if self.fleet is not None:
+            due = self._advance_fleet()
+        else:
+            queue = self._impact_queue
+            due = []
+            while queue and queue[0][0] <= self.clock + self.CLOCK_EPSILON:
+                _, missile_id = heapq.heappop(queue)
+                missile = in_flight.get(missile_id)
+                if missile is not None:  # Skip intercepted / already detonated
+                    due.append(missile)
+        
+        if not due:
+            return
+        
+        # Resolve in launch order, as a per-missile sweep would
+        due.sort(key=lambda m: m.missile_id)
+        for missile in due:
+            if missile.intercepted:
+                self._move(missile, 'IN_FLIGHT', 'INTERCEPTED')
+                continue
+            if not missile.detonated:
+                missile.flight_time = self.clock - missile.launch_time
+                missile.detonate()
+            self._move(missile, 'IN_FLIGHT', 'DETONATED')
+        
+        if self.fleet is not None:
+            self.fleet.pop_retired()
+    
+    def _advance_fleet(self) -> list:
+        """Vectorized fleet step; returns the missiles it detonated as one batch"""
+        fleet = self.fleet
+        arrived = fleet.advance(self.clock, self.CLOCK_EPSILON)
+        # Missiles detonated or intercepted directly through their view
+        retired = fleet.pop_retired()
+        if not arrived.size and not retired:
+            return []
+        
+        in_flight = self._by_status['IN_FLIGHT']
+        missile_ids = fleet.missile_id[arrived].tolist()
+        missile_ids.extend(int(fleet.missile_id[slot]) for slot in retired)
+        return [in_flight[missile_id] for missile_id in missile_ids if missile_id in in_flight]
+    
+    def _sync_positions(self):
+        """Bring in-flight flight times, positions and the grid up to the manager clock"""
+        if self._synced_at == self.clock:
+            return
+        self._synced_at = self.clock
+        
+        if self.fleet is not None:
+            self._sync_fleet_positions()
+            return
+        
+        grid = self._grid
+        for missile in self._by_status['IN_FLIGHT'].values():
+            flight_time = self.clock - missile.launch_time
+            # Arrival is left to the scheduler
+            if flight_time < missile.total_flight_time:
+                missile.advance_to(flight_time)
+            grid.insert(missile.missile_id, *missile.current_pos)
+    
+    def _sync_fleet_positions(self):
+        """Vectorized position sync; only missiles that changed cell touch the grid"""
+        fleet = self.fleet
+        # Flight times are current: the clock only moves in update_missiles()
+        slots = np.flatnonzero(fleet.in_flight_mask())
+        if slots.size == 0:
+            return
+        
+        xs, ys = fleet.positions(slots)
+        cell_size = self._grid.cell_size
+        cell_x = np.floor(xs / cell_size).astype(np.int64)
+        cell_y = np.floor(ys / cell_size).astype(np.int64)
+        changed = (cell_x != fleet.cell_x[slots]) | (cell_y != fleet.cell_y[slots])
+        
+        for missile_id, cx, cy in zip(fleet.missile_id[slots[changed]].tolist(),
+                                      cell_x[changed].tolist(), cell_y[changed].tolist()):
+            self._grid.move_to_cell(missile_id, (cx, cy))
+        fleet.cell_x[slots] = cell_x
+        fleet.cell_y[slots] = cell_y
+        fleet.pos_x[slots] = xs
+        fleet.pos_y[slots] = ys
+    
+    def time_to_next_impact(self) -> Optional[float]:
+        """Time until the next scheduled detonation (None if nothing is in flight)"""
+        if self.fleet is not None:
+            return self.fleet.time_to_next_impact(self.clock)
+        queue = self._impact_queue
+        in_flight = self._by_status['IN_FLIGHT']
+        while queue and queue[0][1] not in in_flight:
+            heapq.heappop(queue)
+        if not queue:
+            return None
+        return max(0.0, queue[0][0] - self.clock)
+    
+    def detonate_missile(self, missile: Missile) -> bool:
+        """Detonate an in-flight missile immediately"""
+        if self._is(missile, 'IN_FLIGHT'):
+            missile.detonate()
+            self._move(missile, 'IN_FLIGHT', 'DETONATED')
+            return True
+        return False
     
     def intercept_missile(self, missile: Missile) -> bool:
         """Attempt to intercept a missile"""
-        if missile in self.active_missiles:
+        if self._is(missile, 'IN_FLIGHT'):
             missile.intercept()
-            self.active_missiles.remove(missile)
-            self.intercepted_missiles.append(missile)
+            self._move(missile, 'IN_FLIGHT', 'INTERCEPTED')
             return True
         return False
     
+    def pop_impacts(self) -> list:
+        """Return detonations not yet resolved and forget them (needs track_impacts)"""
+        if not self.track_impacts:
+            raise RuntimeError("Impacts are only queued by a MissileManager(track_impacts=True)")
+        impacts = self._pending_impacts
+        self._pending_impacts = []
+        for missile in impacts:
+            self._retire(missile)
+        return impacts
+    
+    def get_missile(self, missile_id: int) -> Optional[Missile]:
+        """Look up a missile by id"""
+        return self._registry.get(missile_id)
+    
     def get_missiles_by_owner(self, owner: str) -> list:
         """Get all missiles owned by a player"""
-        return [m for m in self.missiles if m.owner == owner]
+        return list(self._by_owner.get(owner, {}).values())
+    
+    def get_missiles_by_status(self, status: str) -> list:
+        """Get all missiles with a status (READY, IN_FLIGHT, DETONATED, INTERCEPTED)"""
+        if status == 'IN_FLIGHT':
+            self._sync_positions()
+        return list(self._by_status[status].values())
     
     def get_active_missiles(self) -> list:
         """Get all missiles currently in flight"""
-        return self.active_missiles.copy()
+        self._sync_positions()
+        return list(self._by_status['IN_FLIGHT'].values())
     
     def get_missiles_near_position(self, pos: Tuple[int, int], radius: float) -> list:
-        """Get missiles near a position"""
+        """Get missiles near a position (only nearby grid cells are visited)"""
+        self._sync_positions()
+        in_flight = self._by_status['IN_FLIGHT']
+        candidates = [in_flight[missile_id]
+                      for missile_id in self._grid.candidates(pos[0], pos[1], radius)]
+        if self.fleet is not None:
+            return self._filter_fleet_near(candidates, pos, radius)
+        
         nearby = []
-        for missile in self.active_missiles:
+        for missile in candidates:
             current_pos = missile.get_position()
             dx = current_pos[0] - pos[0]
             dy = current_pos[1] - pos[1]
             distance = math.sqrt(dx * dx + dy * dy)
             if distance <= radius:
                 nearby.append(missile)
+        
+        # Launch order, as a sweep over the in-flight missiles would return
+        nearby.sort(key=lambda m: m.missile_id)
+        return nearby
+    
+    def _filter_fleet_near(self, candidates: list, pos: Tuple[int, int], radius: float) -> list:
+        """Exact distance filter over fleet candidates, on the positions of the last sync"""
+        if not candidates:
+            return []
+        slots = [missile.slot for missile in candidates]
+        dx = self.fleet.pos_x[slots] - pos[0]
+        dy = self.fleet.pos_y[slots] - pos[1]
+        within = dx * dx + dy * dy <= radius * radius
+        nearby = [missile for missile, keep in zip(candidates, within.tolist()) if keep]
+        nearby.sort(key=lambda m: m.missile_id)
         return nearby
     
     def get_statistics(self) -> Dict:
-        """Get missile statistics"""
+        """
+        Get missile statistics
+        trajectory_cache holds the counters of the process-wide TRAJECTORY_CACHE,
+        shared with every other manager (fleet launches never use it)
+        """
         return {
-            'total_launched': len(self.missiles),
-            'in_flight': len(self.active_missiles),
-            'detonated': len(self.detonated_missiles),
-            'intercepted': len(self.intercepted_missiles),
+            'total_launched': self._next_id,
+            'in_flight': len(self._by_status['IN_FLIGHT']),
+            'detonated': self._totals['DETONATED'],
+            'intercepted': self._totals['INTERCEPTED'],
+            'retained': len(self._registry),
+            'trajectory_cache': TRAJECTORY_CACHE.get_statistics(),
         }
     
     def clear(self):
         """Clear all missiles"""
-        self.missiles.clear()
-        self.active_missiles.clear()
-        self.detonated_missiles.clear()
-        self.intercepted_missiles.clear()
+        self._next_id = 0
+        self._registry.clear()
+        for index in self._by_status.values():
+            index.clear()
+        self._by_owner.clear()
+        self._pending_impacts.clear()
+        self._history.clear()
+        self._totals = {'DETONATED': 0, 'INTERCEPTED': 0}
+        self._impact_queue.clear()
+        self._grid.clear()
+        self.clock = 0.0
+        self._synced_at = 0.0
+        if self.fleet is not None:
+            self._detach_evicted()
+            self.fleet.clear()
+    
+    def __len__(self):
+        return len(self._registry)
     
     def __repr__(self):
-        return f"MissileManager(total={len(self.missiles)}, active={len(self.active_missiles)})"
+        return f"MissileManager(total={self._next_id}, active={len(self._by_status['IN_FLIGHT'])})"
 
 
 def create_missile_types_from_config(config_types: Dict) -> Dict[str, MissileType]:
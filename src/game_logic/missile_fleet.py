@@ -0,0 +1,367 @@
+"""
+Global Thermal Nuclear War - Columnar Missile Fleet
+Structure-of-arrays missile storage advanced with vectorized NumPy steps
+"""
+
+import math
+from typing import Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.game_logic.missile import Missile, MissileType, TrajectoryEntry, trajectory_points
+
+
+class MissileFleet:
+    """
+    Columnar store for missiles.
+    
+    Every missile occupies one slot (row) in a set of parallel NumPy arrays,
+    so a whole salvo can be advanced with a handful of array operations
+    instead of one ``Missile.update`` call per object; advance() returns the
+    slots that detonated as one batch.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise ImportError("MissileFleet requires numpy (pip install numpy)")
+        
+        self.size = 0
+        self.missile_types = []
+        self.owners = []
+        self.origins = []
+        self.targets = []
+        self.retired = []  # Slots retired since the last pop_retired()
+        self.released_count = 0
+        self._allocate(max(1, capacity))
+    
+    def _allocate(self, capacity: int):
+        """Allocate (or grow) the column arrays"""
+        old_size = self.size
+        columns = {
+            'flight_time': np.float64,
+            'launch_time': np.float64,
+            'total_flight_time': np.float64,
+            'origin_x': np.float64,
+            'origin_y': np.float64,
+            'target_x': np.float64,
+            'target_y': np.float64,
+            'distance': np.float64,
+            'num_points': np.int64,
+            'missile_id': np.int64,
+            'cell_x': np.int64,  # Spatial grid cell last recorded for the slot
+            'cell_y': np.int64,
+            'pos_x': np.int64,  # Map position at the last position sync
+            'pos_y': np.int64,
+            'launched': np.bool_,
+            'detonated': np.bool_,
+            'intercepted': np.bool_,
+            'released': np.bool_,
+        }
+        for name, dtype in columns.items():
+            column = np.zeros(capacity, dtype=dtype)
+            if old_size:
+                column[:old_size] = getattr(self, name)[:old_size]
+            setattr(self, name, column)
+        self.capacity = capacity
+    
+    def add(self, missile_type: MissileType, origin: Tuple[int, int],
+            target: Tuple[int, int], owner: str, missile_id: int = -1) -> int:
+        """Add a missile to the fleet and return its slot"""
+        if self.size == self.capacity:
+            self._allocate(self.capacity * 2)
+        
+        slot = self.size
+        dx = target[0] - origin[0]
+        dy = target[1] - origin[1]
+        distance = math.sqrt(dx * dx + dy * dy)
+        
+        self.origin_x[slot], self.origin_y[slot] = origin
+        self.target_x[slot], self.target_y[slot] = target
+        self.distance[slot] = distance
+        self.num_points[slot] = max(10, int(distance))
+        self.total_flight_time[slot] = distance / missile_type.speed
+        self.flight_time[slot] = 0.0
+        self.launch_time[slot] = 0.0
+        self.missile_id[slot] = missile_id
+        self.cell_x[slot] = self.cell_y[slot] = np.iinfo(np.int64).min
+        self.pos_x[slot], self.pos_y[slot] = int(origin[0]), int(origin[1])
+        self.launched[slot] = False
+        self.detonated[slot] = False
+        self.intercepted[slot] = False
+        self.released[slot] = False
+        
+        self.missile_types.append(missile_type)
+        self.owners.append(owner)
+        self.origins.append(tuple(origin))
+        self.targets.append(tuple(target))
+        self.size += 1
+        return slot
+    
+    def add_many(self, missile_type: MissileType, origins: list, targets: list,
+                 owner: str, first_id: int = -1) -> range:
+        """Add a salvo of missiles in one vectorized write; returns their slots"""
+        count = len(targets)
+        if count == 0:
+            return range(self.size, self.size)
+        capacity = self.capacity
+        while self.size + count > capacity:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._allocate(capacity)
+        
+        start = self.size
+        rows = slice(start, start + count)
+        origin = np.asarray(origins, dtype=np.float64).reshape(count, 2)
+        target = np.asarray(targets, dtype=np.float64).reshape(count, 2)
+        dx = target[:, 0] - origin[:, 0]
+        dy = target[:, 1] - origin[:, 1]
+        distance = np.sqrt(dx * dx + dy * dy)
+        
+        self.origin_x[rows] = origin[:, 0]
+        self.origin_y[rows] = origin[:, 1]
+        self.target_x[rows] = target[:, 0]
+        self.target_y[rows] = target[:, 1]
+        self.distance[rows] = distance
+        self.num_points[rows] = np.maximum(10, distance.astype(np.int64))
+        self.total_flight_time[rows] = distance / missile_type.speed
+        self.flight_time[rows] = 0.0
+        self.launch_time[rows] = 0.0
+        self.missile_id[rows] = np.arange(first_id, first_id + count) if first_id >= 0 else -1
+        self.cell_x[rows] = self.cell_y[rows] = np.iinfo(np.int64).min
+        self.pos_x[rows] = origin[:, 0].astype(np.int64)
+        self.pos_y[rows] = origin[:, 1].astype(np.int64)
+        self.launched[rows] = False
+        self.detonated[rows] = False
+        self.intercepted[rows] = False
+        self.released[rows] = False
+        
+        self.missile_types.extend([missile_type] * count)
+        self.owners.extend([owner] * count)
+        self.origins.extend(tuple(o) for o in origins)
+        self.targets.extend(tuple(t) for t in targets)
+        self.size += count
+        return range(start, start + count)
+    
+    def launch_many(self, slots: range, clock: float):
+        """Launch a block of consecutive slots at a scheduler clock"""
+        rows = slice(slots.start, slots.stop)
+        self.launched[rows] = True
+        self.flight_time[rows] = 0.0
+        self.launch_time[rows] = clock
+    
+    def in_flight_mask(self):
+        """Boolean mask of missiles currently in flight"""
+        n = self.size
+        return self.launched[:n] & ~self.detonated[:n] & ~self.intercepted[:n]
+    
+    def advance(self, clock: float, epsilon: float = 0.0):
+        """
+        Advance every in-flight missile to a scheduler clock in one vectorized step
+        Missiles whose impact time has come (within epsilon) are marked detonated
+        Returns array of slots that detonated during this step
+        """
+        flying = np.flatnonzero(self.in_flight_mask())
+        if flying.size == 0:
+            return flying
+        
+        elapsed = clock - self.launch_time[flying]
+        self.flight_time[flying] = elapsed
+        arrived = flying[elapsed + epsilon >= self.total_flight_time[flying]]
+        self.detonated[arrived] = True
+        return arrived
+    
+    def time_to_next_impact(self, clock: float):
+        """Time from a scheduler clock until the next in-flight missile lands (None if none)"""
+        flying = self.in_flight_mask()
+        if not flying.any():
+            return None
+        n = self.size
+        impact = self.launch_time[:n][flying] + self.total_flight_time[:n][flying]
+        return max(0.0, float(impact.min()) - clock)
+    
+    def retire_slot(self, slot: int, intercepted: bool = False):
+        """Take a missile out of flight (detonated or intercepted)"""
+        if intercepted:
+            self.intercepted[slot] = True
+        else:
+            self.detonated[slot] = True
+        self.retired.append(slot)
+    
+    def pop_retired(self) -> list:
+        """Return and forget slots retired since the last call"""
+        retired = self.retired
+        self.retired = []
+        return retired
+    
+    def release(self, slot: int):
+        """Mark a finished missile's row as reusable by compact()"""
+        if not self.released[slot]:
+            self.released[slot] = True
+            self.released_count += 1
+    
+    def compact(self):
+        """
+        Drop released rows, packing live rows to the front
+        Returns array mapping old slots to new slots (-1 for dropped rows)
+        """
+        n = self.size
+        keep = np.flatnonzero(~self.released[:n])
+        remap = np.full(n, -1, dtype=np.int64)
+        remap[keep] = np.arange(keep.size)
+        
+        for name in self._column_names():
+            column = getattr(self, name)
+            column[:keep.size] = column[keep]
+        
+        kept = keep.tolist()
+        self.missile_types = [self.missile_types[i] for i in kept]
+        self.owners = [self.owners[i] for i in kept]
+        self.origins = [self.origins[i] for i in kept]
+        self.targets = [self.targets[i] for i in kept]
+        self.retired = [int(remap[i]) for i in self.retired if remap[i] >= 0]
+        
+        self.size = keep.size
+        self.released_count = 0
+        return remap
+    
+    def extract(self, slot: int) -> 'MissileFleet':
+        """Copy one row into a standalone single-missile fleet"""
+        row = MissileFleet(capacity=1)
+        for name in self._column_names():
+            getattr(row, name)[0] = getattr(self, name)[slot]
+        row.missile_types.append(self.missile_types[slot])
+        row.owners.append(self.owners[slot])
+        row.origins.append(self.origins[slot])
+        row.targets.append(self.targets[slot])
+        row.size = 1
+        return row
+    
+    def _column_names(self) -> list:
+        """Names of the per-slot array columns"""
+        return [name for name, value in vars(self).items()
+                if isinstance(value, np.ndarray)]
+    
+    def positions(self, slots):
+        """
+        Current integer map positions for the given slots
+        Returns (xs, ys) arrays
+        """
+        slots = np.asarray(slots, dtype=np.int64)
+        flight_time = self.flight_time[slots]
+        total = self.total_flight_time[slots]
+        progress = np.divide(flight_time, total, out=np.zeros_like(flight_time),
+                             where=total > 0)
+        
+        xs, ys = trajectory_points(self.origin_x[slots], self.origin_y[slots],
+                                   self.target_x[slots], self.target_y[slots], progress)
+        
+        detonated = self.detonated[slots]
+        xs = np.where(detonated, self.target_x[slots].astype(np.int64), xs)
+        ys = np.where(detonated, self.target_y[slots].astype(np.int64), ys)
+        return xs, ys
+    
+    def clear(self):
+        """Remove every missile from the fleet"""
+        self.size = 0
+        self.missile_types.clear()
+        self.owners.clear()
+        self.origins.clear()
+        self.targets.clear()
+        self.retired.clear()
+        self.released_count = 0
+    
+    def __len__(self):
+        return self.size
+    
+    def __repr__(self):
+        return f"MissileFleet(size={self.size}, in_flight={int(self.in_flight_mask().sum())})"
+
+
+def _fleet_column(name: str):
+    """Property reading and writing one scalar of a fleet column"""
+    def getter(self):
+        return getattr(self.fleet, name)[self.slot].item()
+    
+    def setter(self, value):
+        getattr(self.fleet, name)[self.slot] = value
+    
+    return property(getter, setter)
+
+
+class FleetMissile(Missile):
+    """
+    Missile view onto one row of a MissileFleet.
+    Exposes the regular Missile API while the state lives in the fleet arrays.
+    """
+    
+    __slots__ = ('fleet', 'slot', '__weakref__')
+    
+    flight_time = _fleet_column('flight_time')
+    launch_time = _fleet_column('launch_time')
+    total_flight_time = _fleet_column('total_flight_time')
+    launched = _fleet_column('launched')
+    detonated = _fleet_column('detonated')
+    intercepted = _fleet_column('intercepted')
+    
+    def __init__(self, fleet: MissileFleet, slot: int):
+        self.fleet = fleet
+        self.slot = slot
+        self.missile_type = fleet.missile_types[slot]
+        self.owner = fleet.owners[slot]
+        self.origin = fleet.origins[slot]
+        self.target = fleet.targets[slot]
+        self.distance = fleet.distance[slot].item()
+        self._geometry = TrajectoryEntry(self.distance, self.total_flight_time)
+        self._trajectory = None
+    
+    @property
+    def current_pos(self) -> list:
+        # Like Missile.current_pos: the position of the last sync, or the target
+        if self.detonated:
+            return list(self.target)
+        fleet, slot = self.fleet, self.slot
+        return [int(fleet.pos_x[slot]), int(fleet.pos_y[slot])]
+    
+    @property
+    def trajectory_index(self) -> int:
+        total = self.total_flight_time
+        progress = self.flight_time / total if total > 0 else 0.0
+        num_points = int(self.fleet.num_points[self.slot])
+        return min(int(progress * (num_points + 1)), num_points)
+    
+    def update(self, delta_time: float) -> bool:
+        """
+        Update missile position
+        Returns True if missile is still in flight
+        """
+        if not self.launched or self.detonated or self.intercepted:
+            return False
+        
+        self.flight_time += delta_time
+        if self.flight_time >= self.total_flight_time:
+            self.detonated = True
+            return False
+        return True
+    
+    def detonate(self):
+        """Detonate the missile at target"""
+        self.fleet.retire_slot(self.slot)
+    
+    def intercept(self):
+        """Intercept the missile"""
+        self.fleet.retire_slot(self.slot, intercepted=True)
+    
+    def detach(self):
+        """Copy this missile's row out of the shared fleet so it can be released"""
+        self.fleet = self.fleet.extract(self.slot)
+        self.slot = 0
+    
+    def is_in_range(self) -> bool:
+        """Check if target is in range"""
+        return bool(self.fleet.distance[self.slot] <= self.missile_type.range)
+
+
+# Made with Bob
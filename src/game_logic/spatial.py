@@ -0,0 +1,146 @@
+"""
+Global Thermal Nuclear War - Spatial Indexing
+Uniform hash grid used for proximity queries on the map
+"""
+
+import math
+from typing import Hashable, Iterator, List, Tuple
+
+
+class SpatialHashGrid:
+    """
+    Buckets keys by the grid cell their position falls in.
+    Radius queries only visit the cells overlapping the query circle.
+    """
+
+    def __init__(self, cell_size: float = 10.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells = {}  # (cx, cy) -> set of keys
+        self._key_cells = {}  # key -> (cx, cy)
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Grid cell containing a position"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, key: Hashable, x: float, y: float):
+        """Insert a key at a position (or move it there)"""
+        self.move_to_cell(key, self.cell_of(x, y))
+
+    def move_to_cell(self, key: Hashable, cell: Tuple[int, int]):
+        """Place a key in a cell; a no-op if it is already there"""
+        old_cell = self._key_cells.get(key)
+        if old_cell == cell:
+            return
+        if old_cell is not None:
+            self._discard(key, old_cell)
+        self._cells.setdefault(cell, set()).add(key)
+        self._key_cells[key] = cell
+
+    def insert_many(self, keys: List, cells: List[Tuple[int, int]]):
+        """Insert keys that are not in the grid yet, keys[i] into cells[i]"""
+        self._key_cells.update(zip(keys, cells))
+        buckets = self._cells
+        for key, cell in zip(keys, cells):
+            bucket = buckets.get(cell)
+            if bucket is None:
+                buckets[cell] = {key}
+            else:
+                bucket.add(key)
+
+    def remove(self, key: Hashable):
+        """Remove a key (ignored if absent)"""
+        cell = self._key_cells.pop(key, None)
+        if cell is not None:
+            self._discard(key, cell)
+
+    def _discard(self, key: Hashable, cell: Tuple[int, int]):
+        bucket = self._cells[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self._cells[cell]
+
+    def candidates(self, x: float, y: float, radius: float) -> Iterator:
+        """
+        Keys in cells overlapping the square around (x, y)
+        Callers filter by exact distance
+        """
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+        span = (max_cx - min_cx + 1) * (max_cy - min_cy + 1)
+
+        if span > len(self._cells):
+            # Huge radius: cheaper to walk the occupied cells
+            for (cx, cy), bucket in self._cells.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    yield from bucket
+            return
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def rings(self, x: float, y: float) -> Iterator[Tuple[float, List]]:
+        """
+        Keys in square rings of cells around (x, y), nearest rings first
+        Yields (min_distance, keys): no key in this or a later ring is closer
+        than min_distance, so nearest-neighbour callers can stop early
+        """
+        if not self._cells:
+            return
+        cx, cy = self.cell_of(x, y)
+        remaining = len(self._cells)
+        radius = 0
+        while remaining:
+            min_distance = max(0, radius - 1) * self.cell_size
+            ring_cells = 8 * radius if radius else 1
+            if ring_cells > remaining:
+                # Sparse far-out rings: walk the occupied cells left instead
+                keys = [key for (kx, ky), bucket in self._cells.items()
+                        if max(abs(kx - cx), abs(ky - cy)) >= radius
+                        for key in bucket]
+                yield min_distance, keys
+                return
+
+            keys = []
+            for cell in self._ring_cells(cx, cy, radius):
+                bucket = self._cells.get(cell)
+                if bucket:
+                    keys.extend(bucket)
+                    remaining -= 1
+            if keys:
+                yield min_distance, keys
+            radius += 1
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, radius: int) -> Iterator[Tuple[int, int]]:
+        if radius == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-radius, radius + 1):
+            yield (cx + dx, cy - radius)
+            yield (cx + dx, cy + radius)
+        for dy in range(-radius + 1, radius):
+            yield (cx - radius, cy + dy)
+            yield (cx + radius, cy + dy)
+
+    def clear(self):
+        """Remove every key"""
+        self._cells.clear()
+        self._key_cells.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._key_cells
+
+    def __len__(self):
+        return len(self._key_cells)
+
+    def __repr__(self):
+        return (f"SpatialHashGrid(cell_size={self.cell_size}, keys={len(self._key_cells)}, "
+                f"cells={len(self._cells)})")
+
+
+# Made with Bob
@@ -3,13 +3,95 @@ Global Thermal Nuclear War - Target Management
 Handles target locations, status, and damage
 """
 
-from typing import Dict, Tuple
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from math import comb, sqrt
+from typing import Callable, Dict, Optional, Sequence, Tuple
 import random
 
+from src.game_logic.spatial import SpatialHashGrid
+
+# Damage model shared by Target.take_damage and TargetManager.resolve_impacts
+DAMAGE_PER_HIT = 0.3  # Each hit does 30% damage
+CASUALTY_RATE = 0.8  # 80% of population affected by damage
+DESTROYED_AT = 0.9  # Damage level at which a target is destroyed
+
+
+def expected_damage(warheads: int, accuracy: float, defense_level: float,
+                    damage_level: float = 0.0, population: int = 0,
+                    destroyed: bool = False) -> Dict:
+    """
+    Exact expected outcome of one take_damage call, without sampling
+    
+    Sums over every interception and hit count take_damage can roll.
+    Returns dict with expected_damage (increase in damage level),
+    destroy_probability (target destroyed afterwards), expected_casualties
+    and hit_probability
+    """
+    if destroyed:
+        return {'expected_damage': 0.0, 'destroy_probability': 1.0,
+                'expected_casualties': 0.0, 'hit_probability': 0.0}
+    
+    # Warheads left after defenses: all of them, or 1..warheads intercepted uniformly
+    surviving = {warheads: 1.0 - defense_level}
+    for remaining in range(warheads):
+        surviving[remaining] = surviving.get(remaining, 0.0) + defense_level / warheads
+    
+    # Probability of each hit count
+    hit_odds = {}
+    for remaining, p_remaining in surviving.items():
+        for hits in range(1, remaining + 1):
+            p_hits = comb(remaining, hits) * accuracy ** hits * (1 - accuracy) ** (remaining - hits)
+            hit_odds[hits] = hit_odds.get(hits, 0.0) + p_remaining * p_hits
+    
+    result = {'expected_damage': 0.0, 'destroy_probability': 0.0,
+              'expected_casualties': 0.0, 'hit_probability': 0.0}
+    for hits, p in hit_odds.items():
+        total_damage = min(1.0, hits * DAMAGE_PER_HIT)
+        new_level = min(1.0, damage_level + total_damage)
+        casualties = int(population * (total_damage * CASUALTY_RATE)
+                         * (1 - new_level + total_damage))
+        result['expected_damage'] += p * (new_level - damage_level)
+        result['expected_casualties'] += p * casualties
+        result['hit_probability'] += p
+        if new_level >= DESTROYED_AT:
+            result['destroy_probability'] += p
+    
+    if damage_level >= DESTROYED_AT:
+        result['destroy_probability'] = 1.0
+    return result
+
+
+_STRIKE_TABLE = {}  # (target_type, MissileType) -> expected_damage() result
+
+
+def expected_damage_table(missile_types: Dict) -> Dict:
+    """
+    Expected outcome of each missile type against an undamaged target of each type
+    Returns dict keyed by (target_type, missile type name); entries are cached
+    """
+    from src.utils.config import TARGET_TYPES
+    
+    table = {}
+    for target_type, type_config in TARGET_TYPES.items():
+        for name, missile_type in missile_types.items():
+            key = (target_type, missile_type)
+            if key not in _STRIKE_TABLE:
+                _STRIKE_TABLE[key] = expected_damage(
+                    missile_type.warheads, missile_type.accuracy,
+                    type_config['defense_level'], population=type_config['population'])
+            table[(target_type, name)] = dict(_STRIKE_TABLE[key])
+    return table
+
 
 class Target:
     """Represents a target location on the map"""
     
+    __slots__ = ('name', 'target_type', 'x', 'y', 'population', 'strategic_value',
+                 'defense_level', 'destroyed', 'damage_level', 'casualties', 'hit_count',
+                 '_listener')
+    
     def __init__(self, name: str, target_type: str, x: int, y: int, 
                  population: int, strategic_value: int, defense_level: float):
         self.name = name
@@ -23,10 +105,13 @@ class Target:
         self.damage_level = 0.0  # 0.0 to 1.0
         self.casualties = 0
         self.hit_count = 0
+        self._listener = None  # TargetManager keeping aggregates for this target
         
-    def take_damage(self, warheads: int, accuracy: float) -> Dict:
+    def take_damage(self, warheads: int, accuracy: float, rng=None) -> Dict:
         """
         Apply damage to the target
+        Rolls come from rng, else the managing TargetManager's rng, else the
+        random module
         Returns dict with damage results
         """
         if self.destroyed:
@@ -37,9 +122,12 @@ class Target:
                 'message': f"{self.name} is already destroyed"
             }
         
+        if rng is None:
+            rng = self._listener.rng if self._listener is not None else random
+        
         # Check if defense systems intercept
-        if random.random() < self.defense_level:
-            intercepted = random.randint(1, warheads)
+        if rng.random() < self.defense_level:
+            intercepted = rng.randint(1, warheads)
             warheads -= intercepted
             if warheads <= 0:
                 return {
@@ -51,7 +139,7 @@ class Target:
                 }
         
         # Calculate hits based on accuracy
-        hits = sum(1 for _ in range(warheads) if random.random() < accuracy)
+        hits = sum(1 for _ in range(warheads) if rng.random() < accuracy)
         
         if hits == 0:
             return {
@@ -62,22 +150,26 @@ class Target:
             }
         
         # Calculate damage
-        damage_per_hit = 0.3  # Each hit does 30% damage
-        total_damage = min(1.0, hits * damage_per_hit)
+        total_damage = min(1.0, hits * DAMAGE_PER_HIT)
         self.damage_level = min(1.0, self.damage_level + total_damage)
         self.hit_count += hits
         
         # Calculate casualties
-        casualty_rate = total_damage * 0.8  # 80% of population affected by damage
-        new_casualties = int(self.population * casualty_rate * (1 - self.damage_level + total_damage))
+        casualty_rate = total_damage * CASUALTY_RATE
+        new_casualties = int(self.population * casualty_rate
+                             * (1 - self.damage_level + total_damage))
         self.casualties += new_casualties
         
         # Check if destroyed
-        if self.damage_level >= 0.9:
+        if self.damage_level >= DESTROYED_AT:
             self.destroyed = True
             message = f"{self.name} has been DESTROYED! {self.casualties:,} casualties"
         else:
-            message = f"{self.name} hit by {hits} warhead(s). Damage: {int(self.damage_level * 100)}%"
+            message = (f"{self.name} hit by {hits} warhead(s). "
+                       f"Damage: {int(self.damage_level * 100)}%")
+        
+        if self._listener is not None:
+            self._listener._target_damaged(self, new_casualties)
         
         return {
             'hit': True,
@@ -125,6 +217,11 @@ class Target:
         ]
         return '\n'.join(info)
     
+    def expected_damage(self, warheads: int, accuracy: float) -> Dict:
+        """Expected result of take_damage(warheads, accuracy), without applying it"""
+        return expected_damage(warheads, accuracy, self.defense_level,
+                               self.damage_level, self.population, self.destroyed)
+    
     def distance_to(self, other: 'Target') -> float:
         """Calculate distance to another target"""
         dx = self.x - other.x
@@ -136,37 +233,550 @@ class Target:
 
 
 class TargetManager:
-    """Manages all targets in the game"""
+    """
+    Manages all targets in the game
     
-    def __init__(self):
+    Targets are also bucketed in spatial hash grids (one for the whole map,
+    one per country), keyed by their index in all_targets, so nearest-target
+    lookups only visit the cells around the query point.
+    
+    Per-country counters (destroyed, casualties, population) and the intact
+    targets are kept up to date by Target.take_damage, so the statistics
+    queries do not rescan the map. Change target state through take_damage
+    rather than by assigning attributes directly.
+    
+    Name, per-type and strategic-value indexes back the lookup helpers. They
+    are brought up to date on the first lookup after targets are added (on
+    whole columns in columnar mode), and each spatial grid on the first
+    nearest-target lookup that uses it, so bulk loads do not pay for them
+    up front.
+    
+    With columnar=True (requires numpy) target state lives in a TargetTable
+    and the lists hold TargetRow views onto it, created on first access.
+    
+    Countries registered with add_region() are loaded the first time a query
+    needs them; all_targets and targets only hold the loaded ones.
+    
+    Distances from launch sites to every target are computed once per site
+    and cached (targets never move), for range checks, flight times and AI
+    missile selection.
+    """
+    
+    def __init__(self, grid_cell_size: float = 10.0, columnar: bool = False, rng=None):
         self.targets = {}  # Dict[str, List[Target]]
+        self.rng = rng or random  # Damage rolls of managed targets (see src/utils/rng.py)
         self.all_targets = []  # List of all targets
+        self.table = None
+        if columnar:
+            from src.game_logic.target_table import TargetTable, TargetRowList
+            self.table = TargetTable()
+            self.table.listener = self
+            self.all_targets = TargetRowList(self.table)
+        self.grid_cell_size = grid_cell_size
+        self._grid = SpatialHashGrid(grid_cell_size)
+        self._country_grids = {}  # country -> SpatialHashGrid
+        # Running totals per country; the None key covers the whole map
+        self._totals = {None: self._new_totals()}
+        self._intact = {None: {}}  # country -> {index: None}, in insertion order
+        self._slots = {}  # id(target) -> index in all_targets (object mode)
+        self._countries = []  # index -> country (object mode)
+        self._by_name = {}  # name -> index of the first target with that name
+        self._by_type = {None: {}}  # country -> {target_type: [indexes]}
+        self._by_value = {None: []}  # country -> [(strategic_value, index)]
+        self._unsorted_values = set()  # Keys of _by_value needing a re-sort
+        self._indexed = 0  # Targets already in the name, type and value indexes
+        self._pending = {}  # country -> (loader or prefetch Future, bounds)
+        self._distance_rows = {}  # site index -> distance to every target, by index
+        self._executor = None  # Prefetch thread, started by prefetch(), stopped once all load
         
-    def add_target(self, country: str, target: Target):
-        """Add a target to the manager"""
-        if country not in self.targets:
+    @staticmethod
+    def _new_totals() -> Dict:
+        return {'destroyed': 0, 'casualties': 0, 'population': 0}
+    
+    def _add_country(self, country: str):
+        """Create the per-country containers"""
+        if self.table is not None:
+            from src.game_logic.target_table import TargetRowList
+            self.targets[country] = TargetRowList(self.table, [])
+        else:
             self.targets[country] = []
+        self._country_grids[country] = SpatialHashGrid(self.grid_cell_size)
+        self._totals[country] = self._new_totals()
+        self._intact[country] = {}
+        self._by_type[country] = {}
+        self._by_value[country] = []
+        
+    def add_target(self, country: str, target: Target) -> Target:
+        """
+        Add a target to the manager
+        Returns the stored target (a TargetRow copy in columnar mode)
+        """
+        if country not in self.targets:
+            self._add_country(country)
+        
+        index = len(self.all_targets)
+        if self.table is not None:
+            target = self.table.view(self.table.add_target(country, target))
+        else:
+            self._slots[id(target)] = index
+            self._countries.append(country)
+            target._listener = self
+            self.all_targets.append(target)
         self.targets[country].append(target)
-        self.all_targets.append(target)
+        
+        for key in (None, country):
+            totals = self._totals[key]
+            totals['population'] += target.population
+            totals['casualties'] += target.casualties
+            if target.destroyed:
+                totals['destroyed'] += 1
+            else:
+                self._intact[key][index] = None
+        return target
+    
+    def add_targets(self, countries: list, types: list, columns: Dict) -> range:
+        """
+        Bulk-add undamaged targets from parallel columns
+        
+        columns['country'] and columns['type'] hold indexes into countries
+        and types; x, y, population, strategic_value, defense_level and name
+        hold the per-target values (arrays or lists). In columnar mode this is
+        a handful of array copies. Returns the indexes of the new targets
+        """
+        if self.table is None:
+            start = len(self.all_targets)
+            # Plain Python values, not NumPy scalars, on Target objects
+            values = [columns[name] for name in ('country', 'type', 'name', 'x', 'y', 'population',
+                                                 'strategic_value', 'defense_level')]
+            values = [v.tolist() if hasattr(v, 'tolist') else v for v in values]
+            for row in zip(*values):
+                country, target_type, name, x, y, population, value, defense = row
+                self.add_target(countries[country], Target(
+                    name, types[target_type], x, y, population, value, defense))
+            return range(start, len(self.all_targets))
+        
+        import numpy as np
+        
+        rows = self.table.extend(countries, types, columns)
+        country_ids = np.asarray(columns['country'], dtype=np.int64)
+        population = np.bincount(country_ids, weights=np.asarray(columns['population']),
+                                 minlength=len(countries))
+        new_rows = np.arange(rows.start, rows.stop)
+        for position, country in enumerate(countries):
+            country_rows = new_rows[country_ids == position].tolist()
+            if not country_rows:
+                continue
+            if country not in self.targets:
+                self._add_country(country)
+            self.targets[country].rows.extend(country_rows)
+            self._intact[country].update(dict.fromkeys(country_rows))
+            self._totals[country]['population'] += int(population[position])
+        self._intact[None].update(dict.fromkeys(rows))
+        self._totals[None]['population'] += int(population.sum())
+        return rows
+    
+    def add_region(self, country: str, loader: Callable[[], Tuple],
+                   bounds: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Register a country whose targets are loaded on first use
+        
+        loader takes no arguments and returns the (countries, types, columns)
+        arguments of add_targets(). bounds (min_x, min_y, max_x, max_y) lets
+        whole-map nearest-target lookups skip the country while it is out
+        of reach; without it any such lookup loads the country.
+        """
+        self._pending[country] = (loader, bounds)
+    
+    def get_pending_countries(self) -> list:
+        """Registered countries not loaded yet"""
+        return list(self._pending)
+    
+    def prefetch(self, countries: Sequence[str] = None) -> list:
+        """
+        Run the loaders of pending countries (all by default) on a background
+        thread. The targets join the map on the next query that needs them
+        (or load_regions()), on the calling thread
+        Returns the Futures of the loaders started
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='target-prefetch')
+        
+        futures = []
+        for country in (self.get_pending_countries() if countries is None else countries):
+            entry = self._pending.get(country)
+            if entry is None or isinstance(entry[0], Future):
+                continue
+            future = self._executor.submit(entry[0])
+            self._pending[country] = (future, entry[1])
+            futures.append(future)
+        return futures
+    
+    def load_regions(self, countries: Sequence[str] = None):
+        """Load pending countries now (all by default), waiting for prefetches"""
+        for country in (self.get_pending_countries() if countries is None else countries):
+            entry = self._pending.pop(country, None)
+            if entry is None:
+                continue
+            loader = entry[0]
+            self.add_targets(*(loader.result() if isinstance(loader, Future) else loader()))
+        if not self._pending:
+            self._shutdown_executor()
+    
+    def close(self):
+        """
+        Stop the prefetch thread once the loaders already submitted finish
+        Their countries still join the map on the next query that needs them
+        """
+        self._shutdown_executor()
+    
+    def _shutdown_executor(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _require(self, country: str = None):
+        """Load a pending country before a query (every pending one for None)"""
+        if self._pending:
+            self.load_regions(None if country is None else [country])
+    
+    def _country_at(self, index: int) -> str:
+        """Country of the target at an index"""
+        if self.table is not None:
+            return self.table.country_of(index)
+        return self._countries[index]
+    
+    def _target_damaged(self, target: Target, new_casualties: int):
+        """Called by Target.take_damage to update the running totals"""
+        index = self.index_of(target)
+        for key in (None, self._country_at(index)):
+            totals = self._totals[key]
+            totals['casualties'] += new_casualties
+            if target.destroyed and index in self._intact[key]:
+                del self._intact[key][index]
+                totals['destroyed'] += 1
+    
+    def _update_indexes(self):
+        """Add targets added since the last lookup to the name, type and value indexes"""
+        start, stop = self._indexed, len(self.all_targets)
+        if start == stop:
+            return
+        
+        if self.table is not None:
+            self._index_rows(start, stop)
+            self._indexed = stop
+            return
+        
+        targets = self.all_targets[start:stop]
+        columns = [[t.name for t in targets], [t.target_type for t in targets],
+                   [t.strategic_value for t in targets], self._countries[start:stop]]
+        for index, (name, target_type, value, country) in enumerate(zip(*columns), start):
+            self._by_name.setdefault(name, index)
+            for key in (None, country):
+                self._by_type[key].setdefault(target_type, []).append(index)
+                self._by_value[key].append((value, index))
+                self._unsorted_values.add(key)
+        self._indexed = stop
+    
+    def _index_rows(self, start: int, stop: int):
+        """
+        _update_indexes for a block of table rows, on whole columns
+        Rows are grouped with a stable sort, so every index list stays in
+        row order and each value list arrives sorted
+        """
+        import numpy as np
+        
+        table = self.table
+        rows = np.arange(start, stop)
+        country_ids = table.country_id[start:stop]
+        type_ids = table.type_id[start:stop]
+        
+        def runs(*keys):
+            """(first key values, rows) of each run of equal keys, in key order"""
+            order = np.lexsort(keys[::-1])
+            keys = [key[order] for key in keys]
+            change = np.zeros(len(order), dtype=bool)
+            change[0] = True
+            for key in keys:
+                change[1:] |= key[1:] != key[:-1]
+            heads = np.flatnonzero(change)
+            return (zip(*(key[heads].tolist() for key in keys)),
+                    np.split(rows[order], heads[1:]))
+        
+        # Reversed, so the first row with a name wins; names indexed before keep theirs
+        names = dict(zip(reversed(table.names[start:stop]), range(stop - 1, start - 1, -1)))
+        names.update((name, self._by_name[name]) for name in names.keys() & self._by_name.keys())
+        self._by_name.update(names)
+        
+        for (target_type,), indexes in zip(*runs(type_ids)):
+            self._by_type[None].setdefault(table.type_names[target_type], []).extend(
+                indexes.tolist())
+        for (country, target_type), indexes in zip(*runs(country_ids, type_ids)):
+            self._by_type[table.countries[country]].setdefault(
+                table.type_names[target_type], []).extend(indexes.tolist())
+        
+        blocks = [(None, rows)]
+        blocks += [(table.countries[country], indexes)
+                   for (country,), indexes in zip(*runs(country_ids))]
+        for key, indexes in blocks:
+            block_values = table.strategic_value[indexes]
+            order = np.argsort(block_values, kind='stable')
+            by_value = self._by_value[key]
+            if by_value:
+                self._unsorted_values.add(key)
+            by_value.extend(zip(block_values[order].tolist(), indexes[order].tolist()))
+        
+    def snapshot(self):
+        """Damage state of every target, for restore() (loads pending countries)"""
+        self._require()
+        if self.table is not None:
+            return self.table.snapshot()
+        return [(t.damage_level, t.casualties, t.hit_count, t.destroyed) for t in self.all_targets]
+    
+    def restore(self, snapshot):
+        """Roll every target back to a snapshot() and recompute the aggregates"""
+        if self.table is not None:
+            self.table.restore(snapshot)
+        else:
+            for target, state in zip(self.all_targets, snapshot):
+                target.damage_level, target.casualties, target.hit_count, target.destroyed = state
+        self._rebuild_aggregates()
+    
+    def _rebuild_aggregates(self):
+        """Recompute the running totals and intact index from target state"""
+        for key, intact in self._intact.items():
+            intact.clear()
+            self._totals[key].update(destroyed=0, casualties=0)
+        
+        if self.table is not None:
+            import numpy as np
+            
+            intact_rows = np.flatnonzero(~self.table.column('destroyed'))
+            self._intact[None].update(dict.fromkeys(intact_rows.tolist()))
+            country_ids = self.table.column('country_id')[intact_rows]
+            for position, country in enumerate(self.table.countries):
+                self._intact[country].update(
+                    dict.fromkeys(intact_rows[country_ids == position].tolist()))
+            country_totals = self.table.country_totals()
+        else:
+            for index, target in enumerate(self.all_targets):
+                if not target.destroyed:
+                    self._intact[None][index] = None
+                    self._intact[self._countries[index]][index] = None
+            country_totals = {country: {
+                'destroyed': sum(1 for t in targets if t.destroyed),
+                'casualties': sum(t.casualties for t in targets),
+            } for country, targets in self.targets.items()}
+        for country, totals in country_totals.items():
+            for key in (None, country):
+                self._totals[key]['destroyed'] += totals['destroyed']
+                self._totals[key]['casualties'] += totals['casualties']
+    
+    def index_of(self, target: Target) -> int:
+        """Position of a managed target in all_targets"""
+        if self.table is not None:
+            return target.row
+        return self._slots[id(target)]
+    
+    def _slot(self, target: Target) -> Optional[int]:
+        """Position of target in all_targets, or None if this manager does not own it"""
+        if self.table is not None:
+            return target.row if getattr(target, 'table', None) is self.table else None
+        index = self._slots.get(id(target))
+        if index is None or self.all_targets[index] is not target:
+            return None
+        return index
+    
+    def get_launch_site(self, country: str) -> Optional[Target]:
+        """Where a country launches from (simplified: its first target)"""
+        targets = self.get_targets_by_country(country)
+        return targets[0] if targets else None
+    
+    def distances_from(self, site: Target):
+        """
+        Distances from a managed target (a launch site) to every target,
+        indexed like all_targets. Computed once per site and extended when
+        targets are added; a NumPy array in columnar mode, else a list
+        """
+        index = self.index_of(site)
+        row = self._distance_rows.get(index)
+        start, stop = (0 if row is None else len(row)), len(self.all_targets)
+        if start == stop:
+            return row
+        
+        # Same formula as Missile distances, so range checks agree exactly
+        if self.table is not None:
+            import numpy as np
+            
+            dx = self.table.x[start:stop] - site.x
+            dy = self.table.y[start:stop] - site.y
+            new = np.sqrt((dx * dx + dy * dy).astype(np.float64))
+            row = new if row is None else np.concatenate((row, new))
+        else:
+            x, y = site.x, site.y
+            new = [sqrt((t.x - x) * (t.x - x) + (t.y - y) * (t.y - y))
+                   for t in self.all_targets[start:stop]]
+            row = new if row is None else row + new
+        self._distance_rows[index] = row
+        return row
+    
+    def distance(self, site: Target, target: Target) -> float:
+        """
+        Cached distance between a launch site and a target
+        Falls back to Target.distance_to when either is not managed here
+        """
+        index = self._slot(target)
+        if index is None or self._slot(site) is None:
+            return site.distance_to(target)
+        return float(self.distances_from(site)[index])
+    
+    def in_range(self, site: Target, target: Target, missile_type) -> bool:
+        """Whether a missile type launched from site reaches target"""
+        return self.distance(site, target) <= missile_type.range
+    
+    def flight_time(self, site: Target, target: Target, missile_type) -> float:
+        """Flight time of a missile type from site to target"""
+        return self.distance(site, target) / missile_type.speed
+    
+    def resolve_impacts(self, indexes, warheads, accuracy, rng=None) -> Dict:
+        """
+        Resolve a whole tick of impacts at once (requires numpy)
+        
+        indexes, warheads and accuracy are parallel sequences, one entry per
+        impact, with indexes into all_targets. Each impact follows the
+        take_damage rules, but the per-warhead rolls become binomial draws
+        from rng (a numpy Generator; by default the manager's BlockRandom
+        generator, or one seeded from the manager's rng). Several impacts on
+        one target are applied in order.
+        
+        Returns dict of per-impact arrays: hit, destroyed, hits, casualties
+        """
+        import numpy as np
+        
+        if rng is None:
+            rng = getattr(self.rng, 'generator', None)
+        if rng is None:
+            rng = np.random.default_rng(self.rng.getrandbits(64))
+        indexes = np.asarray(indexes, dtype=np.int64)
+        warheads = np.asarray(warheads, dtype=np.int64)
+        accuracy = np.asarray(accuracy, dtype=np.float64)
+        count = indexes.size
+        
+        # Current state of every target hit this tick
+        unique, inverse = np.unique(indexes, return_inverse=True)
+        if self.table is not None:
+            state = {name: self.table.column(name)[unique] for name in
+                     ('defense_level', 'population', 'damage_level', 'casualties',
+                      'hit_count', 'destroyed')}
+        else:
+            targets = [self.all_targets[i] for i in unique.tolist()]
+            state = {name: np.array([getattr(t, name) for t in targets]) for name in
+                     ('defense_level', 'population', 'damage_level', 'casualties',
+                      'hit_count', 'destroyed')}
+        was_destroyed = state['destroyed'].copy()
+        old_casualties = state['casualties'].copy()
+        
+        # Defense interception, then one binomial draw per impact
+        intercepted = np.where(rng.random(count) < state['defense_level'][inverse],
+                               rng.integers(1, np.maximum(warheads, 1), endpoint=True), 0)
+        hits = rng.binomial(np.maximum(warheads - intercepted, 0), accuracy)
+        total_damage = np.minimum(1.0, hits * DAMAGE_PER_HIT)
+        
+        # Rank of each impact among impacts on the same target
+        order = np.argsort(inverse, kind='stable')
+        per_target = np.bincount(inverse)
+        rank = np.empty(count, dtype=np.int64)
+        rank[order] = np.arange(count) - np.repeat(np.cumsum(per_target) - per_target, per_target)
+        
+        hit = np.zeros(count, dtype=np.bool_)
+        destroyed = np.zeros(count, dtype=np.bool_)
+        casualties = np.zeros(count, dtype=np.int64)
+        for round_number in range(int(per_target.max()) if count else 0):
+            impacts = np.flatnonzero(rank == round_number)
+            impacts = impacts[(hits[impacts] > 0) & ~state['destroyed'][inverse[impacts]]]
+            rows = inverse[impacts]
+            damage = total_damage[impacts]
+            
+            damage_level = np.minimum(1.0, state['damage_level'][rows] + damage)
+            new_casualties = (state['population'][rows] * (damage * CASUALTY_RATE)
+                              * (1 - damage_level + damage)).astype(np.int64)
+            state['damage_level'][rows] = damage_level
+            state['hit_count'][rows] += hits[impacts]
+            state['casualties'][rows] += new_casualties
+            state['destroyed'][rows] = damage_level >= DESTROYED_AT
+            
+            hit[impacts] = True
+            destroyed[impacts] = state['destroyed'][rows]
+            casualties[impacts] = new_casualties
+        
+        # Write the new state back
+        if self.table is not None:
+            for name in ('damage_level', 'casualties', 'hit_count', 'destroyed'):
+                self.table.column(name)[unique] = state[name]
+            countries = self.table.countries
+            country_ids = self.table.column('country_id')[unique]
+        else:
+            for i, target in enumerate(targets):
+                target.damage_level = state['damage_level'][i].item()
+                target.casualties = state['casualties'][i].item()
+                target.hit_count = state['hit_count'][i].item()
+                target.destroyed = bool(state['destroyed'][i])
+            countries = list(self.targets)
+            positions = {country: i for i, country in enumerate(countries)}
+            country_ids = np.array([positions[self._countries[i]] for i in unique.tolist()],
+                                   dtype=np.int64)
+        
+        # Update the running totals per country in one pass
+        added = np.bincount(country_ids, weights=state['casualties'] - old_casualties,
+                            minlength=len(countries))
+        newly_destroyed = state['destroyed'] & ~was_destroyed
+        lost = np.bincount(country_ids, weights=newly_destroyed, minlength=len(countries))
+        for country, casualties_added, destroyed_count in zip(countries, added.tolist(),
+                                                              lost.tolist()):
+            for key in (None, country):
+                self._totals[key]['casualties'] += int(casualties_added)
+                self._totals[key]['destroyed'] += int(destroyed_count)
+        for index, country_id in zip(unique[newly_destroyed].tolist(),
+                                     country_ids[newly_destroyed].tolist()):
+            del self._intact[None][index]
+            del self._intact[countries[country_id]][index]
+        
+        return {'hit': hit, 'destroyed': destroyed, 'hits': np.where(hit, hits, 0),
+                'casualties': casualties}
     
     def get_targets_by_country(self, country: str) -> list:
         """Get all targets for a country"""
+        self._require(country)
         return self.targets.get(country, [])
     
     def get_target_by_name(self, name: str) -> Target:
         """Find a target by name"""
-        for target in self.all_targets:
-            if target.name == name:
-                return target
-        return None
+        self._require()
+        self._update_indexes()
+        index = self._by_name.get(name)
+        return self.all_targets[index] if index is not None else None
+    
+    def get_targets_by_type(self, target_type: str, country: str = None) -> list:
+        """Get all targets of a type ('CITY', 'MISSILE_SILO', ...)"""
+        self._require(country or None)
+        self._update_indexes()
+        indexes = self._by_type.get(country or None, {}).get(target_type, [])
+        return [self.all_targets[index] for index in indexes]
     
     def get_intact_targets(self, country: str = None) -> list:
         """Get all intact (not destroyed) targets"""
-        if country:
-            targets = self.get_targets_by_country(country)
-        else:
-            targets = self.all_targets
-        return [t for t in targets if not t.destroyed]
+        self._require(country or None)
+        all_targets = self.all_targets
+        return [all_targets[index] for index in self._intact.get(country or None, ())]
+    
+    def get_intact_indexes(self, country: str = None) -> list:
+        """Indexes in all_targets of the intact targets (no target objects built)"""
+        self._require(country or None)
+        return list(self._intact.get(country or None, ()))
+    
+    def count_intact_targets(self, country: str = None) -> int:
+        """Number of intact targets, without building a list"""
+        self._require(country or None)
+        return len(self._intact.get(country or None, ()))
     
     def get_destroyed_targets(self, country: str = None) -> list:
         """Get all destroyed targets"""
@@ -178,102 +788,191 @@ class TargetManager:
     
     def get_high_value_targets(self, country: str = None, min_value: int = 100) -> list:
         """Get high-value targets that are still intact"""
-        intact = self.get_intact_targets(country)
-        return [t for t in intact if t.strategic_value >= min_value]
+        self._require(country or None)
+        self._update_indexes()
+        key = country or None
+        intact = self._intact.get(key, {})
+        values = self._sorted_values(key)
+        start = bisect_left(values, (min_value, -1))
+        
+        # Few intact targets left: filtering them beats walking the value index
+        if len(values) - start >= len(intact):
+            targets = (self.all_targets[index] for index in intact)
+            return [t for t in targets if t.strategic_value >= min_value]
+        
+        indexes = sorted(index for _, index in values[start:] if index in intact)
+        return [self.all_targets[index] for index in indexes]
+    
+    def _sorted_values(self, key: str) -> list:
+        """Strategic-value index for a country, sorted lazily after additions"""
+        values = self._by_value.get(key, [])
+        if key in self._unsorted_values:
+            values.sort()
+            self._unsorted_values.discard(key)
+        return values
     
     def get_total_casualties(self, country: str = None) -> int:
-        """Get total casualties"""
-        if country:
-            targets = self.get_targets_by_country(country)
-        else:
-            targets = self.all_targets
-        return sum(t.casualties for t in targets)
+        """Get total casualties (countries not loaded yet have none)"""
+        totals = self._totals.get(country or None)
+        return totals['casualties'] if totals else 0
     
     def get_total_population(self, country: str = None) -> int:
         """Get total population"""
-        if country:
-            targets = self.get_targets_by_country(country)
-        else:
-            targets = self.all_targets
-        return sum(t.population for t in targets)
+        self._require(country or None)
+        totals = self._totals.get(country or None)
+        return totals['population'] if totals else 0
     
     def get_destruction_percentage(self, country: str = None) -> float:
         """Get percentage of targets destroyed"""
-        if country:
-            targets = self.get_targets_by_country(country)
-        else:
-            targets = self.all_targets
+        self._require(country or None)
+        targets = self.get_targets_by_country(country) if country else self.all_targets
         
         if not targets:
             return 0.0
         
-        destroyed = len([t for t in targets if t.destroyed])
+        destroyed = self._totals[country or None]['destroyed']
         return (destroyed / len(targets)) * 100
     
     def get_statistics(self) -> Dict:
         """Get overall statistics"""
+        self._require()
+        totals = self._totals[None]
         return {
             'total_targets': len(self.all_targets),
-            'destroyed': len(self.get_destroyed_targets()),
-            'intact': len(self.get_intact_targets()),
-            'total_casualties': self.get_total_casualties(),
-            'total_population': self.get_total_population(),
+            'destroyed': totals['destroyed'],
+            'intact': self.count_intact_targets(),
+            'total_casualties': totals['casualties'],
+            'total_population': totals['population'],
             'destruction_rate': self.get_destruction_percentage(),
         }
     
     def get_nearest_target(self, x: int, y: int, country: str = None, 
                           intact_only: bool = True) -> Target:
-        """Find the nearest target to given coordinates"""
-        if country:
-            targets = self.get_targets_by_country(country)
-        else:
-            targets = self.all_targets
+        """
+        Find the nearest target to given coordinates
+        Ties go to the target added first
         
-        if intact_only:
-            targets = [t for t in targets if not t.destroyed]
+        Whole-map lookups only load the pending countries whose bounds are
+        closer than the nearest loaded target.
+        """
+        if country:
+            self._require(country)
+        best = self._nearest(x, y, country, intact_only)
+        while self._pending and not country:
+            reach = best[0] if best else float('inf')
+            near = [c for c, (_, bounds) in self._pending.items()
+                    if bounds is None or _bounds_distance(bounds, x, y) < reach]
+            if not near:
+                break
+            self.load_regions(near)
+            best = self._nearest(x, y, country, intact_only)
         
-        if not targets:
+        return self.all_targets[best[1]] if best else None
+    
+    def _update_grid(self, country: str = None) -> Optional[SpatialHashGrid]:
+        """
+        Add targets added since the last nearest-target lookup to the whole-map
+        grid (or one country's), built only once a lookup needs it
+        Returns the grid, or None for an unknown country
+        """
+        grid = self._country_grids.get(country) if country else self._grid
+        if grid is None:
             return None
+        targets = self.targets[country] if country else self.all_targets
+        start = len(grid)  # Grids hold the first len(grid) targets of their list
+        if start == len(targets):
+            return grid
         
-        # Calculate distances
-        distances = []
-        for target in targets:
-            dx = target.x - x
-            dy = target.y - y
-            dist = (dx * dx + dy * dy) ** 0.5
-            distances.append((dist, target))
+        if self.table is not None:
+            import numpy as np
+            
+            if country:
+                indexes = np.asarray(targets.rows[start:], dtype=np.int64)
+            else:
+                indexes = np.arange(start, len(targets))
+            size = self.grid_cell_size
+            cells = zip(np.floor(self.table.x[indexes] / size).astype(np.int64).tolist(),
+                        np.floor(self.table.y[indexes] / size).astype(np.int64).tolist())
+            indexes = indexes.tolist()
+        else:
+            new = targets[start:]
+            indexes = [self._slots[id(t)] for t in new] if country else range(start, len(targets))
+            cells = (grid.cell_of(t.x, t.y) for t in new)
+        grid.insert_many(indexes, list(cells))
+        return grid
+    
+    def _nearest(self, x: int, y: int, country: str, intact_only: bool):
+        """(distance, index) of the nearest loaded target, or None"""
+        grid = self._update_grid(country)
+        if grid is None:
+            return None
         
-        # Return nearest
-        distances.sort(key=lambda x: x[0])
-        return distances[0][1] if distances else None
+        best = None  # (distance, index)
+        for min_distance, indexes in grid.rings(x, y):
+            if best is not None and best[0] < min_distance:
+                break
+            for index in indexes:
+                target = self.all_targets[index]
+                if intact_only and target.destroyed:
+                    continue
+                dx = target.x - x
+                dy = target.y - y
+                candidate = ((dx * dx + dy * dy) ** 0.5, index)
+                if best is None or candidate < best:
+                    best = candidate
+        return best
     
     def __repr__(self):
-        return f"TargetManager(countries={len(self.targets)}, targets={len(self.all_targets)})"
+        pending = f", pending={len(self._pending)}" if self._pending else ""
+        return (f"TargetManager(countries={len(self.targets)}, "
+                f"targets={len(self.all_targets)}{pending})")
+
+
+def _bounds_distance(bounds: Tuple[int, int, int, int], x: float, y: float) -> float:
+    """Distance from a point to a (min_x, min_y, max_x, max_y) box"""
+    min_x, min_y, max_x, max_y = bounds
+    dx = max(min_x - x, 0, x - max_x)
+    dy = max(min_y - y, 0, y - max_y)
+    return (dx * dx + dy * dy) ** 0.5
 
 
-def create_targets_from_config(config_targets: Dict) -> TargetManager:
-    """Create TargetManager from configuration"""
+def _config_region(country: str, target_list: list) -> Tuple:
+    """add_targets() arguments for one country of a WORLD_TARGETS-style config"""
     from src.utils.config import TARGET_TYPES
     
-    manager = TargetManager()
+    types = list(TARGET_TYPES)
+    type_ids = {name: i for i, name in enumerate(types)}
+    type_configs = [TARGET_TYPES[t['type']] for t in target_list]
+    columns = {
+        'country': [0] * len(target_list),
+        'type': [type_ids[t['type']] for t in target_list],
+        'name': [t['name'] for t in target_list],
+        'x': [t['x'] for t in target_list],
+        'y': [t['y'] for t in target_list],
+        'population': [c['population'] for c in type_configs],
+        'strategic_value': [c['strategic_value'] for c in type_configs],
+        'defense_level': [c['defense_level'] for c in type_configs],
+    }
+    return [country], types, columns
+
+
+def create_targets_from_config(config_targets: Dict, columnar: bool = False,
+                               lazy: bool = False, rng=None) -> TargetManager:
+    """
+    Create TargetManager from configuration
+    With lazy=True each country is loaded the first time it is queried
+    """
+    manager = TargetManager(columnar=columnar, rng=rng)
     
     for country, target_list in config_targets.items():
-        for target_data in target_list:
-            target_type = target_data['type']
-            type_config = TARGET_TYPES[target_type]
-            
-            target = Target(
-                name=target_data['name'],
-                target_type=target_type,
-                x=target_data['x'],
-                y=target_data['y'],
-                population=type_config['population'],
-                strategic_value=type_config['strategic_value'],
-                defense_level=type_config['defense_level']
-            )
-            
-            manager.add_target(country, target)
+        if not target_list:
+            continue
+        bounds = (min(t['x'] for t in target_list), min(t['y'] for t in target_list),
+                  max(t['x'] for t in target_list), max(t['y'] for t in target_list))
+        manager.add_region(country, partial(_config_region, country, target_list), bounds)
     
+    if not lazy:
+        manager.load_regions()
     return manager
 
 
@@ -0,0 +1,265 @@
+"""
+Global Thermal Nuclear War - Columnar Target Table
+Structure-of-arrays target storage for very large world maps
+"""
+
+from collections.abc import Sequence
+from typing import Dict
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.game_logic.target import Target
+
+
+class TargetTable:
+    """
+    Columnar store for targets.
+
+    Every target occupies one row in a set of parallel NumPy arrays, so
+    statistics, AI scoring and snapshots work on whole columns instead of
+    walking a million Target objects.
+    """
+
+    # Columns changed by Target.take_damage (what a snapshot has to save)
+    MUTABLE_COLUMNS = ('damage_level', 'casualties', 'hit_count', 'destroyed')
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise ImportError("TargetTable requires numpy (pip install numpy)")
+
+        self.size = 0
+        self.names = []
+        self.countries = []  # country_id -> country
+        self.type_names = []  # type_id -> target type
+        self._country_ids = {}
+        self._type_ids = {}
+        self._views = []  # Cached TargetRow per row, created on first access
+        self.listener = None  # Handed to every TargetRow (the owning TargetManager)
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int):
+        """Allocate (or grow) the column arrays"""
+        old_size = self.size
+        columns = {
+            'x': np.int64,
+            'y': np.int64,
+            'population': np.int64,
+            'strategic_value': np.int64,
+            'defense_level': np.float64,
+            'damage_level': np.float64,
+            'casualties': np.int64,
+            'hit_count': np.int64,
+            'destroyed': np.bool_,
+            'country_id': np.int32,
+            'type_id': np.int32,
+        }
+        for name, dtype in columns.items():
+            column = np.zeros(capacity, dtype=dtype)
+            if old_size:
+                column[:old_size] = getattr(self, name)[:old_size]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def _grow(self, count: int):
+        """Make room for count more rows"""
+        capacity = self.capacity
+        while self.size + count > capacity:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._allocate(capacity)
+
+    def _intern(self, value: str, ids: dict, values: list) -> int:
+        """Small integer id for a repeated string (country or type)"""
+        if value not in ids:
+            ids[value] = len(values)
+            values.append(value)
+        return ids[value]
+
+    def add_target(self, country: str, target: Target) -> int:
+        """Copy a target's state into a new row and return the row"""
+        if self.size == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        row = self.size
+        self.x[row] = target.x
+        self.y[row] = target.y
+        self.population[row] = target.population
+        self.strategic_value[row] = target.strategic_value
+        self.defense_level[row] = target.defense_level
+        self.damage_level[row] = target.damage_level
+        self.casualties[row] = target.casualties
+        self.hit_count[row] = target.hit_count
+        self.destroyed[row] = target.destroyed
+        self.country_id[row] = self._intern(country, self._country_ids, self.countries)
+        self.type_id[row] = self._intern(target.target_type, self._type_ids, self.type_names)
+        self.names.append(target.name)
+        self._views.append(None)
+        self.size += 1
+        return row
+
+    def extend(self, countries: list, types: list, columns: Dict) -> range:
+        """
+        Append many targets from parallel columns in one vectorized write
+        columns['country'] and columns['type'] index into countries and types;
+        the other keys are x, y, population, strategic_value, defense_level
+        and name (a list of str). Returns the new rows
+        """
+        count = len(columns['name'])
+        self._grow(count)
+        start = self.size
+        rows = slice(start, start + count)
+
+        for name in ('x', 'y', 'population', 'strategic_value', 'defense_level'):
+            getattr(self, name)[rows] = columns[name]
+        self.damage_level[rows] = 0.0
+        self.casualties[rows] = 0
+        self.hit_count[rows] = 0
+        self.destroyed[rows] = False
+
+        # Translate the caller's ids into this table's interned ids
+        country_map = np.array([self._intern(c, self._country_ids, self.countries)
+                                for c in countries], dtype=np.int32)
+        type_map = np.array([self._intern(t, self._type_ids, self.type_names)
+                             for t in types], dtype=np.int32)
+        self.country_id[rows] = country_map[np.asarray(columns['country'], dtype=np.int64)]
+        self.type_id[rows] = type_map[np.asarray(columns['type'], dtype=np.int64)]
+
+        self.names.extend(columns['name'])
+        self._views.extend([None] * count)
+        self.size += count
+        return range(start, start + count)
+
+    def view(self, row: int) -> 'TargetRow':
+        """The TargetRow for a row (always the same object)"""
+        target = self._views[row]
+        if target is None:
+            target = self._views[row] = TargetRow(self, row)
+        return target
+
+    def country_of(self, row: int) -> str:
+        """Country a row belongs to"""
+        return self.countries[self.country_id[row]]
+
+    def column(self, name: str):
+        """View of one column trimmed to the used rows"""
+        return getattr(self, name)[:self.size]
+
+    def country_totals(self) -> Dict:
+        """
+        Destroyed, casualty and population totals per country in one pass
+        Returns dict keyed by country
+        """
+        country_id = self.column('country_id')
+        bins = len(self.countries)
+        destroyed = np.bincount(country_id, weights=self.column('destroyed'), minlength=bins)
+        casualties = np.bincount(country_id, weights=self.column('casualties'), minlength=bins)
+        population = np.bincount(country_id, weights=self.column('population'), minlength=bins)
+        return {
+            country: {
+                'destroyed': int(destroyed[i]),
+                'casualties': int(casualties[i]),
+                'population': int(population[i]),
+            }
+            for i, country in enumerate(self.countries)
+        }
+
+    def snapshot(self) -> Dict:
+        """Copy of the damage state of every row"""
+        return {name: self.column(name).copy() for name in self.MUTABLE_COLUMNS}
+
+    def restore(self, snapshot: Dict):
+        """Roll the damage state back to a snapshot (rows added since are kept)"""
+        for name, values in snapshot.items():
+            getattr(self, name)[:len(values)] = values
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"TargetTable(size={self.size}, countries={len(self.countries)})"
+
+
+class TargetRowList(Sequence):
+    """
+    List-like sequence of TargetRow views, created only when accessed
+    With rows=None it covers every row of the table (TargetManager.all_targets)
+    """
+
+    def __init__(self, table: TargetTable, rows: list = None):
+        self.table = table
+        self.rows = rows
+
+    def append(self, target: 'TargetRow'):
+        """Add a row of the table to the sequence"""
+        if self.rows is not None:
+            self.rows.append(target.row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = range(self.table.size)[index] if self.rows is None else self.rows[index]
+            return [self.table.view(row) for row in rows]
+        if self.rows is None:
+            if index < 0:
+                index += self.table.size
+            if not 0 <= index < self.table.size:
+                raise IndexError("target index out of range")
+            return self.table.view(index)
+        return self.table.view(self.rows[index])
+
+    def __iter__(self):
+        view = self.table.view
+        return (view(row) for row in (range(self.table.size) if self.rows is None else self.rows))
+
+    def __len__(self):
+        return self.table.size if self.rows is None else len(self.rows)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, TargetRowList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"TargetRowList(targets={len(self)})"
+
+
+def _table_column(name: str):
+    """Property reading and writing one scalar of a table column"""
+    def getter(self):
+        return getattr(self.table, name)[self.row].item()
+
+    def setter(self, value):
+        getattr(self.table, name)[self.row] = value
+
+    return property(getter, setter)
+
+
+class TargetRow(Target):
+    """
+    Target view onto one row of a TargetTable.
+    Exposes the regular Target API while the state lives in the table arrays.
+    """
+
+    __slots__ = ('table', 'row')
+
+    x = _table_column('x')
+    y = _table_column('y')
+    population = _table_column('population')
+    strategic_value = _table_column('strategic_value')
+    defense_level = _table_column('defense_level')
+    damage_level = _table_column('damage_level')
+    casualties = _table_column('casualties')
+    hit_count = _table_column('hit_count')
+    destroyed = _table_column('destroyed')
+
+    def __init__(self, table: TargetTable, row: int):
+        self.table = table
+        self.row = row
+        self.name = table.names[row]
+        self.target_type = table.type_names[table.type_id[row]]
+        self._listener = table.listener
+
+
+# Made with Bob
@@ -23,8 +23,9 @@ class TicTacToeAI:
     Plays perfectly - will never lose
     """
     
-    def __init__(self, symbol: TicTacToePlayer, difficulty: str = 'perfect'):
+    def __init__(self, symbol: TicTacToePlayer, difficulty: str = 'perfect', rng=None):
         self.symbol = symbol
+        self.rng = rng or random  # Random moves (see src/utils/rng.py)
         self.opponent_symbol = TicTacToePlayer.O if symbol == TicTacToePlayer.X else TicTacToePlayer.X
         self.difficulty = difficulty
         self.games_played = 0
@@ -36,7 +37,7 @@ class TicTacToeAI:
             return self._get_random_move(board)
         elif self.difficulty == 'easy':
             # 50% random, 50% optimal
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 return self._get_random_move(board)
         
         # Perfect play using minimax
@@ -65,7 +66,7 @@ class TicTacToeAI:
                 if board[i][j] == TicTacToePlayer.EMPTY.value:
                     empty_cells.append((i, j))
         
-        return random.choice(empty_cells) if empty_cells else None
+        return self.rng.choice(empty_cells) if empty_cells else None
     
     def _minimax(self, board: List[List[str]], depth: int, is_maximizing: bool) -> int:
         """
@@ -136,9 +137,10 @@ class TicTacToeGame:
     Supports Human vs AI and AI vs AI modes
     """
     
-    def __init__(self):
+    def __init__(self, rng=None):
         self.board = [[TicTacToePlayer.EMPTY.value for _ in range(3)] for _ in range(3)]
         self.current_player = TicTacToePlayer.X
+        self.rng = rng  # Handed to the AI players
         self.game_over = False
         self.winner = None
         self.move_count = 0
@@ -163,11 +165,12 @@ class TicTacToeGame:
         
         if mode == 'human_vs_ai':
             # Human is X, AI is O
-            self.ai_players[TicTacToePlayer.O] = TicTacToeAI(TicTacToePlayer.O, difficulty)
+            self.ai_players[TicTacToePlayer.O] = TicTacToeAI(TicTacToePlayer.O, difficulty,
+                                                             self.rng)
         elif mode == 'ai_vs_ai':
             # Both are AI
-            self.ai_players[TicTacToePlayer.X] = TicTacToeAI(TicTacToePlayer.X, 'perfect')
-            self.ai_players[TicTacToePlayer.O] = TicTacToeAI(TicTacToePlayer.O, 'perfect')
+            self.ai_players[TicTacToePlayer.X] = TicTacToeAI(TicTacToePlayer.X, 'perfect', self.rng)
+            self.ai_players[TicTacToePlayer.O] = TicTacToeAI(TicTacToePlayer.O, 'perfect', self.rng)
     
     def make_move(self, row: int, col: int) -> bool:
         """
@@ -0,0 +1,200 @@
+"""
+Global Thermal Nuclear War - Real-Time Loop
+Fixed-timestep simulation with render interpolation and non-blocking input
+"""
+
+import os
+import sys
+import time
+from typing import Callable, Dict, Optional
+
+try:
+    import msvcrt
+except ImportError:  # POSIX terminal
+    msvcrt = None
+    import select
+    import termios
+    import tty
+
+from src.utils.config import FRAME_RATE, MAX_FRAME_TIME, TICK_RATE
+
+
+class FixedTimestepLoop:
+    """
+    Fixed-timestep game loop
+
+    update(dt) always advances the simulation by the same dt (1 / tick_rate),
+    however long frames take: elapsed wall time goes into an accumulator and
+    is spent in whole ticks. render(alpha) runs once per frame, at most
+    frame_rate times a second, with alpha in [0, 1) the fraction of a tick
+    the clock has moved past the last update, for interpolating positions.
+
+    After a stall longer than max_frame_time (a slow update, a suspended
+    process) only max_frame_time is caught up; the rest is dropped rather
+    than run as a burst of ticks, and counted in the statistics.
+    """
+
+    # Tolerance when comparing the accumulator against dt, so rounding left
+    # over from subtracting whole ticks cannot stall the loop
+    EPSILON = 1e-9
+
+    def __init__(self, update: Callable[[float], None],
+                 render: Optional[Callable[[float], None]] = None,
+                 tick_rate: float = TICK_RATE, frame_rate: Optional[float] = FRAME_RATE,
+                 max_frame_time: float = MAX_FRAME_TIME,
+                 clock: Callable[[], float] = time.perf_counter,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.update = update
+        self.render = render
+        self.dt = 1.0 / tick_rate
+        self.frame_interval = 1.0 / frame_rate if frame_rate else self.dt
+        self.max_frame_time = max(max_frame_time, self.dt)
+        self.clock = clock
+        self.sleep = sleep
+        self.running = False
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Zero the tick, frame and timing counters"""
+        self.ticks = 0
+        self.frames = 0
+        self.slow_ticks = 0  # Updates that took longer than dt
+        self.dropped_time = 0.0
+        self.update_time = 0.0
+        self.max_update_time = 0.0
+        self.elapsed = 0.0
+
+    def stop(self):
+        """Leave run() after the current tick"""
+        self.running = False
+
+    def run(self, until: Optional[Callable[[], bool]] = None,
+            max_ticks: Optional[int] = None) -> Dict:
+        """
+        Run until stop(), until() returns True after a tick, or max_ticks
+        ticks have run
+        Returns get_statistics()
+        """
+        clock, dt = self.clock, self.dt
+        self.running = True
+        started = previous = next_frame = clock()
+        accumulator = 0.0
+
+        while self.running:
+            now = clock()
+            frame_time = now - previous
+            previous = now
+            if frame_time > self.max_frame_time:
+                self.dropped_time += frame_time - self.max_frame_time
+                frame_time = self.max_frame_time
+            accumulator += frame_time
+
+            while accumulator + self.EPSILON >= dt and self.running:
+                start = clock()
+                self.update(dt)
+                cost = clock() - start
+                self.update_time += cost
+                self.max_update_time = max(self.max_update_time, cost)
+                if cost > dt:
+                    self.slow_ticks += 1
+                accumulator -= dt
+                self.ticks += 1
+                if ((until is not None and until())
+                        or (max_ticks is not None and self.ticks >= max_ticks)):
+                    self.running = False
+
+            if self.render is not None and self.running and now >= next_frame:
+                self.render(max(0.0, accumulator) / dt)
+                self.frames += 1
+                # Frames skipped while busy are not made up
+                next_frame = max(next_frame + self.frame_interval, now)
+
+            if self.running:
+                # Sleep until the next tick or frame is due
+                wake = min(previous + dt - accumulator,
+                           next_frame if self.render is not None else previous + dt)
+                delay = wake - clock()
+                if delay > 0:
+                    self.sleep(delay)
+
+        self.elapsed += clock() - started
+        return self.get_statistics()
+
+    def get_statistics(self) -> Dict:
+        """Ticks and frames run, ticks dropped, and update timings"""
+        return {
+            'ticks': self.ticks,
+            'frames': self.frames,
+            'dropped_ticks': int(self.dropped_time / self.dt + 0.5),
+            'slow_ticks': self.slow_ticks,
+            'elapsed': self.elapsed,
+            'target_tick_rate': 1.0 / self.dt,
+            'tick_rate': self.ticks / self.elapsed if self.elapsed else 0.0,
+            'mean_update_ms': self.update_time / self.ticks * 1000 if self.ticks else 0.0,
+            'max_update_ms': self.max_update_time * 1000,
+        }
+
+    def __repr__(self):
+        return f"FixedTimestepLoop(tick_rate={1.0 / self.dt:g}, ticks={self.ticks})"
+
+
+class KeyboardInput:
+    """
+    Non-blocking keyboard reader, used as a context manager
+
+    On a POSIX terminal the stream is switched to cbreak mode for the
+    duration, so keys arrive as they are pressed instead of after Enter;
+    on exit the settings are restored and unread keys discarded, so they do
+    not leak into the next prompt. On Windows keys come from msvcrt. Piped
+    (non-terminal) input is read as it becomes available.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self._saved = None
+
+    def __enter__(self):
+        if msvcrt is None and self.stream.isatty():
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        return self
+
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            fd = self.stream.fileno()
+            termios.tcsetattr(fd, termios.TCSADRAIN, self._saved)
+            termios.tcflush(fd, termios.TCIFLUSH)
+            self._saved = None
+
+    def poll(self) -> str:
+        """Keys pressed since the last poll ('' if none); never blocks"""
+        keys = []
+        if msvcrt is not None:
+            while msvcrt.kbhit():
+                keys.append(msvcrt.getwch())
+            return ''.join(keys)
+
+        fd = self.stream.fileno()
+        while select.select([fd], [], [], 0)[0]:
+            data = os.read(fd, 1024)
+            if not data:  # End of input
+                break
+            keys.append(data.decode('utf-8', errors='ignore'))
+        return ''.join(keys)
+
+
+def flight_progress(missile, clock: float) -> float:
+    """Flight progress (0.0 to 1.0) of a launched missile at a manager clock time"""
+    if missile.total_flight_time <= 0:
+        return 1.0
+    return max(0.0, min(1.0, (clock - missile.launch_time) / missile.total_flight_time))
+
+
+if __name__ == "__main__":
+    # Test fixed-timestep loop
+    loop = FixedTimestepLoop(lambda dt: None, render=lambda alpha: None,
+                             tick_rate=60, frame_rate=30)
+    print(loop.run(max_ticks=60))
+
+# Made with Bob
@@ -9,6 +9,7 @@ A text-based terminal game inspired by WarGames (1983)
 import sys
 import time
 import os
+from collections import deque
 from pathlib import Path
 
 # Add parent directory to Python path
@@ -20,6 +21,7 @@ from colorama import init, Fore, Back, Style
 init(autoreset=True)
 
 from src.game_engine import GameEngine, GameMode, GameState
+from src.game_loop import FixedTimestepLoop, KeyboardInput, flight_progress
 from src.ui.ascii_art import (
     TITLE_SCREEN, WOPR_LOGO, create_menu, create_box,
     create_alert, create_stats_display
@@ -57,6 +59,11 @@ def print_yellow(text: str):
     print(Fore.YELLOW + text + Style.RESET_ALL)
 
 
+def redraw(lines: list):
+    """Repaint the whole screen in place (cursor home and clear, no subprocess)"""
+    print('\033[H\033[J' + '\n'.join(lines) + Style.RESET_ALL, end='', flush=True)
+
+
 def show_intro_sequence():
     """Show WarGames-style intro sequence"""
     clear_screen()
@@ -248,8 +255,261 @@ def show_tutorial():
     input(Fore.GREEN + "\nPress Enter to continue..." + Style.RESET_ALL)
 
 
+MISSILE_CYCLE = ('ICBM', 'SLBM', 'CRUISE')
+BANNER = "═" * 76
+
+
+class RealtimeGame:
+    """
+    Real-time campaign play on a FixedTimestepLoop
+    
+    Each tick reads the keys pressed since the last one, advances the engine
+    by the fixed timestep, and lets WOPR answer every launch once its
+    reaction time has passed. Missiles fly in game time; the screen is
+    redrawn at the frame rate with their progress interpolated between ticks.
+    
+    S, A and T swap the tactical map for the statistics, assets or
+    trajectory screen (any key returns); the simulation keeps running.
+    """
+    
+    VIEWS = {'S': 'stats', 'A': 'assets', 'T': 'trajectories'}
+    
+    def __init__(self, engine: GameEngine, keyboard: KeyboardInput):
+        self.engine = engine
+        self.keyboard = keyboard
+        self.loop = FixedTimestepLoop(self.tick, self.render)
+        self.selected = 0  # Position in the listed enemy targets
+        self.missile_type = 'ICBM'
+        self.view = 'map'
+        self.confirm_quit = False
+        self.peace_proposed = False
+        self.messages = deque(maxlen=6)  # (color, text)
+        self.responses = deque()  # Game times at which WOPR answers a launch
+        self._destroyed = 0  # Player kills and WOPR hits already reported
+        self._lost = 0
+    
+    def run(self) -> dict:
+        """Play until the game ends or the player quits; returns the loop statistics"""
+        engine = self.engine
+        return self.loop.run(
+            until=lambda: not engine.running or engine.state != GameState.PLAYING)
+    
+    def listed_targets(self) -> list:
+        """Enemy targets offered for launch (keys 1-9, 0)"""
+        return self.engine.target_manager.get_intact_targets('USSR')[:10]
+    
+    def tick(self, dt: float):
+        """One fixed simulation step"""
+        engine = self.engine
+        for key in self.keyboard.poll():
+            if engine.state == GameState.PLAYING:
+                self.handle_key(key.upper())
+        
+        engine.update(dt)
+        while self.responses and self.responses[0] <= engine.game_time:
+            self.responses.popleft()
+            self.wopr_turn()
+        self.report_impacts()
+    
+    def handle_key(self, key: str):
+        engine = self.engine
+        if self.confirm_quit:
+            self.confirm_quit = False
+            if key == 'Y':
+                engine.quit_game()
+        elif self.view != 'map':
+            self.view = 'map'  # Any key returns to the map
+        elif key.isdigit():
+            self.selected = (int(key) - 1) % 10
+        elif key == 'M':
+            position = MISSILE_CYCLE.index(self.missile_type)
+            self.missile_type = MISSILE_CYCLE[(position + 1) % len(MISSILE_CYCLE)]
+        elif key in ('L', '\n', '\r', ' '):
+            self.launch()
+        elif key in self.VIEWS:
+            self.view = self.VIEWS[key]
+        elif key == 'P':
+            # Propose peace
+            self.peace_proposed = True
+            engine.state = GameState.PEACE
+            engine.game_result = 'PEACE'
+        elif key == 'Q':
+            self.confirm_quit = True
+    
+    def launch(self):
+        """Launch the selected missile type at the selected target"""
+        engine = self.engine
+        targets = self.listed_targets()
+        if engine.player.missiles_remaining <= 0 or self.selected >= len(targets):
+            self.messages.append((Fore.RED, "✗ No missiles or target available!"))
+            return
+        
+        target = targets[self.selected]
+        if not engine.player_launch_missile(self.missile_type, target):
+            self.messages.append(
+                (Fore.RED, f"✗ Launch failed: {target.name} out of {self.missile_type} range"))
+            return
+        
+        manager = engine.target_manager
+        flight_time = manager.flight_time(manager.get_launch_site('USA'), target,
+                                          engine.missile_types[self.missile_type])
+        self.messages.append((Fore.GREEN, f"✓ {self.missile_type} launched at {target.name} "
+                                          f"- impact in {flight_time:.1f}s"))
+        if engine.ai_opponent:
+            self.responses.append(engine.game_time + engine.ai_opponent.reaction_time)
+    
+    def wopr_turn(self):
+        """WOPR answers a launch"""
+        engine = self.engine
+        result = engine.ai_take_turn()
+        if not result:
+            return
+        engine.turn_count += 1
+        self.messages.append((Fore.GREEN, f"WOPR: {result['message']}"))
+        if result['action'] == 'attack' and result.get('targets'):
+            self.messages.append(
+                (Fore.RED, f"⚠ WARNING: WOPR launched {len(result['targets'])} missile(s)!"))
+        elif result['action'] == 'peace':
+            self.messages.append((Fore.GREEN, "✓ WOPR proposes peace!"))
+        elif result['action'] == 'wait':
+            self.messages.append((Fore.YELLOW, "WOPR is holding position..."))
+    
+    def report_impacts(self):
+        """Announce targets destroyed since the last tick"""
+        engine = self.engine
+        destroyed = engine.player.targets_destroyed
+        for target in destroyed[self._destroyed:]:
+            self.messages.append(
+                (Fore.RED, f"✓ {target.name} DESTROYED! Casualties: {target.casualties:,}"))
+        self._destroyed = len(destroyed)
+        
+        if engine.ai_opponent:
+            lost = engine.ai_opponent.targets_hit
+            for name in lost[self._lost:]:
+                self.messages.append((Fore.RED, f"✕ {name} DESTROYED!"))
+            self._lost = len(lost)
+    
+    def render(self, alpha: float):
+        """Draw the screen, alpha of a tick past the last simulation step"""
+        engine = self.engine
+        targets = engine.target_manager
+        stats = self.loop.get_statistics()
+        game_time = engine.game_time + alpha * self.loop.dt
+        enemy_missiles = engine.ai_opponent.missiles_remaining if engine.ai_opponent else 0
+        
+        lines = [
+            Fore.GREEN + f"╔{BANNER}╗",
+            Fore.GREEN + f"║  GLOBAL THERMONUCLEAR WAR        T+{game_time:7.1f}s        "
+                         f"TICK {stats['ticks']:6d}  DROPPED {stats['dropped_ticks']:4d}  ║",
+            Fore.GREEN + f"╚{BANNER}╝",
+            Fore.GREEN + f"Your missiles: {engine.player.missiles_remaining}   "
+                         f"Enemy missiles: {enemy_missiles}   "
+                         f"Targets destroyed: {len(engine.player.targets_destroyed)}",
+            Fore.GREEN + f"USA Assets: {targets.count_intact_targets('USA')}/"
+                         f"{len(targets.get_targets_by_country('USA'))} intact   "
+                         f"USSR Assets: {targets.count_intact_targets('USSR')}/"
+                         f"{len(targets.get_targets_by_country('USSR'))} intact",
+            "",
+        ]
+        
+        if self.view == 'stats':
+            stats_display = create_stats_display(engine.get_game_statistics()['player_stats'])
+            lines.extend(Fore.GREEN + line for line in stats_display.split('\n'))
+        elif self.view == 'assets':
+            lines.extend(self.asset_lines())
+        elif self.view == 'trajectories':
+            lines.extend(self.trajectory_lines(alpha))
+        else:
+            lines.extend(self.map_lines(alpha))
+        
+        lines.append("")
+        if self.confirm_quit:
+            lines.append(Fore.YELLOW + "Are you sure you want to quit? (y/n)")
+        elif self.view != 'map':
+            lines.append(Fore.GREEN + "Press any key to return to the map")
+        else:
+            lines.append(Fore.GREEN + f"Missile: {self.missile_type:6s}  [M] Change missile  "
+                                      f"[1-0] Target  [L] Launch")
+            lines.append(Fore.GREEN + "[S] Statistics  [A] Assets  [T] Trajectories  "
+                                      "[P] Propose peace  [Q] Quit")
+        lines.append("")
+        for color, text in self.messages:
+            lines.append(color + text)
+        
+        redraw(lines)
+    
+    def map_lines(self, alpha: float) -> list:
+        """Tactical map: missiles in flight and the enemy targets offered for launch"""
+        engine = self.engine
+        targets = engine.target_manager
+        clock = engine.missile_manager.clock + alpha * self.loop.dt
+        
+        # Missiles in flight, positions interpolated to the render time
+        missiles = engine.missile_manager.get_active_missiles()
+        type_names = {missile_type: name for name, missile_type in engine.missile_types.items()}
+        lines = [Fore.YELLOW + f"MISSILES IN FLIGHT: {len(missiles)}"]
+        for missile in missiles[:6]:
+            target = targets.get_nearest_target(missile.target[0], missile.target[1],
+                                                intact_only=False)
+            progress = flight_progress(missile, clock)
+            bar = "=" * int(progress * 30)
+            color = Fore.RED if missile.owner != engine.player.name else Fore.YELLOW
+            lines.append(color + f"  {type_names.get(missile.missile_type, '?'):7s} → "
+                                 f"{target.name if target else '?':20s} "
+                                 f"[{bar}>{' ' * (30 - len(bar))}] {int(progress * 100):3d}%")
+        if len(missiles) > 6:
+            lines.append(Fore.YELLOW + f"  ... and {len(missiles) - 6} more")
+        
+        lines.append("")
+        lines.append(Fore.GREEN + "ENEMY TARGETS:")
+        for i, target in enumerate(self.listed_targets()):
+            marker = ">" if i == self.selected else " "
+            lines.append(Fore.GREEN + f" {marker} {(i + 1) % 10}. {target.name} "
+                                      f"({target.target_type}) - Value: {target.strategic_value}")
+        return lines
+    
+    def asset_lines(self) -> list:
+        """Assets screen: status of the first targets on each side"""
+        targets = self.engine.target_manager
+        lines = [Fore.GREEN + "TACTICAL MAP:"]
+        for country in ('USA', 'USSR'):
+            country_targets = targets.get_targets_by_country(country)
+            lines.append("")
+            lines.append(Fore.GREEN + f"{country} Assets: {targets.count_intact_targets(country)}"
+                                      f"/{len(country_targets)} intact")
+            for target in country_targets[:5]:
+                status = "✕ DESTROYED" if target.destroyed else f"✓ {target.get_status()}"
+                color = Fore.RED if target.destroyed else Fore.GREEN
+                lines.append(color + f"  {target.get_symbol()} {target.name:20s} {status}")
+        return lines
+    
+    def trajectory_lines(self, alpha: float) -> list:
+        """Trajectory screen: launch point, target and position of each missile"""
+        engine = self.engine
+        clock = engine.missile_manager.clock + alpha * self.loop.dt
+        missiles = engine.missile_manager.get_active_missiles()
+        type_names = {missile_type: name for name, missile_type in engine.missile_types.items()}
+        
+        lines = [Fore.YELLOW + "MISSILE TRAJECTORIES:"]
+        if not missiles:
+            lines.append(Fore.GREEN + "  No missiles in flight")
+        for missile in missiles[:8]:
+            target = engine.target_manager.get_nearest_target(
+                missile.target[0], missile.target[1], intact_only=False)
+            progress = flight_progress(missile, clock)
+            x, y = missile.current_pos  # As of the last tick
+            color = Fore.RED if missile.owner != engine.player.name else Fore.YELLOW
+            lines.append(color + f"  {type_names.get(missile.missile_type, '?'):7s} "
+                                 f"{missile.owner:6s} Launch: {missile.origin}  "
+                                 f"Target: {target.name if target else '?'} {missile.target}")
+            lines.append(color + f"          Position: ({x}, {y})  {int(progress * 100):3d}%")
+        if len(missiles) > 8:
+            lines.append(Fore.YELLOW + f"  ... and {len(missiles) - 8} more")
+        return lines
+
+
 def play_game(engine: GameEngine, mode: GameMode, difficulty: str):
-    """Main game loop"""
+    """Main game loop (real time, see RealtimeGame)"""
     clear_screen()
     
     # Initialize game
@@ -267,225 +527,22 @@ def play_game(engine: GameEngine, mode: GameMode, difficulty: str):
     print_green(f"Your defenses: {engine.player.defenses_remaining}")
     time.sleep(2)
     
-    # Game loop
-    turn = 0
-    while engine.running and engine.state == GameState.PLAYING:
-        turn += 1
+    # Real-time loop: the simulation ticks at a fixed rate whatever the
+    # player does, and keys are read without blocking
+    clear_screen()
+    with KeyboardInput() as keyboard:
+        game = RealtimeGame(engine, keyboard)
+        loop_stats = game.run()
+    
+    if engine.state == GameState.MENU:  # Quit
+        return
+    
+    if game.peace_proposed:
         clear_screen()
-        
-        print_green("╔════════════════════════════════════════════════════════════════════════════╗")
-        print_green(f"║                            TURN {turn:3d}                                      ║")
-        print_green("╚════════════════════════════════════════════════════════════════════════════╝")
-        
-        # Show status
-        print_green(f"\nYour missiles remaining: {engine.player.missiles_remaining}")
-        print_green(f"Enemy missiles remaining: {engine.ai_opponent.missiles_remaining if engine.ai_opponent else 0}")
-        print_green(f"Your targets destroyed: {len(engine.player.targets_destroyed)}")
-        
-        # Show simple map
-        print_green("\n" + "=" * 80)
-        print_green("TACTICAL MAP:")
-        print_green("=" * 80)
-        
-        usa_targets = engine.target_manager.get_targets_by_country('USA')
-        ussr_targets = engine.target_manager.get_targets_by_country('USSR')
-        
-        print_green(f"\nUSA Assets: {len([t for t in usa_targets if not t.destroyed])}/{len(usa_targets)} intact")
-        for target in usa_targets[:5]:
-            status = "✕ DESTROYED" if target.destroyed else f"✓ {target.get_status()}"
-            print_green(f"  {target.get_symbol()} {target.name:20s} {status}")
-        
-        print_green(f"\nUSSR Assets: {len([t for t in ussr_targets if not t.destroyed])}/{len(ussr_targets)} intact")
-        for target in ussr_targets[:5]:
-            status = "✕ DESTROYED" if target.destroyed else f"✓ {target.get_status()}"
-            print_green(f"  {target.get_symbol()} {target.name:20s} {status}")
-        
-        print_green("\n" + "=" * 80)
-        
-        # Show available targets for attack
-        targets = engine.target_manager.get_intact_targets('USSR')
-        if targets:
-            print_green("\nAvailable enemy targets:")
-            for i, target in enumerate(targets[:10], 1):  # Show first 10
-                print_green(f"  {i}. {target.name} ({target.target_type}) - Value: {target.strategic_value}")
-        
-        # Player action
-        print_green("\nOptions:")
-        print_green("  L - Launch missile")
-        print_green("  S - Show statistics")
-        print_green("  P - Propose peace")
-        print_green("  Q - Quit")
-        
-        action = input(Fore.GREEN + "\nYour action: " + Style.RESET_ALL).upper()
-        
-        if action == 'L':
-            # Launch missile
-            if engine.player.missiles_remaining > 0 and targets:
-                try:
-                    target_num = int(input(Fore.GREEN + "Select target number: " + Style.RESET_ALL))
-                    if 1 <= target_num <= len(targets):
-                        target = targets[target_num - 1]
-                        
-                        # Select missile type
-                        print_green("\nMissile types:")
-                        print_green("  1. ICBM")
-                        print_green("  2. SLBM")
-                        print_green("  3. CRUISE")
-                        
-                        missile_choice = input(Fore.GREEN + "Select missile type: " + Style.RESET_ALL)
-                        missile_types = {'1': 'ICBM', '2': 'SLBM', '3': 'CRUISE'}
-                        missile_type = missile_types.get(missile_choice, 'ICBM')
-                        
-                        # Launch
-                        if engine.player_launch_missile(missile_type, target):
-                            print_green(f"\n✓ {missile_type} launched at {target.name}!")
-                            
-                            # Show trajectory map
-                            print_yellow("\n" + "=" * 80)
-                            print_yellow("MISSILE TRAJECTORY:")
-                            print_yellow("=" * 80)
-                            
-                            # Get launch and target locations
-                            usa_targets = engine.target_manager.get_targets_by_country('USA')
-                            origin = usa_targets[0] if usa_targets else None
-                            
-                            if origin:
-                                print_green(f"\nLaunch: {origin.name} ({origin.x}, {origin.y})")
-                                print_red(f"Target: {target.name} ({target.x}, {target.y})")
-                                
-                                # Simple trajectory visualization
-                                print_yellow("\nFlight path:")
-                                steps = 5
-                                for i in range(steps + 1):
-                                    progress = i / steps
-                                    x = int(origin.x + (target.x - origin.x) * progress)
-                                    y = int(origin.y + (target.y - origin.y) * progress)
-                                    
-                                    # Create simple visual
-                                    bar = "=" * int(progress * 40)
-                                    missile_pos = ">" if i < steps else "*"
-                                    print(f"  [{bar}{missile_pos}{' ' * (40 - len(bar))}] {int(progress * 100)}%")
-                                    time.sleep(0.2)
-                            
-                            print_yellow("=" * 80)
-                            
-                            # Process missile impact immediately
-                            print_yellow("\nProcessing impact...")
-                            
-                            # Update missiles to detonate
-                            for missile in engine.missile_manager.missiles:
-                                if not missile.detonated and not missile.intercepted:
-                                    missile.detonate()
-                            
-                            # Apply damage
-                            engine._check_missile_impacts()
-                            
-                            # Show result
-                            if target.destroyed:
-                                print_red(f"\n✓ {target.name} DESTROYED!")
-                                print_red(f"   Casualties: {target.casualties:,}")
-                            elif target.damage_level > 0:
-                                print_yellow(f"\n✓ {target.name} HIT!")
-                                print_yellow(f"   Damage: {int(target.damage_level * 100)}%")
-                                print_yellow(f"   Casualties: {target.casualties:,}")
-                            else:
-                                print_green(f"\n○ {target.name} - Missile intercepted or missed")
-                            
-                            time.sleep(2)
-                        else:
-                            print_red("\n✗ Launch failed!")
-                            time.sleep(1)
-                except ValueError:
-                    print_red("\nInvalid input!")
-                    time.sleep(1)
-            else:
-                print_red("\nNo missiles or targets available!")
-                time.sleep(1)
-                
-        elif action == 'S':
-            # Show statistics
-            stats = engine.get_game_statistics()
-            clear_screen()
-            print_green(create_stats_display(stats['player_stats']))
-            input(Fore.GREEN + "\nPress Enter to continue..." + Style.RESET_ALL)
-            
-        elif action == 'P':
-            # Propose peace
-            print_yellow("\nProposing peace to WOPR...")
-            time.sleep(1)
-            print_green("\nWOPR: " + WOPR_QUOTES[2])  # "A strange game..."
-            time.sleep(2)
-            engine.state = GameState.PEACE
-            engine.game_result = 'PEACE'
-            break
-            
-        elif action == 'Q':
-            confirm = input(Fore.YELLOW + "\nAre you sure you want to quit? (y/n): " + Style.RESET_ALL)
-            if confirm.lower() == 'y':
-                engine.quit_game()
-                return
-        
-        # AI turn
-        if engine.ai_opponent and engine.state == GameState.PLAYING and action == 'L':
-            print_green("\n" + "=" * 80)
-            print_green("WOPR RESPONSE:")
-            print_green("=" * 80)
-            print_yellow("\nWOPR is analyzing threat...")
-            time.sleep(1)
-            
-            result = engine.ai_take_turn()
-            if result:
-                print_green(f"\nWOPR: {result['message']}")
-                
-                if result['action'] == 'attack' and result.get('targets'):
-                    launch_count = result.get('launch_count', 0)
-                    print_red(f"\n⚠ WARNING: WOPR detected {launch_count} missile(s)!")
-                    
-                    # Show targets
-                    for i, target in enumerate(result['targets'][:3], 1):
-                        print_red(f"  Target {i}: {target.name}")
-                        time.sleep(0.5)
-                    
-                    print_yellow("\nIncoming missiles detected...")
-                    time.sleep(1)
-                    
-                    # Process AI missile impacts
-                    print_yellow("Processing impacts...")
-                    for missile in engine.missile_manager.missiles:
-                        if missile.owner == engine.ai_opponent.name and not missile.detonated:
-                            missile.detonate()
-                    
-                    engine._check_missile_impacts()
-                    
-                    # Show damage to USA targets
-                    usa_targets = engine.target_manager.get_targets_by_country('USA')
-                    damaged = [t for t in usa_targets if t.damage_level > 0 and t.damage_level < 1.0]
-                    destroyed = [t for t in usa_targets if t.destroyed]
-                    
-                    if destroyed:
-                        for target in destroyed[-launch_count:]:  # Show recently destroyed
-                            print_red(f"  ✕ {target.name} DESTROYED!")
-                    elif damaged:
-                        for target in damaged[-launch_count:]:  # Show recently damaged
-                            print_yellow(f"  ⚠ {target.name} damaged ({int(target.damage_level * 100)}%)")
-                    
-                    time.sleep(1)
-                elif result['action'] == 'peace':
-                    print_green("\n✓ WOPR proposes peace!")
-                    time.sleep(1)
-                elif result['action'] == 'wait':
-                    print_yellow("\nWOPR is holding position...")
-                    time.sleep(1)
-                
-                time.sleep(1)
-        
-        # Update game
-        engine.update(0.1)
-        engine.turn_count = turn
-        
-        # Check if game over
-        if engine.state != GameState.PLAYING:
-            break
+        print_yellow("\nProposing peace to WOPR...")
+        time.sleep(1)
+        print_green("\nWOPR: " + WOPR_QUOTES[2])  # "A strange game..."
+        time.sleep(2)
     
     # Game over
     clear_screen()
@@ -498,6 +555,8 @@ def play_game(engine: GameEngine, mode: GameMode, difficulty: str):
     print_green(f"Total casualties: {stats['total_casualties']:,}")
     print_green(f"Missiles launched: {stats['total_missiles_launched']}")
     print_green(f"Your score: {stats['player_stats']['score']}")
+    print_green(f"Simulation: {loop_stats['ticks']} ticks at {loop_stats['tick_rate']:.1f}/s, "
+                f"{loop_stats['dropped_ticks']} dropped")
     
     input(Fore.GREEN + "\n\nPress Enter to return to menu..." + Style.RESET_ALL)
 
@@ -0,0 +1,221 @@
+"""
+Global Thermal Nuclear War - Monte Carlo Batch Simulator
+Fans headless games out over a process pool and aggregates the outcomes
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import sys
+from statistics import NormalDist
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.simulation.headless import run_game, greedy_player, random_player
+
+OUTCOMES = ('MAD', 'DEFEAT', 'VICTORY', 'PEACE', 'STALEMATE', 'TIMEOUT')
+POLICIES = {'greedy': greedy_player, 'random': random_player}
+
+# Per-game totals averaged in the summary
+MEASURES = ('turns', 'casualties', 'usa_casualties', 'ussr_casualties',
+            'player_missiles', 'ai_missiles', 'player_score')
+
+
+def game_seed(seed: int, index: int) -> int:
+    """
+    Seed of game index in a batch
+    Hashed from (seed, index), so every game has its own stream and results
+    do not depend on the worker count or chunking
+    """
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion"""
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    low = 0.0 if successes == 0 else max(0.0, center - margin)
+    high = 1.0 if successes == trials else min(1.0, center + margin)
+    return low, high
+
+
+def _play_chunk(job: Tuple) -> List[Dict]:
+    """Worker: play the games of one chunk"""
+    indexes, seed, options = job
+    records = []
+    for index in indexes:
+        record = run_game(seed=game_seed(seed, index), **options)
+        record['index'] = index
+        records.append(record)
+    return records
+
+
+def _chunks(games: int, chunk_size: int, seed: int, options: Dict) -> Iterable[Tuple]:
+    for start in range(0, games, chunk_size):
+        yield range(start, min(start + chunk_size, games)), seed, options
+
+
+class BatchSummary:
+    """Running outcome counts and per-game totals of a batch"""
+
+    def __init__(self, confidence: float = 0.95):
+        self.confidence = confidence
+        self.games = 0
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+        self.totals = dict.fromkeys(MEASURES, 0)
+
+    def add(self, record: Dict):
+        """Count one game record"""
+        self.games += 1
+        self.outcomes[record['result']] = self.outcomes.get(record['result'], 0) + 1
+        for name in MEASURES:
+            self.totals[name] += record[name]
+
+    def to_dict(self) -> Dict:
+        """Outcome shares with Wilson intervals, and per-game means"""
+        outcomes = {}
+        for outcome, count in self.outcomes.items():
+            low, high = wilson_interval(count, self.games, self.confidence)
+            outcomes[outcome] = {
+                'count': count,
+                'rate': count / self.games if self.games else 0.0,
+                'low': low,
+                'high': high,
+            }
+        return {
+            'games': self.games,
+            'confidence': self.confidence,
+            'outcomes': outcomes,
+            'means': {name: total / self.games if self.games else 0.0
+                      for name, total in self.totals.items()},
+        }
+
+
+def run_batch(games: int, workers: Optional[int] = None, chunk_size: Optional[int] = None,
+              seed: int = 0, confidence: float = 0.95,
+              on_result: Optional[Callable[[Dict], None]] = None, **options) -> Dict:
+    """
+    Play a batch of headless games over a pool of worker processes
+
+    workers defaults to the CPU count (1 plays in this process). Games are
+    handed out in chunks of chunk_size and their records streamed back as
+    chunks finish, to on_result if given. options go to run_game (player
+    must be picklable: a POLICIES name or a module-level function).
+    Returns the batch summary (BatchSummary.to_dict)
+    """
+    if games < 0:
+        raise ValueError("games must not be negative")
+    if isinstance(options.get('player'), str):
+        options['player'] = POLICIES[options['player']]
+    workers = workers or os.cpu_count() or 1
+    # A few chunks per worker keeps every core busy to the end
+    chunk_size = chunk_size or max(1, min(500, math.ceil(games / (workers * 4))))
+
+    summary = BatchSummary(confidence)
+    jobs = _chunks(games, chunk_size, seed, options)
+    if workers == 1:
+        chunks = map(_play_chunk, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        chunks = pool.imap_unordered(_play_chunk, jobs)
+
+    try:
+        for records in chunks:
+            for record in records:
+                summary.add(record)
+                if on_result is not None:
+                    on_result(record)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    result = summary.to_dict()
+    result['seed'] = seed
+    return result
+
+
+def format_summary(summary: Dict) -> str:
+    """Human-readable batch summary"""
+    lines = [f"{summary['games']:,} games (seed {summary['seed']}, "
+             f"{summary['confidence']:.0%} Wilson intervals)"]
+    for outcome, stats in summary['outcomes'].items():
+        if stats['count']:
+            lines.append(f"  {outcome:10s} {stats['count']:8,} {stats['rate']:7.2%} "
+                         f"[{stats['low']:.2%}, {stats['high']:.2%}]")
+    lines.append("Means per game:")
+    for name, mean in summary['means'].items():
+        lines.append(f"  {name:16s} {mean:14,.2f}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo batch of headless games against WOPR")
+    parser.add_argument('-n', '--games', type=int, default=10000, help="number of games")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=None, help="games per work unit")
+    parser.add_argument('--seed', type=int, default=0, help="batch seed")
+    parser.add_argument('--difficulty', default='normal',
+                        choices=('easy', 'normal', 'hard', 'wopr'))
+    parser.add_argument('--player', default='greedy', choices=sorted(POLICIES))
+    parser.add_argument('--max-turns', type=int, default=200)
+    parser.add_argument('--confidence', type=float, default=0.95)
+    parser.add_argument('--block-rng', action='store_true',
+                        help="NumPy block-drawn RNG per game")
+    parser.add_argument('--batched', action='store_true',
+                        help="play all games in lockstep on NumPy arrays (one process; "
+                             "not with --workers, --chunk-size, --block-rng or --records)")
+    parser.add_argument('--records', metavar='PATH',
+                        help="also write every game record as JSON lines")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    if args.batched:
+        # Lockstep games run in this process on one NumPy stream, one
+        # summary and no per-game records
+        ignored = [option for option, given in (('--workers', args.workers is not None),
+                                                ('--chunk-size', args.chunk_size is not None),
+                                                ('--block-rng', args.block_rng),
+                                                ('--records', args.records is not None))
+                   if given]
+        if ignored:
+            parser.error(f"--batched cannot be combined with {', '.join(ignored)}")
+        from src.simulation.batched_engine import run_batched
+        summary = run_batched(args.games, seed=args.seed, confidence=args.confidence,
+                              max_turns=args.max_turns, difficulty=args.difficulty,
+                              player=args.player)
+        print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+        return 0
+
+    records = open(args.records, 'w') if args.records else None
+    try:
+        summary = run_batch(
+            args.games, workers=args.workers, chunk_size=args.chunk_size, seed=args.seed,
+            confidence=args.confidence, difficulty=args.difficulty, player=args.player,
+            max_turns=args.max_turns, block_rng=args.block_rng,
+            on_result=(lambda record: records.write(json.dumps(record) + '\n'))
+            if records else None)
+    finally:
+        if records:
+            records.close()
+
+    print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# Made with Bob
@@ -0,0 +1,413 @@
+"""
+Global Thermal Nuclear War - Batched Simulation
+Advances many independent headless games in lockstep on NumPy arrays
+"""
+
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.ai.wopr_ai import WOPRArtificialIntelligence
+from src.game_logic.missile import create_missile_types_from_config
+from src.game_logic.target import (CASUALTY_RATE, DAMAGE_PER_HIT, DESTROYED_AT,
+                                   create_targets_from_config)
+from src.simulation.batch import MEASURES, OUTCOMES, BatchSummary
+from src.simulation.headless import _destroy_probability
+from src.utils.config import MISSILE_TYPES, WORLD_TARGETS
+
+PLAYERS = ('greedy', 'random')  # Player policies of headless.py played here
+
+
+class BatchedGameEngine:
+    """
+    Many headless games against WOPR, advanced one turn at a time together
+
+    Plays the turn of run_game() (src/simulation/headless.py) for every game
+    still going: the player moves, missiles land at once, WOPR moves, then
+    the engine's game-over checks run. Target state is one games × targets
+    array per attribute, and the player policy and WOPR's adjust_strategy,
+    decide_action, calculate_launch_count and select_targets rules are masks
+    and array operations over the games. Missiles land on the turn they are
+    launched, so none are ever in flight between turns.
+
+    All games draw from one NumPy stream: outcomes follow run_game's in
+    distribution, not game for game.
+    """
+
+    def __init__(self, games: int, difficulty: str = 'normal', player: str = 'greedy',
+                 seed: Optional[int] = None, world: Optional[Dict] = None):
+        if np is None:
+            raise ImportError("BatchedGameEngine requires numpy (pip install numpy)")
+        if player not in PLAYERS:
+            raise ValueError(f"Unknown player policy: {player}")
+        self.games = games
+        self.difficulty = difficulty
+        self.player = player
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self._load_world(world or WORLD_TARGETS)
+
+        # Per-game state
+        shape = (games, len(self.names))
+        self.damage_level = np.zeros(shape)
+        self.casualties = np.zeros(shape, dtype=np.int64)
+        self.destroyed = np.zeros(shape, dtype=np.bool_)
+        self.playing = np.ones(games, dtype=np.bool_)
+        self.result = np.full(games, -1, dtype=np.int64)  # Index into OUTCOMES
+        self.turns = np.zeros(games, dtype=np.int64)
+        self.player_missiles = np.full(games, 50, dtype=np.int64)
+        self.player_launched = np.zeros(games, dtype=np.int64)
+        self.player_score = np.zeros(games, dtype=np.int64)
+        self.targets_destroyed = np.zeros(games, dtype=np.int64)
+        self.ai_missiles = np.full(games, self.ai_arsenal, dtype=np.int64)
+        self.aggression = np.full(games, self.ai_aggression)
+        self.targets_lost = np.zeros(games, dtype=np.int64)
+        self.turn_count = 0  # Every game still playing is on the same turn
+
+    def _load_world(self, world: Dict):
+        """Static target columns, launch ranges and WOPR settings"""
+        manager = create_targets_from_config(world)
+        targets = manager.all_targets
+        self.names = [t.name for t in targets]
+        self.strategic_value = np.array([t.strategic_value for t in targets], dtype=np.int64)
+        self.population = np.array([t.population for t in targets], dtype=np.int64)
+        self.defense_level = np.array([t.defense_level for t in targets], dtype=np.float64)
+
+        # Impacts land on the nearest target, destroyed or not
+        self.impact_row = np.array([
+            manager.index_of(manager.get_nearest_target(t.x, t.y, intact_only=False))
+            for t in targets], dtype=np.int64)
+
+        self.usa = np.array([manager.index_of(t) for t in manager.get_targets_by_country('USA')],
+                            dtype=np.int64)
+        self.ussr = np.array([manager.index_of(t) for t in manager.get_targets_by_country('USSR')],
+                             dtype=np.int64)
+
+        missile_types = create_missile_types_from_config(MISSILE_TYPES)
+        self.missile_names = list(missile_types)
+        self.warheads = np.array([m.warheads for m in missile_types.values()], dtype=np.int64)
+        self.accuracy = np.array([m.accuracy for m in missile_types.values()])
+
+        # Player: USSR target × missile type in range of the USA launch site
+        site = manager.get_launch_site('USA')
+        self.player_reach = np.array([
+            [manager.in_range(site, targets[row], missile_type)
+             for missile_type in missile_types.values()]
+            for row in self.ussr.tolist()], dtype=np.bool_)
+        self.player_reach = self.player_reach.reshape(len(self.ussr), len(missile_types))
+
+        # WOPR: its settings, the fixed part of its target score, and the
+        # missile type it picks for each USA target (-1: none in range)
+        ai = WOPRArtificialIntelligence(self.difficulty)
+        self.ai_arsenal = ai.missiles_remaining
+        self.ai_aggression = ai.aggression_level
+        self.ai_accuracy = ai.base_accuracy
+        site = manager.get_launch_site('USSR')
+        usa_targets = [targets[row] for row in self.usa.tolist()]
+        self.ai_score = np.array([
+            t.strategic_value * 2.0 + ai.TARGET_TYPE_PRIORITY.get(t.target_type, 0)
+            for t in usa_targets])
+        self.ai_missile_type = np.array([
+            self.missile_names.index(name) if name else -1
+            for name in (ai.select_missile_type(t, missile_types, manager.distance(site, t))
+                         for t in usa_targets)], dtype=np.int64)
+
+    def _strike(self, games, rows, types):
+        """
+        One impact in each of games on target rows with missile types (the
+        take_damage rules, each game at most once per call)
+        Returns (games, rows) of the targets destroyed
+        """
+        rng = self.rng
+        warheads = self.warheads[types]
+        intercepted = np.where(rng.random(games.size) < self.defense_level[rows],
+                               rng.integers(1, warheads, endpoint=True), 0)
+        hits = rng.binomial(np.maximum(warheads - intercepted, 0), self.accuracy[types])
+
+        landed = (hits > 0) & ~self.destroyed[games, rows]
+        games, rows, hits = games[landed], rows[landed], hits[landed]
+        damage = np.minimum(1.0, hits * DAMAGE_PER_HIT)
+        level = np.minimum(1.0, self.damage_level[games, rows] + damage)
+        self.damage_level[games, rows] = level
+        self.casualties[games, rows] += (self.population[rows] * (damage * CASUALTY_RATE)
+                                         * (1 - level + damage)).astype(np.int64)
+        destroyed = level >= DESTROYED_AT
+        games, rows = games[destroyed], rows[destroyed]
+        self.destroyed[games, rows] = True
+        return games, rows
+
+    def _player_strike(self, games, rows, types):
+        """Launch the player's missiles and credit the targets they destroy"""
+        self.player_missiles[games] -= 1
+        self.player_launched[games] += 1
+        games, rows = self._strike(games, self.impact_row[rows], types)
+        self.player_score[games] += self.strategic_value[rows]
+        self.targets_destroyed[games] += 1
+
+    def _greedy_player(self, games):
+        """greedy_player: best strategic value times destroy probability"""
+        games = games[self.player_missiles[games] > 0]
+        if not games.size:
+            return
+        cols = self.ussr
+        # Skip targets shadowed by another target, as impacts would land there
+        candidate = ~self.destroyed[np.ix_(games, cols)] & (self.impact_row[cols] == cols)
+        levels, level_index = np.unique(self.damage_level[np.ix_(games, cols)], return_inverse=True)
+        level_index = level_index.reshape(len(games), len(cols))
+
+        # Destroy probability per target, missile type and damage level seen
+        odds = np.array([[[_destroy_probability(int(warheads), float(accuracy),
+                                                float(defense), level)
+                           for level in levels.tolist()]
+                          for warheads, accuracy in zip(self.warheads, self.accuracy)]
+                         for defense in self.defense_level[cols]])
+        odds = odds.reshape(len(cols), len(self.warheads), -1)
+        value = self.strategic_value[cols][None, :, None] * odds[
+            np.arange(len(cols))[None, :, None], np.arange(len(self.warheads))[None, None, :],
+            level_index[:, :, None]]
+        value = np.where(candidate[:, :, None] & self.player_reach[None], value, -np.inf)
+
+        # First best (target, type) in the policy's loop order
+        value = value.reshape(len(games), -1)
+        best = np.argmax(value, axis=1)
+        chosen = np.isfinite(value[np.arange(len(games)), best])
+        best = best[chosen]
+        self._player_strike(games[chosen], cols[best // len(self.warheads)],
+                            best % len(self.warheads))
+
+    def _random_player(self, games):
+        """random_player: random missile type at a random intact target"""
+        cols = self.ussr
+        intact = ~self.destroyed[np.ix_(games, cols)]
+        count = intact.sum(axis=1)
+        keep = (self.player_missiles[games] > 0) & (count > 0)
+        games, intact, count = games[keep], intact[keep], count[keep]
+
+        types = (self.rng.random(games.size) * len(self.warheads)).astype(np.int64)
+        pick = (self.rng.random(games.size) * count).astype(np.int64)
+        target = np.argmax(np.cumsum(intact, axis=1) > pick[:, None], axis=1)
+
+        # Out of range launches fail without spending a missile
+        launched = self.player_reach[target, types]
+        self._player_strike(games[launched], cols[target[launched]], types[launched])
+
+    def _wopr_move(self, games):
+        """WOPR.take_turn and GameEngine.ai_take_turn, vectorized"""
+        rng = self.rng
+        ai_turn = self.turn_count + 1
+        player_intact = (~self.destroyed[np.ix_(games, self.usa)]).sum(axis=1)
+        ai_intact = (~self.destroyed[np.ix_(games, self.ussr)]).sum(axis=1)
+
+        # analyze_situation (no missile is ever in flight when WOPR moves,
+        # so the threat and incoming fire rules never apply)
+        advantage = np.where(player_intact > 0,
+                             (ai_intact - player_intact) / np.maximum(player_intact, 1), 1.0)
+        player_aggression = self.player_launched[games] / max(1, ai_turn)
+
+        # adjust_strategy
+        aggression = self.aggression[games]
+        aggression = np.where(advantage < -0.3, np.minimum(1.0, aggression + 0.1),
+                              np.where(advantage > 0.5, np.maximum(0.3, aggression - 0.05),
+                                       aggression))
+        aggression = np.where(player_aggression > aggression,
+                              np.minimum(1.0, aggression + 0.05), aggression)
+        self.aggression[games] = aggression
+
+        # decide_action ('peace' here is only a message)
+        missiles = self.ai_missiles[games]
+        peace = ((ai_turn > 10) & ((ai_intact + player_intact) / 2 < 3)
+                 & (rng.random(games.size) < 0.3))
+        attack = ~peace & (((advantage > 0.3) & (missiles > 5))
+                           | ((player_aggression > 0.5) & (missiles > 10))
+                           | ((rng.random(games.size) >= 0.3) & (missiles > 0)))
+
+        # calculate_launch_count
+        launch_count = (aggression * 3).astype(np.int64) + 1
+        launch_count = np.where(missiles < 10, np.minimum(launch_count, 1), launch_count)
+        launch_count = np.minimum(launch_count, missiles)
+
+        games, launch_count, aggression = games[attack], launch_count[attack], aggression[attack]
+        if not games.size:
+            return
+        self._wopr_strike(games, launch_count, aggression)
+
+    def _wopr_strike(self, games, launch_count, aggression):
+        """select_targets, then salvos of consecutive same-type picks, landing in launch order"""
+        rng = self.rng
+        cols = self.usa
+        intact = ~self.destroyed[np.ix_(games, cols)]
+        score = (self.ai_score[None, :] + (1.0 - self.damage_level[np.ix_(games, cols)]) * 50
+                 - (aggression < 0.5)[:, None] * (self.defense_level[cols] * 30)[None, :]
+                 + rng.uniform(-10, 10, intact.shape))
+        score = np.where(intact, score, -np.inf)
+        slots = int(launch_count.max())
+        selected = np.argsort(-score, axis=1, kind='stable')[:, :slots]
+
+        # Some picks are a random intact target instead
+        count = intact.sum(axis=1)
+        if self.difficulty != 'wopr':
+            swap = (rng.random(games.size) > self.ai_accuracy) & (count > 0)
+            pick = (rng.random(games.size) * count).astype(np.int64)
+            target = np.argmax(np.cumsum(intact, axis=1) > pick[:, None], axis=1)
+            selected[swap, 0] = target[swap]
+
+        types = self.ai_missile_type[selected]
+        fired = ((np.arange(slots)[None, :] < np.minimum(launch_count, count)[:, None])
+                 & (types >= 0))
+        self.ai_missiles[games] -= fired.sum(axis=1)
+
+        # Salvos keep select_targets order, so missiles land pick by pick
+        for slot in range(slots):
+            landing = fired[:, slot]
+            rows = self.impact_row[cols[selected[landing, slot]]]
+            hit_games, _ = self._strike(games[landing], rows, types[landing, slot])
+            self.targets_lost[hit_games] += 1
+
+    def _finish(self, games, outcome: str):
+        """End games with an outcome on the current turn count"""
+        self.playing[games] = False
+        self.result[games] = OUTCOMES.index(outcome)
+        self.turns[games] = self.turn_count
+
+    def _check_game_over(self, games) -> List:
+        """
+        GameEngine._check_game_over for every game
+        Returns (outcome, games) pairs of the games that ended
+        """
+        usa_destroyed = self.destroyed[np.ix_(games, self.usa)].sum(axis=1)
+        ussr_destroyed = self.destroyed[np.ix_(games, self.ussr)].sum(axis=1)
+        usa_intact = len(self.usa) - usa_destroyed
+        ussr_intact = len(self.ussr) - ussr_destroyed
+
+        mad = (((usa_destroyed / len(self.usa)) * 100 > 80)
+               & ((ussr_destroyed / len(self.ussr)) * 100 > 80))
+        defeat = ~mad & (usa_intact == 0)
+        victory = ~mad & ~defeat & (ussr_intact == 0)
+        over = mad | defeat | victory
+
+        # Peace: WOPR's decide_action after turn 20 while the player can
+        # still launch (WOPR is past its own turn 10 by then)
+        peace = np.zeros(games.size, dtype=np.bool_)
+        if self.turn_count > 20:
+            peace = (~over & (self.player_missiles[games] > 0)
+                     & ((ussr_intact + usa_intact) / 2 < 3) & (self.rng.random(games.size) < 0.3))
+
+        return [(outcome, games[mask]) for outcome, mask in
+                (('MAD', mad), ('DEFEAT', defeat), ('VICTORY', victory), ('PEACE', peace))]
+
+    def step(self) -> int:
+        """
+        Play one turn of every game still going
+        Returns number of games still going
+        """
+        games = np.flatnonzero(self.playing)
+        if not games.size:
+            return 0
+
+        if self.player == 'greedy':
+            self._greedy_player(games)
+        else:
+            self._random_player(games)
+        self._wopr_move(games)
+        ended = self._check_game_over(games)
+        self.turn_count += 1
+        for outcome, over in ended:
+            self._finish(over, outcome)
+
+        # Neither side can launch any more
+        games = games[self.playing[games]]
+        self._finish(games[(self.player_missiles[games] <= 0) & (self.ai_missiles[games] <= 0)],
+                     'STALEMATE')
+        return int(self.playing.sum())
+
+    def run(self, max_turns: int = 200) -> Dict:
+        """Play every game to its end, or 'TIMEOUT' after max_turns; returns summary()"""
+        while self.turn_count < max_turns and self.step():
+            pass
+        self._finish(np.flatnonzero(self.playing), 'TIMEOUT')
+        return self.summary()
+
+    def columns(self) -> Dict:
+        """Per-game result record fields (as run_game's), one array each"""
+        return {
+            'result': self.result,
+            'turns': self.turns,
+            'casualties': self.casualties.sum(axis=1),
+            'usa_casualties': self.casualties[:, self.usa].sum(axis=1),
+            'ussr_casualties': self.casualties[:, self.ussr].sum(axis=1),
+            'player_missiles': self.player_launched,
+            'ai_missiles': self.ai_arsenal - self.ai_missiles,
+            'missiles_launched': self.player_launched + (self.ai_arsenal - self.ai_missiles),
+            'player_score': self.player_score,
+            'targets_destroyed': self.targets_destroyed,
+            'targets_lost': self.targets_lost,
+        }
+
+    def records(self) -> List[Dict]:
+        """run_game() style record of each game (index is its position in the batch)"""
+        columns = {name: values.tolist() for name, values in self.columns().items()}
+        records = []
+        for index in range(self.games):
+            record = {name: values[index] for name, values in columns.items()}
+            record['result'] = OUTCOMES[record['result']] if record['result'] >= 0 else None
+            record['index'] = index
+            records.append(record)
+        return records
+
+    def add_to(self, summary: BatchSummary):
+        """Count the finished games into a BatchSummary"""
+        finished = self.result >= 0
+        columns = self.columns()
+        summary.games += int(finished.sum())
+        counts = np.bincount(self.result[finished], minlength=len(OUTCOMES))
+        for outcome, count in zip(OUTCOMES, counts.tolist()):
+            summary.outcomes[outcome] += count
+        for name in MEASURES:
+            summary.totals[name] += int(columns[name][finished].sum())
+
+    def summary(self, confidence: float = 0.95) -> Dict:
+        """Batch summary of the finished games, as run_batch() returns it"""
+        summary = BatchSummary(confidence)
+        self.add_to(summary)
+        result = summary.to_dict()
+        result['seed'] = self.seed
+        return result
+
+    def __repr__(self):
+        return (f"BatchedGameEngine(games={self.games}, turn={self.turn_count}, "
+                f"playing={int(self.playing.sum())})")
+
+
+def run_batched(games: int, seed: int = 0, confidence: float = 0.95, chunk_size: int = 10000,
+                max_turns: int = 200, **options) -> Dict:
+    """
+    Play games with BatchedGameEngine, chunk_size games at a time
+    options go to BatchedGameEngine (difficulty, player, world)
+    Returns the batch summary, like run_batch()
+    """
+    summary = BatchSummary(confidence)
+    for start in range(0, games, chunk_size):
+        engine = BatchedGameEngine(min(chunk_size, games - start), seed=seed + start, **options)
+        engine.run(max_turns)
+        engine.add_to(summary)
+
+    result = summary.to_dict()
+    result['seed'] = seed
+    return result
+
+
+if __name__ == "__main__":
+    # Test batched games
+    import time
+
+    start = time.perf_counter()
+    engine = BatchedGameEngine(10000, seed=0)
+    summary = engine.run()
+    elapsed = time.perf_counter() - start
+    print(f"{engine} in {elapsed:.2f}s ({engine.games / elapsed * 60:,.0f} games/min)")
+    print({outcome: stats['count'] for outcome, stats in summary['outcomes'].items()})
+
+# Made with Bob
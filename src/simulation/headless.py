@@ -0,0 +1,204 @@
+"""
+Global Thermal Nuclear War - Headless Simulation
+Plays complete games without terminal I/O or sleeps, for balance testing
+and regression baselines
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.game_engine import GameEngine, GameMode, GameState
+from src.game_logic.target import expected_damage
+from src.utils.rng import make_rng
+
+# A player policy looks at the engine once per turn and returns its action:
+# (missile_type_name, target) to launch, 'peace' to propose peace, or None to pass
+PlayerPolicy = Callable[[GameEngine], object]
+
+
+@lru_cache(maxsize=4096)
+def _destroy_probability(warheads: int, accuracy: float, defense_level: float,
+                         damage_level: float) -> float:
+    """Chance one strike destroys a target (damage levels repeat, so cached)"""
+    return expected_damage(warheads, accuracy, defense_level, damage_level)['destroy_probability']
+
+
+def greedy_player(engine: GameEngine):
+    """
+    Launch the missile with the best expected strategic value destroyed,
+    over every intact enemy target in range (see expected_damage)
+    """
+    if engine.player.missiles_remaining <= 0:
+        return None
+    manager = engine.target_manager
+    site = manager.get_launch_site('USA')
+    best, action = 0.0, None
+    for target in manager.get_intact_targets('USSR'):
+        # Impacts land on the nearest target; skip targets shadowed by another
+        if manager.get_nearest_target(target.x, target.y, intact_only=False) is not target:
+            continue
+        for name, missile_type in engine.missile_types.items():
+            if not manager.in_range(site, target, missile_type):
+                continue
+            value = target.strategic_value * _destroy_probability(
+                missile_type.warheads, missile_type.accuracy,
+                target.defense_level, target.damage_level)
+            if action is None or value > best:
+                best, action = value, (name, target)
+    return action
+
+
+def random_player(engine: GameEngine):
+    """Launch a random missile type at a random intact enemy target"""
+    if engine.player.missiles_remaining <= 0:
+        return None
+    targets = engine.target_manager.get_intact_targets('USSR')
+    if not targets:
+        return None
+    return engine.rng.choice(sorted(engine.missile_types)), engine.rng.choice(targets)
+
+
+def scripted_player(actions: Iterable) -> PlayerPolicy:
+    """
+    Policy that plays a fixed script, one entry per turn
+    Entries are (missile_type_name, target_name), 'peace' or None; the
+    player passes once the script runs out
+    """
+    script = iter(actions)
+
+    def policy(engine: GameEngine):
+        action = next(script, None)
+        if action is None or action == 'peace':
+            return action
+        missile_type_name, target_name = action
+        return missile_type_name, engine.target_manager.get_target_by_name(target_name)
+
+    return policy
+
+
+def _detonate_in_flight(engine: GameEngine, owner: Optional[str] = None):
+    """Bring missiles down at once, as the interactive game does after a launch"""
+    for missile in engine.missile_manager.get_active_missiles():
+        if owner is None or missile.owner == owner:
+            engine.missile_manager.detonate_missile(missile)
+    engine._check_missile_impacts()
+
+
+def _fly_in_flight(engine: GameEngine, tick: float, skip_idle: bool = True):
+    """
+    Run the game in tick steps until every missile in flight has landed
+    Idle steps are skipped with skip_to_next_event (same outcome, fewer updates)
+    """
+    missiles = engine.missile_manager
+    while engine.state == GameState.PLAYING and missiles.time_to_next_impact() is not None:
+        if skip_idle:
+            engine.skip_to_next_event(tick)
+        else:
+            engine.update(tick)
+
+
+def play_turn(engine: GameEngine, action, flight_tick: Optional[float] = None,
+              skip_idle: bool = True) -> bool:
+    """
+    One turn of the interactive game loop (src/main.py), without the I/O
+    Missiles land at once, as in the interactive game. WOPR moves every
+    turn, including when the player passes
+    With flight_tick both sides' missiles fly instead, landing at their
+    impact times while the game runs in flight_tick steps after WOPR moves
+    Returns True while the game goes on
+    """
+    fly = flight_tick is not None
+    if action == 'peace':
+        engine.state = GameState.PEACE
+        engine.game_result = 'PEACE'
+        return False
+    if action is not None:
+        missile_type_name, target = action
+        if (target is not None and engine.player_launch_missile(missile_type_name, target)
+                and not fly):
+            _detonate_in_flight(engine)
+
+    if engine.ai_opponent and engine.state == GameState.PLAYING:
+        result = engine.ai_take_turn()
+        if result and result['action'] == 'attack' and result.get('targets') and not fly:
+            _detonate_in_flight(engine, engine.ai_opponent.name)
+    if fly:
+        _fly_in_flight(engine, flight_tick, skip_idle)
+
+    engine.update(0.1)
+    engine.turn_count += 1
+    return engine.state == GameState.PLAYING
+
+
+def _exhausted(engine: GameEngine) -> bool:
+    """Neither side can launch and nothing is in flight"""
+    ai = engine.ai_opponent
+    return (engine.player.missiles_remaining <= 0
+            and (ai is None or ai.missiles_remaining <= 0)
+            and engine.missile_manager.time_to_next_impact() is None)
+
+
+def run_game(player: PlayerPolicy = greedy_player, difficulty: str = 'normal',
+             mode: GameMode = GameMode.CAMPAIGN, seed: Optional[int] = None,
+             max_turns: int = 200, world: Optional[Dict] = None,
+             engine_options: Optional[Dict] = None, block_rng: bool = False,
+             flight_tick: Optional[float] = None, skip_idle: bool = True) -> Dict:
+    """
+    Play one complete game against WOPR
+    The game gets its own RNG stream from seed (a BlockRandom with
+    block_rng), so a game replays exactly and games never share state
+    engine_options are passed to GameEngine (e.g. history_limit)
+    flight_tick and skip_idle are passed to play_turn
+    
+    A game ends on the engine's own result (MAD, DEFEAT, VICTORY, PEACE),
+    on 'STALEMATE' once both sides are out of missiles, or on 'TIMEOUT'
+    after max_turns
+    Returns the game's result record
+    """
+    engine = GameEngine(rng=make_rng(seed, blocks=block_rng), **(engine_options or {}))
+    engine.initialize_game(mode, difficulty, world=world)
+    ai = engine.ai_opponent
+    ai_arsenal = ai.missiles_remaining if ai else 0
+    result = 'TIMEOUT'
+    while engine.turn_count < max_turns:
+        if not play_turn(engine, player(engine), flight_tick, skip_idle):
+            result = engine.game_result
+            break
+        if _exhausted(engine):
+            result = 'STALEMATE'
+            break
+
+    return {
+        'seed': seed,
+        'result': result,
+        'turns': engine.turn_count,
+        'casualties': engine.target_manager.get_total_casualties(),
+        'usa_casualties': engine.target_manager.get_total_casualties('USA'),
+        'ussr_casualties': engine.target_manager.get_total_casualties('USSR'),
+        'player_missiles': engine.player.missiles_launched_count,
+        'ai_missiles': (ai_arsenal - ai.missiles_remaining) if ai else 0,
+        'missiles_launched': engine.missile_manager.total_created,
+        'player_score': engine.player.score,
+        'targets_destroyed': len(engine.player.targets_destroyed),
+        'targets_lost': len(ai.targets_hit) if ai else 0,
+    }
+
+
+def run_games(count: int, seed: int = 0, **options) -> List[Dict]:
+    """Play count games with seeds seed, seed + 1, ... (options as run_game)"""
+    return [run_game(seed=seed + i, **options) for i in range(count)]
+
+
+if __name__ == "__main__":
+    # Test headless games
+    import time
+    from collections import Counter
+
+    start = time.perf_counter()
+    records = run_games(1000)
+    elapsed = time.perf_counter() - start
+    print(f"{len(records)} games in {elapsed:.2f}s ({len(records) / elapsed * 60:,.0f} games/min)")
+    print(Counter(record['result'] for record in records))
+    print(records[0])
+
+# Made with Bob
@@ -26,6 +26,11 @@ GAME_SPEED = {
     'fast': 0.5,
 }
 
+# Real-time loop (src/game_loop.py)
+TICK_RATE = 20  # Simulation updates per second
+FRAME_RATE = 10  # Screen redraws per second
+MAX_FRAME_TIME = 0.25  # Longest stall caught up in seconds; the rest is dropped
+
 # Player Settings
 PLAYER_STARTING_MISSILES = 50
 PLAYER_STARTING_DEFENSES = 20
@@ -0,0 +1,176 @@
+"""
+Global Thermal Nuclear War - Scenario Files
+Compact binary target sets that load straight into a TargetManager
+"""
+
+import json
+from functools import partial
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.utils.config import TARGET_TYPES
+
+# File layout: MAGIC, little-endian uint32 header length, JSON header padded
+# to a multiple of 8 bytes, then `count` fixed-width records
+MAGIC = b'GTNWSCN1'
+NAME_WIDTH = 40  # Bytes reserved for a UTF-8 target name
+
+
+def record_dtype(name_width: int = NAME_WIDTH):
+    """NumPy dtype of one fixed-width target record"""
+    if np is None:
+        raise ImportError("Scenario files require numpy (pip install numpy)")
+    return np.dtype([
+        ('country', '<u2'),
+        ('type', '<u2'),
+        ('x', '<i4'),
+        ('y', '<i4'),
+        ('strategic_value', '<i4'),
+        ('population', '<i8'),
+        ('defense_level', '<f8'),
+        ('name', f'S{name_width}'),
+    ])
+
+
+def write_scenario(path: str, world: Dict, name_width: int = NAME_WIDTH) -> int:
+    """
+    Write a world in the WORLD_TARGETS format to a scenario file
+    Target type stats (population, value, defense) are resolved here, once
+    Returns number of targets written
+    """
+    countries = list(world)
+    types = list(TARGET_TYPES)
+    type_ids = {name: i for i, name in enumerate(types)}
+    count = sum(len(targets) for targets in world.values())
+
+    records = np.zeros(count, dtype=record_dtype(name_width))
+    regions = {}
+    row = 0
+    for country_id, country in enumerate(countries):
+        targets = world[country]
+        if targets:
+            regions[country] = {
+                'start': row,
+                'stop': row + len(targets),
+                'bounds': [min(t['x'] for t in targets), min(t['y'] for t in targets),
+                           max(t['x'] for t in targets), max(t['y'] for t in targets)],
+            }
+        for target in targets:
+            name = target['name'].encode('utf-8')
+            if len(name) > name_width:
+                raise ValueError(f"Target name longer than {name_width} bytes: {target['name']}")
+            type_config = TARGET_TYPES[target['type']]
+            records[row] = (country_id, type_ids[target['type']], target['x'], target['y'],
+                            type_config['strategic_value'], type_config['population'],
+                            type_config['defense_level'], name)
+            row += 1
+
+    header = json.dumps({
+        'version': 1,
+        'count': count,
+        'countries': countries,
+        'types': types,
+        'name_width': name_width,
+        'regions': regions,
+    }).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 4 + len(header)) % 8)
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(4, 'little'))
+        f.write(header)
+        records.tofile(f)
+    return count
+
+
+def open_scenario(path: str) -> Tuple[Dict, 'np.ndarray']:
+    """
+    Memory-map a scenario file
+    Returns (header dict, read-only record array backed by the file)
+    """
+    if np is None:
+        raise ImportError("Scenario files require numpy (pip install numpy)")
+
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a scenario file")
+        header_length = int.from_bytes(f.read(4), 'little')
+        header = json.loads(f.read(header_length))
+
+    offset = len(MAGIC) + 4 + header_length
+    records = np.memmap(path, dtype=record_dtype(header['name_width']), mode='r',
+                        offset=offset, shape=(header['count'],))
+    return header, records
+
+
+def _columns(header: Dict, records) -> Tuple:
+    """add_targets() arguments for a block of records"""
+    columns = {name: records[name] for name in
+               ('country', 'type', 'x', 'y', 'strategic_value', 'population', 'defense_level')}
+    columns['name'] = [name.decode('utf-8') for name in records['name'].tolist()]
+    return header['countries'], header['types'], columns
+
+
+def _region_columns(header: Dict, records, country: str) -> Tuple:
+    """add_targets() arguments for one country, read into memory from the file"""
+    region = header.get('regions', {}).get(country)
+    if region is not None:
+        records = np.array(records[region['start']:region['stop']])
+    else:
+        records = records[records['country'] == header['countries'].index(country)]
+    return _columns(header, records)
+
+
+def load_records(manager, header: Dict, records, countries: Optional[Sequence[str]] = None) -> int:
+    """
+    Bulk-add scenario records to a TargetManager
+    countries restricts loading to some of the scenario's countries
+    Returns number of targets added
+    """
+    if countries is not None:
+        wanted = [header['countries'].index(c) for c in countries if c in header['countries']]
+        records = records[np.isin(records['country'], wanted)]
+
+    return len(manager.add_targets(*_columns(header, records)))
+
+
+def load_scenario(path: str, columnar: bool = True, grid_cell_size: float = 10.0,
+                  countries: Optional[Sequence[str]] = None, lazy: bool = False):
+    """
+    Load a scenario file into a new TargetManager
+    Columnar managers take the records as whole-array copies
+    With lazy=True each country is read from the file the first time it is
+    queried (see TargetManager.add_region and prefetch)
+    """
+    from src.game_logic.target import TargetManager
+
+    header, records = open_scenario(path)
+    manager = TargetManager(grid_cell_size=grid_cell_size, columnar=columnar)
+    if not lazy:
+        load_records(manager, header, records, countries)
+        return manager
+
+    regions = header.get('regions', {})
+    for country in header['countries']:
+        if countries is not None and country not in countries:
+            continue
+        bounds = regions[country]['bounds'] if country in regions else None
+        manager.add_region(country, partial(_region_columns, header, records, country), bounds)
+    return manager
+
+
+if __name__ == "__main__":
+    # Test scenario round trip
+    import os
+    import tempfile
+    from src.utils.config import WORLD_TARGETS
+
+    path = os.path.join(tempfile.mkdtemp(), 'world.scn')
+    print(f"Wrote {write_scenario(path, WORLD_TARGETS)} targets to {path}")
+    print(load_scenario(path))
+
+# Made with Bob
@@ -0,0 +1,101 @@
+"""
+Global Thermal Nuclear War - World Generator
+Seeded procedural worlds for stress tests and benchmarks
+"""
+
+import math
+import random
+from typing import Dict, Optional, Sequence
+
+from src.utils.config import TARGET_TYPES
+
+# Share of each target type in a generated world
+DEFAULT_TYPE_MIX = {
+    'CITY': 0.5,
+    'MILITARY_BASE': 0.2,
+    'MISSILE_SILO': 0.2,
+    'COMMAND_CENTER': 0.1,
+}
+
+# The hand-made world: ~20 targets on an 80x30 map
+BASE_WIDTH = 80
+BASE_HEIGHT = 30
+BASE_TARGETS = 20
+
+
+def generate_world(num_targets: int = 1000, countries: Sequence[str] = ('USA', 'USSR'),
+                   type_mix: Optional[Dict[str, float]] = None, seed: int = 0,
+                   width: Optional[int] = None, height: Optional[int] = None,
+                   targets_per_cluster: int = 50) -> Dict:
+    """
+    Generate a world in the WORLD_TARGETS format
+
+    Each country gets a vertical strip of the map, west to east, with its
+    targets gathered in clusters (cities, bases and silos around population
+    centers). Without width/height the map is scaled so target density
+    matches the hand-made world. The same arguments always give the same world.
+
+    Returns dict mapping country -> list of {'name', 'type', 'x', 'y'}
+    """
+    if num_targets < 0:
+        raise ValueError("num_targets must not be negative")
+    if not countries:
+        raise ValueError("at least one country is required")
+
+    type_mix = type_mix or DEFAULT_TYPE_MIX
+    unknown = set(type_mix) - set(TARGET_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown target types: {sorted(unknown)}")
+
+    scale = max(1.0, math.sqrt(num_targets / BASE_TARGETS))
+    width = width or int(BASE_WIDTH * scale)
+    height = height or int(BASE_HEIGHT * scale)
+
+    rng = random.Random(seed)
+    type_names = list(type_mix)
+    weights = [type_mix[name] for name in type_names]
+    strip = width / len(countries)
+
+    world = {}
+    for position, country in enumerate(countries):
+        # Spread the remainder over the first countries
+        count = (num_targets // len(countries)
+                 + (1 if position < num_targets % len(countries) else 0))
+        left = strip * position
+        spread = max(1.0, strip / 8)
+
+        centers = [(rng.uniform(left, left + strip), rng.uniform(0, height))
+                   for _ in range(max(1, math.ceil(count / targets_per_cluster)))]
+        types = rng.choices(type_names, weights=weights, k=count)
+
+        targets = []
+        for i, target_type in enumerate(types):
+            cx, cy = rng.choice(centers)
+            x = min(max(rng.gauss(cx, spread), left), left + strip - 1)
+            y = min(max(rng.gauss(cy, spread), 0), height - 1)
+            targets.append({
+                'name': f"{country} {TARGET_TYPES[target_type]['name']} {i + 1}",
+                'type': target_type,
+                'x': int(x),
+                'y': int(y),
+            })
+        world[country] = targets
+
+    return world
+
+
+def world_size(world: Dict) -> int:
+    """Total number of targets in a world"""
+    return sum(len(targets) for targets in world.values())
+
+
+if __name__ == "__main__":
+    # Test world generation
+    from src.game_logic.target import create_targets_from_config
+
+    world = generate_world(10000, seed=42)
+    manager = create_targets_from_config(world)
+    print(f"Generated {world_size(world):,} targets: {manager}")
+    print(world['USA'][0])
+
+# Made with Bob
@@ -28,6 +28,16 @@ try:
     print("3. Testing missile types...")
     missile_types = create_missile_types_from_config(MISSILE_TYPES)
     print(f"   ✓ Created {len(missile_types)} missile types")
+    from src.game_logic.missile import Missile
+    eager = Missile(missile_types['ICBM'], (20, 15), (55, 10), "USA")
+    analytic = Missile(missile_types['ICBM'], (20, 15), (55, 10), "USA", analytic=True)
+    eager.launch()
+    analytic.launch()
+    while eager.update(0.05):
+        assert analytic.update(0.05) and analytic.get_position() == eager.get_position()
+    assert not analytic.update(0.05) and analytic.detonated
+    assert analytic.trajectory == eager.trajectory
+    print("   ✓ Analytic trajectory matches the precomputed one")
     
     # Test AI creation
     print("4. Testing AI creation...")
@@ -46,6 +56,15 @@ try:
     print("6. Testing player stats...")
     stats = engine.player.get_stats()
     print(f"   ✓ Player stats: {stats}")
+    from src.game_engine import Player
+    unbounded, capped = Player("FULL", "USA"), Player("CAPPED", "USA", history_limit=3)
+    for launch in range(10):
+        unbounded.launch_missile(launch)
+        capped.launch_missile(launch)
+    assert unbounded.missiles_launched == list(range(10))
+    assert list(capped.missiles_launched) == [7, 8, 9]
+    assert capped.get_stats()['missiles_launched'] == 10
+    print("   ✓ history_limit keeps the latest launches and the exact count")
     
     # Test AI analysis
     print("7. Testing AI situation analysis...")
@@ -56,6 +75,258 @@ try:
     )
     print(f"   ✓ AI analyzed situation: threat={situation['threat_level']:.2f}")
     
+    # Test vectorized missile fleet
+    print("8. Testing vectorized missile fleet...")
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("   - numpy not installed, skipped")
+    else:
+        from src.game_logic.missile import MissileManager
+        managers = [MissileManager(), MissileManager(vectorized=True)]
+        launched = []
+        for manager in managers:
+            missile = manager.create_missile(missile_types['ICBM'], (20, 15), (55, 10), "USA")
+            manager.launch_missile(missile)
+            launched.append(missile)
+        for _ in range(30):
+            for manager in managers:
+                manager.update_missiles(0.25)
+            assert launched[0].get_position() == launched[1].get_position()
+        assert managers[0].get_statistics() == managers[1].get_statistics()
+        print(f"   ✓ Fleet matches object backend: {managers[1].get_statistics()}")
+        
+        # Test columnar target table
+        print("9. Testing columnar target table...")
+        import random
+        columnar = create_targets_from_config(WORLD_TARGETS, columnar=True)
+        snapshot = columnar.snapshot()
+        for manager in (target_manager, columnar):
+            random.seed(7)
+            for target in manager.all_targets:
+                target.take_damage(5, 0.8)
+        assert target_manager.get_statistics() == columnar.get_statistics()
+        columnar.restore(snapshot)
+        assert columnar.get_statistics()['total_casualties'] == 0
+        destroyed = target_manager.get_statistics()['destroyed']
+        print(f"   ✓ Table matches object backend: {destroyed} destroyed")
+        
+        # Batch damage resolution: undefended targets and sure hits leave nothing to chance
+        from src.game_logic.target import Target, TargetManager
+        strikes = [(random.randrange(30), random.randint(1, 3)) for _ in range(60)]
+        looped, batched, table = (TargetManager(columnar=columnar)
+                                  for columnar in (False, False, True))
+        for manager in (looped, batched, table):
+            for i in range(30):
+                manager.add_target(('USA', 'USSR')[i % 2],
+                                   Target(f"S{i}", "CITY", i, i, 100000 * (i + 1), 10, 0.0))
+        results = [looped.all_targets[index].take_damage(warheads, 1.0)
+                   for index, warheads in strikes]
+        indexes, warheads = zip(*strikes)
+        for manager in (batched, table):
+            resolved = manager.resolve_impacts(indexes, warheads, [1.0] * len(strikes))
+            for name in ('hit', 'destroyed', 'casualties'):
+                assert resolved[name].tolist() == [result[name] for result in results]
+            assert manager.get_statistics() == looped.get_statistics()
+            assert ([(t.damage_level, t.hit_count) for t in manager.all_targets]
+                    == [(t.damage_level, t.hit_count) for t in looped.all_targets])
+        destroyed = looped.get_statistics()['destroyed']
+        print(f"   ✓ resolve_impacts matches take_damage: {destroyed} destroyed")
+        
+        # Test lazy region loading
+        print("10. Testing lazy region loading...")
+        lazy = create_targets_from_config(WORLD_TARGETS, lazy=True)
+        assert lazy.count_intact_targets('USSR') == len(WORLD_TARGETS['USSR'])
+        assert lazy.get_pending_countries() == ['USA', 'EUROPE', 'ASIA']
+        lazy.prefetch()
+        assert lazy.count_intact_targets() == len(target_manager.all_targets)
+        print(f"   ✓ Regions loaded on demand: {lazy}")
+        
+        # Binary scenario round trip
+        import os
+        import tempfile
+        from src.utils.scenario import write_scenario, load_scenario
+        from src.utils.world_generator import generate_world
+        scenario_world = generate_world(500, seed=3)
+        path = os.path.join(tempfile.mkdtemp(), 'world.scn')
+        assert write_scenario(path, scenario_world) == 500
+        
+        def fields(manager):
+            return [(country, t.name, t.target_type, t.x, t.y, t.population, t.strategic_value,
+                     t.defense_level)
+                    for country in ('USA', 'USSR') for t in manager.get_targets_by_country(country)]
+        
+        config = fields(create_targets_from_config(scenario_world))
+        for options in ({}, {'columnar': False}, {'lazy': True}):
+            assert fields(load_scenario(path, **options)) == config
+        os.remove(path)
+        print(f"   ✓ Scenario file round trip: {len(config)} targets")
+        
+        # Test headless simulation
+        print("11. Testing headless simulation...")
+        from src.simulation.headless import run_game
+        record = run_game(seed=3)
+        assert record == run_game(seed=3)
+        assert record['result'] in ('MAD', 'DEFEAT', 'VICTORY', 'PEACE', 'STALEMATE', 'TIMEOUT')
+        print(f"   ✓ Headless game: {record['result']} after {record['turns']} turns")
+        flown = run_game(seed=3, flight_tick=0.1)
+        assert flown == run_game(seed=3, flight_tick=0.1, skip_idle=False)
+        print(f"   ✓ Skipping to impacts replays the ticked game: {flown['result']}")
+        from src.simulation.batch import run_batch
+        summary = run_batch(20, workers=1, seed=1)
+        assert sum(stats['count'] for stats in summary['outcomes'].values()) == 20
+        print(f"   ✓ Batch of {summary['games']} games aggregated")
+        
+        # Test injectable RNG streams
+        print("12. Testing RNG streams...")
+        from src.utils.rng import BlockRandom
+        scalar, vector = BlockRandom(5, block_size=16), BlockRandom(5, block_size=16)
+        draws = [scalar.uniform(-10, 10) for _ in range(40)]
+        assert draws == vector.uniform_array(-10, 10, 40).tolist()
+        assert run_game(seed=9, block_rng=True) == run_game(seed=9, block_rng=True)
+        print("   ✓ Block-drawn stream matches scalar draws; seeded games replay")
+        
+        # Test batched lockstep engine
+        print("13. Testing batched engine...")
+        from src.simulation.batched_engine import BatchedGameEngine
+        batched = BatchedGameEngine(200, seed=4)
+        summary = batched.run()
+        assert summary['games'] == 200 and not batched.playing.any()
+        assert batched.records()[0]['result'] in summary['outcomes']
+        print(f"   ✓ {batched} finished: {summary['outcomes']['MAD']['count']} MAD")
+    
+    # Test fixed-timestep loop (on a simulated clock)
+    print("14. Testing real-time loop...")
+    from src.game_loop import FixedTimestepLoop
+    now = [0.0]
+    
+    def advance(seconds):
+        now[0] += seconds
+    
+    loop = FixedTimestepLoop(lambda dt: None, render=lambda alpha: None, tick_rate=20,
+                             frame_rate=10, clock=lambda: now[0], sleep=advance)
+    stats = loop.run(max_ticks=100)
+    assert stats['ticks'] == 100 and stats['frames'] == 50 and stats['dropped_ticks'] == 0
+    stall = FixedTimestepLoop(lambda dt: advance(0.5), tick_rate=20, clock=lambda: now[0],
+                              sleep=advance)
+    stats = stall.run(max_ticks=10)
+    assert stats['slow_ticks'] == 10 and stats['dropped_ticks'] > 0
+    print(f"   ✓ Steady {loop.ticks} ticks; {stats['dropped_ticks']} dropped behind slow updates")
+    
+    # Test launch-site distance rows
+    print("15. Testing launch-site distances...")
+    from src.game_logic.target import Target
+    site = target_manager.get_launch_site('USA')
+    row = target_manager.distances_from(site)
+    for index, target in enumerate(target_manager.all_targets):
+        assert abs(row[index] - site.distance_to(target)) < 1e-9
+    stray = Target("Stray", "CITY", 40, 12, 1000, 10, 0.1)
+    assert target_manager.distance(site, stray) == site.distance_to(stray)
+    assert engine.player_launch_missile('ICBM', stray)
+    print(f"   ✓ {len(row)} cached distances match; unmanaged targets measured directly")
+    
+    # Test indexed missile registry
+    print("16. Testing missile registry...")
+    from src.game_logic.missile import MissileManager
+    registry = MissileManager()
+    fired = [registry.create_missile(missile_types['SLBM'], (20, 15), (30 + i, 10), owner)
+             for i, owner in enumerate(("USA", "USSR", "USA"))]
+    for missile in fired:
+        registry.launch_missile(missile)
+    assert registry.get_missile(fired[1].missile_id) is fired[1]
+    assert registry.get_missiles_by_owner("USA") == [fired[0], fired[2]]
+    assert registry.intercept_missile(fired[0]) and not registry.intercept_missile(fired[0])
+    assert registry.get_active_missiles() == fired[1:]
+    assert registry.get_missiles_by_status('INTERCEPTED') == [fired[0]]
+    in_flight = registry.get_statistics()['in_flight']
+    print(f"   ✓ Lookups by id, owner and status: {in_flight} in flight")
+    
+    # Test proximity grid against a scan
+    print("17. Testing missile proximity grid...")
+    import random
+    rng = random.Random(2)
+    swarm = MissileManager(grid_cell_size=5)
+    swarm.launch_salvo(missile_types['CRUISE'], [(40, 15)],
+                       [(rng.randint(0, 80), rng.randint(0, 30)) for _ in range(300)], "USA")
+    swarm.update_missiles(20.0)
+    active = swarm.get_active_missiles()
+    for _ in range(50):
+        pos, radius = (rng.randint(0, 80), rng.randint(0, 30)), rng.choice((2, 5, 12))
+        scan = [m for m in active
+                if (m.current_pos[0] - pos[0]) ** 2 + (m.current_pos[1] - pos[1]) ** 2
+                <= radius * radius]
+        assert swarm.get_missiles_near_position(pos, radius) == scan
+    print(f"   ✓ Grid queries match a scan over {len(active)} missiles")
+    
+    # Test missile pooling
+    print("18. Testing missile pool...")
+    from src.game_logic.missile import MissilePool
+    pool = MissilePool()
+    churn = MissileManager(history_limit=5, pool=pool)
+    for i in range(40):
+        churn.launch_missile(churn.create_missile(missile_types['ICBM'], (20, 15),
+                                                  (55, 10 + i % 5), "USA"))
+        churn.update_missiles(100.0)
+    assert pool.created < 10 and pool.created + pool.reused == 40 and len(churn) == 5
+    assert len(pool) > 0  # The next missile comes off the free list
+    recycled = churn.create_missile(missile_types['SLBM'], (10, 5), (30, 20), "USSR")
+    fresh = Missile(missile_types['SLBM'], (10, 5), (30, 20), "USSR")
+    for missile in (recycled, fresh):
+        missile.launch()
+        missile.update(1.5)
+    assert recycled.get_info() == fresh.get_info()
+    assert recycled.get_position() == fresh.get_position()
+    print(f"   ✓ {pool}; recycled missiles fly like new ones")
+    
+    # Test compact __slots__ instances
+    print("19. Testing compact instances...")
+    import pickle
+    for instance in (fresh, target_manager.all_targets[0], engine.player, missile_types['ICBM']):
+        assert not hasattr(instance, '__dict__')
+        try:
+            instance.unexpected = True
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError(f"{type(instance).__name__} accepted a new attribute")
+    assert pickle.loads(pickle.dumps(missile_types['ICBM'])) == missile_types['ICBM']
+    print("   ✓ Missile, Target, Player and MissileType carry no __dict__")
+    
+    # Test running target aggregates against a recount
+    print("20. Testing target aggregates...")
+    world = create_targets_from_config(WORLD_TARGETS, rng=random.Random(4))
+    for target in world.all_targets[::2] + world.all_targets[::3]:
+        target.take_damage(10, 0.9)
+    for country in (None, 'USA', 'USSR'):
+        targets = world.get_targets_by_country(country) if country else world.all_targets
+        destroyed = sum(1 for t in targets if t.destroyed)
+        assert world.get_total_casualties(country) == sum(t.casualties for t in targets)
+        assert world.get_total_population(country) == sum(t.population for t in targets)
+        assert world.count_intact_targets(country) == len(targets) - destroyed
+        assert world.get_destruction_percentage(country) == destroyed / len(targets) * 100
+    print(f"   ✓ Counters match a recount: {world.get_statistics()['destroyed']} destroyed")
+    
+    # Test closed-form expected damage against sampled take_damage
+    print("21. Testing expected damage...")
+    rng = random.Random(6)
+    strikes = ((3, 0.7, 0.4, 0.2), (10, 0.85, 0.6, 0.5))
+    for warheads, accuracy, defense_level, damage_level in strikes:
+        def fresh_target():
+            target = Target("Sample", "CITY", 0, 0, 1000000, 50, defense_level)
+            target.damage_level = damage_level
+            return target
+        expected = fresh_target().expected_damage(warheads, accuracy)
+        trials = [fresh_target() for _ in range(5000)]
+        hits = sum(t.take_damage(warheads, accuracy, rng=rng)['hit'] for t in trials) / len(trials)
+        assert abs(hits - expected['hit_probability']) < 0.02
+        destroyed = sum(t.destroyed for t in trials) / len(trials)
+        assert abs(destroyed - expected['destroy_probability']) < 0.02
+        damage = sum(t.damage_level - damage_level for t in trials) / len(trials)
+        assert abs(damage - expected['expected_damage']) < 0.02
+        casualties = sum(t.casualties for t in trials) / len(trials)
+        assert abs(casualties / expected['expected_casualties'] - 1) < 0.03
+    print("   ✓ Expected damage matches 5000 sampled strikes")
+    
     print("\n✅ All tests passed! Game is ready to play.")
     print("\nRun the game with: python3 src/main.py")
     